@@ -0,0 +1,31 @@
+"""Build-time benchmark of the rule-based and matrix CNLS builders
+
+Usage:
+    python benchmarks/cnls_builder.py [n ...]
+"""
+# import dependencies
+import sys
+import time
+import numpy as np
+from pystoned import CNLS
+from pystoned.constant import BLD_RULE, BLD_MATRIX
+
+
+def build_time(y, x, builder):
+    """Return the seconds spent on constructing the CNLS model"""
+    t0 = time.perf_counter()
+    CNLS.CNLS(y, x, builder=builder)
+    return time.perf_counter() - t0
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 500, 1000, 2000]
+    rng = np.random.default_rng(0)
+    print("{:>6} {:>12} {:>12} {:>9}".format("n", "rule (s)", "matrix (s)", "speedup"))
+    for n in sizes:
+        x = rng.uniform(1, 10, (n, 3))
+        y = np.prod(x ** (1 / 4), axis=1) - np.abs(rng.normal(0, 0.7, n))
+        matrix_time = build_time(y, x, BLD_MATRIX)
+        rule_time = build_time(y, x, BLD_RULE)
+        print("{:>6} {:>12.3f} {:>12.3f} {:>8.1f}x".format(
+            n, rule_time, matrix_time, rule_time / matrix_time), flush=True)
@@ -0,0 +1,45 @@
+"""Accuracy and time of the built-in solver against an external solver
+
+Usage:
+    python benchmarks/native_solver.py [solver] [n ...]
+"""
+# import dependencies
+import io
+import sys
+import time
+import contextlib
+import numpy as np
+from pystoned import CNLS, CQER
+from pystoned.constant import FUN_PROD, FUN_COST, OPT_NATIVE
+
+MODELS = {
+    "CNLS": lambda y, x: CNLS.CNLS(y, x, fun=FUN_PROD),
+    "CNLS cost": lambda y, x: CNLS.CNLS(y, x, fun=FUN_COST),
+    "CQR": lambda y, x: CQER.CQR(y, x, tau=0.5),
+    "CER": lambda y, x: CQER.CER(y, x, tau=0.5),
+}
+
+
+def solve(model, solver):
+    """Return the seconds spent on the optimization and the estimated frontier"""
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.optimize(solver=solver)
+    return time.perf_counter() - t0, model.get_frontier()
+
+
+if __name__ == '__main__':
+    solver = sys.argv[1] if len(sys.argv) > 1 else "mosek"
+    sizes = [int(n) for n in sys.argv[2:]] or [50, 100, 200]
+    rng = np.random.default_rng(0)
+    print("{:>10} {:>6} {:>12} {:>12} {:>10}".format(
+        "model", "n", "native (s)", solver + " (s)", "max diff"))
+    for n in sizes:
+        x = rng.uniform(1, 10, (n, 3))
+        y = np.prod(x ** (1 / 4), axis=1) - np.abs(rng.normal(0, 0.7, n))
+        for name, model in MODELS.items():
+            native_time, native_frontier = solve(model(y, x), OPT_NATIVE)
+            solver_time, solver_frontier = solve(model(y, x), solver)
+            print("{:>10} {:>6} {:>12.3f} {:>12.3f} {:>10.1e}".format(
+                name, n, native_time, solver_time,
+                np.max(np.abs(native_frontier - solver_frontier))), flush=True)
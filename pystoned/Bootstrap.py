@@ -0,0 +1,105 @@
+# import dependencies
+import numpy as np
+from .utils import tools, resampling
+from .constant import RED_MOM, BTS_RESIDUAL, BTS_PAIRS, OPT_DEFAULT, OPT_LOCAL
+
+
+class Bootstrap:
+    """Bootstrap confidence intervals of the CNLS frontier and of the StoNED estimates
+    """
+
+    def __init__(self, model, resampling=BTS_RESIDUAL, replicates=200, seed=None, method=RED_MOM, bandwidth=None,
+                 grid_size=4096):
+        """Bootstrap
+
+        Args:
+            model: The fitted CNLS-family model to resample, with a single output.
+            resampling (String, optional): BTS_RESIDUAL (resample the residuals around the fitted frontier) or BTS_PAIRS (resample the DMUs with all their data). Defaults to BTS_RESIDUAL.
+            replicates (int, optional): number of bootstrap replicates. Defaults to 200.
+            seed (int, optional): seed of the random number generator drawing the replicates. Defaults to None.
+            method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation) or RED_KDE (Kernel deconvolution estimation) for the StoNED estimates. Defaults to RED_MOM.
+            bandwidth (float, optional): bandwidth of the kernel density with RED_KDE. Defaults to None, the rule-of-thumb bandwidth of Silverman (1986).
+            grid_size (int, optional): number of grid points of the binned kernel density with RED_KDE, or None to evaluate the density at every residual exactly. Defaults to 4096.
+        """
+        tools.assert_optimized(model.optimization_status)
+        if np.ndim(model.y) != 1:
+            raise ValueError(
+                "The bootstrap only supports models with a single output.")
+        if resampling not in (BTS_RESIDUAL, BTS_PAIRS):
+            raise ValueError("Undefined bootstrap resampling.")
+        self.model, self.resampling, self.replicates, self.method = model, resampling, replicates, method
+        self.bandwidth, self.grid_size = bandwidth, grid_size
+        self.__arguments = tools.model_arguments(model)
+
+        # the replicates are drawn up front, so that they do not depend on the processes
+        n = len(model.y)
+        self.draws = np.random.default_rng(seed).integers(n, size=(replicates, n))
+
+        self.optimization_status = 0
+
+    def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1, warm_start=False):
+        """Estimate the model on each bootstrap replicate
+
+        Each replicate is estimated from scratch, so that the intervals do not depend on
+        processes. Under BTS_RESIDUAL, the inputs stay the same, so that with warm_start each
+        worker process refits a single model on the outputs of its replicates instead, if the
+        model supports it. Each solve then starts from the previous replicate of the worker,
+        and the intervals depend on processes up to the solver tolerance.
+
+        Args:
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+            processes (int, optional): number of worker processes sharing the replicates. Defaults to 1.
+            warm_start (bool, optional): whether to refit a single model per worker process under BTS_RESIDUAL. Defaults to False.
+        """
+        if self.resampling == BTS_RESIDUAL:
+            residual = self.model.get_residual()
+            data = (self.model.y, residual, self.draws)
+        else:
+            data = (None, None, self.draws)
+
+        self.frontier, self.technical_inefficiency, self.stoned = resampling.estimate(
+            type(self.model), self.__arguments, self.resampling, self.method, *data, email, solver, processes,
+            warm_start, self.bandwidth, self.grid_size)
+        self.optimization_status = 1
+
+    def display_status(self):
+        """Display the status of problem"""
+        print(self.optimization_status)
+
+    def get_status(self):
+        """Return status"""
+        return self.optimization_status
+
+    def get_frontier(self, alpha=0.05):
+        """Return the percentile interval of the estimated frontier of each DMU
+
+        Args:
+            alpha (float, optional): the interval covers 1 - alpha of the replicates. Defaults to 0.05.
+        """
+        tools.assert_optimized(self.optimization_status)
+        return self.__interval(self.frontier, alpha)
+
+    def get_technical_inefficiency(self, alpha=0.05):
+        """Return the percentile interval of the StoNED technical efficiency of each DMU
+
+        Args:
+            alpha (float, optional): the interval covers 1 - alpha of the replicates. Defaults to 0.05.
+        """
+        tools.assert_optimized(self.optimization_status)
+        return self.__interval(self.technical_inefficiency, alpha)
+
+    def get_stoned(self, alpha=0.05):
+        """Return the percentile interval of the StoNED frontier of each DMU
+
+        Args:
+            alpha (float, optional): the interval covers 1 - alpha of the replicates. Defaults to 0.05.
+        """
+        tools.assert_optimized(self.optimization_status)
+        return self.__interval(self.stoned, alpha)
+
+    def __interval(self, values, alpha):
+        """Return the lower and upper percentiles of the replicated values of each DMU"""
+        lower, upper = np.nanpercentile(values, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+        return lower, upper
+
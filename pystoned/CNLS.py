@@ -1,18 +1,17 @@
 # import dependencies
-from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
+from pyomo.environ import ConcreteModel, Set, Var, Param, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
 import numpy as np
-import pandas as pd
 
-from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_LOCAL
-from .utils import tools, interpolation
+from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_LOCAL, BLD_RULE, BLD_MATRIX, BLD_UNIVARIATE, BLD_AUTO
+from .utils import tools, interpolation, matrix, univariate
 
 
 class CNLS:
     """Convex Nonparametric Least Square (CNLS)
     """
 
-    def __init__(self, y, x, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS):
+    def __init__(self, y, x, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS, builder=BLD_AUTO):
         """CNLS model
 
         Args:
@@ -22,11 +21,15 @@ class CNLS:
             cet (String, optional): CET_ADDI (additive composite error term) or CET_MULT (multiplicative composite error term). Defaults to CET_ADDI.
             fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+            builder (String, optional): BLD_AUTO (BLD_UNIVARIATE for the additive model with a single input and no contextual variable, BLD_RULE otherwise), BLD_RULE (rule-based Pyomo constraints), BLD_MATRIX (sparse coefficient matrices handed to the solver in bulk) or BLD_UNIVARIATE (exact univariate engine without a solver). Defaults to BLD_AUTO.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
         self.y, self.x, self.z = tools.assert_valid_basic_data(y, x, z)
 
-        self.cet, self.fun, self.rts = cet, fun, rts
+        self.cet, self.fun, self.rts, self.builder = cet, fun, rts, builder
+        if self.builder == BLD_AUTO:
+            self.builder = BLD_UNIVARIATE if self.cet == CET_ADDI and univariate.is_univariate(
+                self.x, self.z, self.rts) else BLD_RULE
 
         # Initialize the CNLS model
         self.__model__ = ConcreteModel()
@@ -53,24 +56,42 @@ class CNLS:
                                       bounds=(0.0, None),
                                       doc='estimated frontier')
 
-        # Setup the objective function and constraints
-        self.__model__.objective = Objective(rule=self.__objective_rule(),
-                                             sense=minimize,
-                                             doc='objective function')
-        self.__model__.regression_rule = Constraint(self.__model__.I,
-                                                    rule=self.__regression_rule(),
-                                                    doc='regression equation')
-        if self.cet == CET_MULT:
-            self.__model__.log_rule = Constraint(self.__model__.I,
-                                                 rule=self.__log_rule(),
-                                                 doc='log-transformed regression equation')
-        self.__model__.afriat_rule = Constraint(self.__model__.I,
-                                                self.__model__.I,
-                                                rule=self.__afriat_rule(),
-                                                doc='afriat inequality')
+        if self.builder == BLD_UNIVARIATE:
+            if self.cet != CET_ADDI or not univariate.is_univariate(self.x, self.z, self.rts):
+                raise ValueError(
+                    "The univariate engine only supports the additive model with a single input.")
+        elif self.builder == BLD_MATRIX:
+            if self.cet != CET_ADDI:
+                raise ValueError(
+                    "The matrix builder only supports the additive model.")
+            # Setup the objective function and constraints as sparse matrices
+            self.__program = matrix.cnls_program(
+                self.y, self.x, self.z, self.fun, self.rts)
+        elif self.builder == BLD_RULE:
+            # Keep the output values mutable, so that refit does not rebuild the model
+            self.__model__.y = Param(self.__model__.I,
+                                     initialize=dict(enumerate(self.y.tolist())),
+                                     mutable=True,
+                                     doc='output variable')
+
+            # Setup the objective function and constraints
+            self.__model__.objective = Objective(rule=self.__objective_rule(),
+                                                 sense=minimize,
+                                                 doc='objective function')
+            self.__model__.regression_rule = Constraint(self.__model__.I,
+                                                        rule=self.__regression_rule(),
+                                                        doc='regression equation')
+            if self.cet == CET_MULT:
+                self.__model__.log_rule = Constraint(self.__model__.I,
+                                                     rule=self.__log_rule(),
+                                                     doc='log-transformed regression equation')
+            self._shape_constraints()
+        else:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
+        self.__persistent = None
 
     def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT):
         """Optimize the function by requested method
@@ -80,9 +101,117 @@ class CNLS:
             solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
         """
         # TODO(error/warning handling): Check problem status after optimization
+        if self.builder == BLD_UNIVARIATE:
+            univariate.announce(email, solver)
+            alpha, beta, residual = univariate.cnls(
+                self.y, self.x, self.fun, self.rts)
+            if self.rts == RTS_VRS:
+                matrix.load_values(self.__model__.alpha, alpha)
+            matrix.load_values(self.__model__.beta, beta)
+            matrix.load_values(self.__model__.epsilon, residual)
+            self.problem_status, self.optimization_status = "optimal", 1
+            return
+        if self.builder == BLD_MATRIX:
+            solution, self.problem_status = self.__program.solve(email, solver)
+            self.__load_solution(solution)
+            self.optimization_status = 1 if self.problem_status == "optimal" else 0
+            return
         self.problem_status, self.optimization_status = tools.optimize_model(
             self.__model__, email, self.cet, solver)
 
+    def refit(self, y=None, email=OPT_LOCAL, solver=OPT_DEFAULT):
+        """Optimize the model again for new values of the output variable
+
+        The model is not rebuilt. With BLD_RULE, the outputs are mutable parameters of the
+        regression equation, and the model stays in a persistent solver interface between
+        the refits if the solver has one, so that only the regression equation is handed
+        over again and the solver starts from its previous state.
+
+        Args:
+            y (float, optional): output variable, one value per DMU. Defaults to None, which keeps the outputs.
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        """
+        self.__resolve(self.__update_outputs(y), False, email, solver)
+
+    def __update_outputs(self, y):
+        """Set the output values and return the constraints depending on them"""
+        if not hasattr(self, 'builder'):
+            raise ValueError(
+                "The model does not support refitting with new outputs.")
+        if y is None:
+            return []
+        y = tools.to_1d_array(y)
+        if y.shape != self.y.shape:
+            raise ValueError(
+                "Number of DMUs must be the same in x and y.")
+        self.y = y
+        if self.builder == BLD_MATRIX:
+            self.__program.lb[:len(y)] = y
+            self.__program.ub[:len(y)] = y
+        elif self.builder == BLD_RULE:
+            self.__model__.y.store_values(dict(enumerate(y.tolist())))
+            return list(self.__model__.regression_rule.values())
+        return []
+
+    def __resolve(self, constraints, objective, email, solver):
+        """Optimize the model again after the given constraints, or the objective, changed"""
+        if self.builder != BLD_RULE:
+            self.optimize(email, solver)
+            return
+        instance = None
+        if self.__persistent is not None and self.__persistent[:2] == (email, solver):
+            instance = self.__persistent[2]
+        objective = next(self.__model__.component_data_objects(Objective, active=True)) if objective else None
+        self.problem_status, self.optimization_status, instance = tools.optimize_model_persistent(
+            self.__model__, email, self.cet, solver, instance, changed=constraints,
+            objective=objective)
+        self.__persistent = None if instance is None else (email, solver, instance)
+
+    def __path(self, settings, fold_model, folds, seed, email, solver):
+        """Refit the model for each setting in turn, and cross validate the sequence
+
+        Returns:
+            tuple: alpha (None under RTS_CRS), beta and residual, stacked by setting, and the mean squared prediction error of each setting over the folds (None without folds).
+        """
+        alpha, beta, residual = [], [], []
+        for setting in settings:
+            self.refit(**setting, email=email, solver=solver)
+            if self.rts == RTS_VRS:
+                alpha.append(self.get_alpha())
+            beta.append(self.get_beta())
+            residual.append(self.get_residual())
+
+        error = None
+        if folds is not None:
+            if type(self.z) != type(None):
+                raise ValueError(
+                    "The cross validation does not support contextual variables.")
+            fold = np.random.default_rng(seed).permutation(len(self.y)) % folds
+            error = np.zeros(len(settings))
+            for k in range(folds):
+                model = fold_model(fold != k)
+                for s, setting in enumerate(settings):
+                    model.refit(**setting, email=email, solver=solver)
+                    # the fitted hyperplanes, unpruned, as the model is refitted for each setting
+                    beta_fold = model.get_beta()
+                    alpha_fold = model.get_alpha() if self.rts == RTS_VRS else np.zeros(len(beta_fold))
+                    predict = interpolation.interpolation(alpha_fold, beta_fold, self.x[fold == k], fun=self.fun)
+                    error[s] += np.sum((self.y[fold == k] - np.ravel(predict)) ** 2)
+            error /= len(self.y)
+
+        return np.array(alpha) if self.rts == RTS_VRS else None, np.array(beta), np.array(residual), error
+
+    def __load_solution(self, solution):
+        """Load the solution of the sparse program into the model variables"""
+        n, d = len(self.y), len(self.x[0])
+        if self.rts == RTS_VRS:
+            matrix.load_values(self.__model__.alpha, solution[:n])
+        matrix.load_values(self.__model__.beta, solution[n:n * (d + 1)])
+        matrix.load_values(self.__model__.epsilon, solution[n * (d + 1):n * (d + 2)])
+        if type(self.z) != type(None):
+            matrix.load_values(self.__model__.lamda, solution[n * (d + 2):])
+
     def __objective_rule(self):
         """Return the proper objective function"""
 
@@ -97,30 +226,30 @@ class CNLS:
             if self.rts == RTS_VRS:
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
-                        return self.y[i] == model.alpha[i] \
-                            + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.lamda[k] * self.z[i][k]
+                        return model.y[i] == model.alpha[i] \
+                            + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.lamda[k] * self.z[i, k]
                                   for k in model.K) + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
-                    return self.y[i] == model.alpha[i] \
-                        + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    return model.y[i] == model.alpha[i] \
+                        + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
-                        return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.lamda[k] * self.z[i][k]
+                        return model.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.lamda[k] * self.z[i, k]
                                   for k in model.K) + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    return model.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
@@ -128,14 +257,14 @@ class CNLS:
         elif self.cet == CET_MULT:
             if type(self.z) != type(None):
                 def regression_rule(model, i):
-                    return log(self.y[i]) == log(model.frontier[i] + 1) \
-                        + sum(model.lamda[k] * self.z[i][k]
+                    return log(model.y[i]) == log(model.frontier[i] + 1) \
+                        + sum(model.lamda[k] * self.z[i, k]
                               for k in model.K) + model.epsilon[i]
 
                 return regression_rule
 
             def regression_rule(model, i):
-                return log(self.y[i]) == log(model.frontier[i] + 1) + model.epsilon[i]
+                return log(model.y[i]) == log(model.frontier[i] + 1) + model.epsilon[i]
 
             return regression_rule
 
@@ -148,19 +277,30 @@ class CNLS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
             elif self.rts == RTS_CRS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
 
         raise ValueError("Undefined model parameters.")
 
+    def _shape_constraints(self):
+        """Add the afriat inequality on every pair of observations
+
+        Subclasses that impose the shape on fewer pairs override this, so that the dense
+        family is never built.
+        """
+        self.__model__.afriat_rule = Constraint(self.__model__.I,
+                                                self.__model__.I,
+                                                rule=self.__afriat_rule(),
+                                                doc='afriat inequality')
+
     def __afriat_rule(self):
         """Return the proper afriat inequality constraint"""
         if self.fun == FUN_PROD:
@@ -175,9 +315,9 @@ class CNLS:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
-                        model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
+                        model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
                                              for j in model.J))
 
                 return afriat_rule
@@ -187,8 +327,8 @@ class CNLS:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[h, j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
         elif self.cet == CET_MULT:
@@ -198,9 +338,9 @@ class CNLS:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
-                        model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
+                        model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
                                              for j in model.J))
 
                 return afriat_rule
@@ -210,8 +350,8 @@ class CNLS:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[h, j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
 
@@ -252,38 +392,31 @@ class CNLS:
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale(self.rts)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_residual(self):
         """Return residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual = list(self.__model__.epsilon[:].value)
-        return np.asarray(residual)
+        return tools.get_values(self.__model__.epsilon)
 
     def get_lamda(self):
         """Return lamda value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_contextual_variable(self.z)
-        lamda = list(self.__model__.lamda[:].value)
-        return np.asarray(lamda)
+        return tools.get_values(self.__model__.lamda)
 
     def get_frontier(self):
         """Return estimated frontier value by array"""
         tools.assert_optimized(self.optimization_status)
         if self.cet == CET_MULT and type(self.z) == type(None):
-            frontier = np.asarray(list(self.__model__.frontier[:].value))+1
+            frontier = tools.get_values(self.__model__.frontier)+1
         elif self.cet == CET_MULT and type(self.z) != type(None):
-            frontier = np.multiply( (np.asarray(list(self.__model__.frontier[:].value))+1), 
+            frontier = np.multiply( (tools.get_values(self.__model__.frontier)+1), 
                                    np.exp(np.dot(np.asarray(self.z), self.get_lamda())) )
         elif self.cet == CET_ADDI:
             frontier = np.asarray(self.y) - self.get_residual()
@@ -306,4 +439,7 @@ class CNLS:
             alpha,  beta = self.get_alpha(), self.get_beta()
         elif self.rts == RTS_CRS:
             alpha, beta = np.zeros((self.get_beta()).shape[0]), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
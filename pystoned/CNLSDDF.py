@@ -1,8 +1,6 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint
 from pyomo.core.expr.numvalue import NumericValue
-import pandas as pd
-import numpy as np
 
 from . import CNLS
 from .constant import CET_ADDI, FUN_COST, FUN_PROD, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
@@ -84,18 +82,18 @@ class CNLSDDF(CNLS.CNLS):
         """Return the proper regression constraint"""
         if type(self.b) == type(None):
             def regression_rule(model, i):
-                return sum(model.gamma[i, q] * self.y[i][q] for q in model.Q) \
+                return sum(model.gamma[i, q] * self.y[i, q] for q in model.Q) \
                     == model.alpha[i] \
-                    + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                     - model.epsilon[i]
 
             return regression_rule
 
         def regression_rule(model, i):
-            return sum(model.gamma[i, q] * self.y[i][q] for q in model.Q) \
+            return sum(model.gamma[i, q] * self.y[i, q] for q in model.Q) \
                 == model.alpha[i] \
-                + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
+                + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
                 - model.epsilon[i]
 
         return regression_rule
@@ -128,14 +126,14 @@ class CNLSDDF(CNLS.CNLS):
                 if i == h:
                     return Constraint.Skip
                 return __operator(model.alpha[i]
-                                  + sum(model.beta[i, j] * self.x[i][j]
+                                  + sum(model.beta[i, j] * self.x[i, j]
                                         for j in model.J)
-                                  - sum(model.gamma[i, q] * self.y[i][q]
+                                  - sum(model.gamma[i, q] * self.y[i, q]
                                         for q in model.Q),
                                   model.alpha[h]
-                                  + sum(model.beta[h, j] * self.x[i][j]
+                                  + sum(model.beta[h, j] * self.x[i, j]
                                         for j in model.J)
-                                  - sum(model.gamma[h, q] * self.y[i][q] for q in model.Q))
+                                  - sum(model.gamma[h, q] * self.y[i, q] for q in model.Q))
 
             return afriat_rule
 
@@ -144,11 +142,11 @@ class CNLSDDF(CNLS.CNLS):
                 return Constraint.Skip
             return __operator(model.epsilon[i],
                               model.alpha[h]
-                              + sum(model.beta[h, j] * self.x[i][j]
+                              + sum(model.beta[h, j] * self.x[i, j]
                                     for j in model.J)
-                              + sum(model.delta[h, l] * self.b[i][l]
+                              + sum(model.delta[h, l] * self.b[i, l]
                                     for l in model.L)
-                              - sum(model.gamma[h, q] * self.y[i][q] for q in model.Q))
+                              - sum(model.gamma[h, q] * self.y[i, q] for q in model.Q))
 
         return afriat_rule
 
@@ -166,18 +164,10 @@ class CNLSDDF(CNLS.CNLS):
     def get_gamma(self):
         """Return gamma value by array"""
         tools.assert_optimized(self.optimization_status)
-        gamma = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.gamma),
-                                                           list(self.__model__.gamma[:, :].value))])
-        gamma = pd.DataFrame(gamma, columns=['Name', 'Key', 'Value'])
-        gamma = gamma.pivot(index='Name', columns='Key', values='Value')
-        return gamma.to_numpy()
+        return tools.get_values(self.__model__.gamma)
 
     def get_delta(self):
         """Return delta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_undesirable_output(self.b)
-        delta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.delta),
-                                                           list(self.__model__.delta[:, :].value))])
-        delta = pd.DataFrame(delta, columns=['Name', 'Key', 'Value'])
-        delta = delta.pivot(index='Name', columns='Key', values='Value')
-        return delta.to_numpy()
+        return tools.get_values(self.__model__.delta)
@@ -1,8 +1,8 @@
 # import dependencies
 import numpy as np
-import pandas as pd
-from .utils import CNLSG1, CNLSG2, CNLSZG1, CNLSZG2, sweet, tools, interpolation
-from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
+from scipy import sparse
+from .utils import CNLSG1, CNLSZG1, sweet, tools, interpolation, violation
+from .constant import CET_ADDI, CET_MULT, FUN_PROD, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
 import time
 
 
@@ -27,16 +27,24 @@ class CNLSG:
         self.cet, self.fun, self.rts = cet, fun, rts
 
         # active (added) violated concavity constraint by iterative procedure
-        self.active = np.zeros((len(x), len(x)))
-        # violated concavity constraint
-        self.active2 = np.zeros((len(x), len(x)))
+        self.active = sparse.csr_matrix((len(self.y), len(self.y)))
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
 
-    def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT):
-        """Optimize the function by requested method"""
+    def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT, cuts=1, budget=None, tol=0.0001):
+        """Optimize the function by requested method
+
+        Args:
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+            cuts (int, optional): number of the most violated constraints added for each observation per round. Defaults to 1.
+            budget (int, optional): maximal number of violated constraints added per round. Defaults to None.
+            tol (float, optional): convergence tolerance of the maximal violation. Defaults to 0.0001.
+        """
         # TODO(error/warning handling): Check problem status after optimization
+        if cuts < 1 or (budget is not None and budget < 1):
+            raise ValueError("The cuts and the budget must select at least one constraint.")
         self.t0 = time.time()
         if type(self.z) != type(None):
             model1 = CNLSZG1.CNLSZG1(
@@ -50,72 +58,47 @@ class CNLSG:
         self.__model__ = model1.__model__
 
         self.count = 0
-        while self.__convergence_test(self.alpha, self.beta) > 0.0001:
-            if type(self.z) != type(None):
-                model2 = CNLSZG2.CNLSZG2(
-                    self.y, self.x, self.z, self.active, self.cutactive, self.cet, self.fun, self.rts)
-            else:
-                model2 = CNLSG2.CNLSG2(
-                    self.y, self.x, self.active, self.cutactive, self.cet, self.fun, self.rts)
-            model2.optimize(email, solver)
-            self.alpha = model2.get_alpha()
-            self.beta = model2.get_beta()
+        self.__blocks, self.__totalconstr, self.__runningtime = [], [], []
+        convergence = self.__convergence_test(
+            self.alpha, self.beta, cuts, budget)
+        self.__record_round(self.t0)
+        while convergence > tol:
+            t1 = time.time()
+            # keep the model alive and only add the newly violated constraints
+            model1.add_violated(self.active)
+            model1.optimize(email, solver)
+            self.alpha = model1.get_alpha()
+            self.beta = model1.get_beta()
+            convergence = self.__convergence_test(
+                self.alpha, self.beta, cuts, budget)
             # TODO: Replace print with log system
-            print("Genetic Algorithm Convergence : %8f" %
-                  (self.__convergence_test(self.alpha, self.beta)))
-            self.__model__ = model2.__model__
+            print("Genetic Algorithm Convergence : %8f" % convergence)
             self.count += 1
+            self.__record_round(t1)
         self.optimization_status = 1
         self.tt = time.time() - self.t0
 
-    def __convergence_test(self, alpha, beta):
-        x = np.asarray(self.x)
-        activetmp1 = 0.0
-
-        # go into the loop
-        for i in range(len(x)):
-            activetmp = 0.0
-            # go into the sub-loop and find the violated concavity constraints
-            for j in range(len(x)):
-                if self.cet == CET_ADDI:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) \
-                                - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) \
-                                + np.sum(beta[j, :] * x[i, :])
-                if self.cet == CET_MULT:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) - \
-                                np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) + \
-                                np.sum(beta[j, :] * x[i, :])
-                if self.active2[i, j] > activetmp:
-                    activetmp = self.active2[i, j]
-            # find the maximal violated constraint in sub-loop and added into the active matrix
-            for j in range(len(x)):
-                if self.active2[i, j] >= activetmp and activetmp > 0:
-                    self.active[i, j] = 1
-            if activetmp > activetmp1:
-                activetmp1 = activetmp
-        return activetmp
+    def __convergence_test(self, alpha, beta, cuts=1, budget=None):
+        maximum, i, h = violation.violated_constraints(
+            alpha, beta, self.x, self.fun, self.rts, cuts, budget)
+        # add the selected violated constraints into the active matrix
+        selected = sparse.csr_matrix(
+            (np.ones(len(i)), (i, h)), shape=self.active.shape)
+        self.__added = selected.nnz - selected.multiply(self.active).nnz
+        self.active = self.active.maximum(selected)
+        return maximum
+
+    def __record_round(self, t):
+        """Record the statistics of the round started at time t"""
+        self.__blocks.append(self.__added)
+        self.__totalconstr.append(self.__count_constraints())
+        self.__runningtime.append(time.time() - t)
+
+    def __count_constraints(self):
+        """Return the number of the constraints in the current model"""
+        activeconstr = self.active.sum() - self.active.diagonal().sum()
+        cutactiveconstr = self.cutactive.sum() - self.cutactive.diagonal().sum()
+        return activeconstr + cutactiveconstr + 2 * self.active.shape[0] + 1
 
     def display_status(self):
         """Display the status of problem"""
@@ -151,59 +134,67 @@ class CNLSG:
         """Return alpha value by array"""
         tools.assert_optimized(self)
         tools.assert_various_return_to_scale(self.rts)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_residual(self):
         """Return residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual = list(self.__model__.epsilon[:].value)
-        return np.asarray(residual)
+        return tools.get_values(self.__model__.epsilon)
 
     def get_lamda(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_contextual_variable(self.z)
-        lamda = list(self.__model__.lamda[:].value)
-        return np.asarray(lamda)
+        return tools.get_values(self.__model__.lamda)
  
     def get_frontier(self):
         """Return estimated frontier value by array"""
         tools.assert_optimized(self.optimization_status)
         if self.cet == CET_MULT and type(self.z) == type(None):
-            frontier = np.asarray(list(self.__model__.frontier[:].value))+1
+            frontier = tools.get_values(self.__model__.frontier)+1
         elif self.cet == CET_MULT and type(self.z) != type(None):
-            frontier = np.multiply( (np.asarray(list(self.__model__.frontier[:].value))+1), 
+            frontier = np.multiply( (tools.get_values(self.__model__.frontier)+1), 
                                    np.exp(np.dot(np.asarray(self.z), self.get_lamda())) )
         elif self.cet == CET_ADDI:
             frontier = np.asarray(self.y) - self.get_residual()
         return np.asarray(frontier)    
 
-    def get_totalconstr(self):
-        """Return the number of total constraints"""
+    def get_totalconstr(self, by_round=False):
+        """Return the number of total constraints
+
+        Args:
+            by_round (bool, optional): return the number after each round, starting with the initial model. Defaults to False.
+        """
         tools.assert_optimized(self.optimization_status)
-        activeconstr = np.sum(self.active) - np.trace(self.active)
-        cutactiveconstr = np.sum(self.cutactive) - np.trace(self.cutactive)
-        totalconstr = activeconstr + cutactiveconstr + 2 * len(self.active) + 1
-        return totalconstr
+        if by_round:
+            return np.asarray(self.__totalconstr)
+        return self.__count_constraints()
 
-    def get_runningtime(self):
-        """Return the running time"""
+    def get_runningtime(self, by_round=False):
+        """Return the running time
+
+        Args:
+            by_round (bool, optional): return the running time of each round, starting with the initial model. Defaults to False.
+        """
         tools.assert_optimized(self.optimization_status)
+        if by_round:
+            return np.asarray(self.__runningtime)
         return self.tt
 
-    def get_blocks(self):
-        """Return the number of blocks"""
+    def get_blocks(self, by_round=False):
+        """Return the number of blocks
+
+        Args:
+            by_round (bool, optional): return the number of violated constraints found in each round, starting with the initial model. Defaults to False.
+        """
         tools.assert_optimized(self.optimization_status)
+        if by_round:
+            return np.asarray(self.__blocks)
         return self.count
 
     def get_predict(self, x_test):
@@ -213,4 +204,7 @@ class CNLSG:
             alpha,  beta = self.get_alpha(), self.get_beta()
         elif self.rts == RTS_CRS:
             alpha, beta = np.zeros((self.get_beta()).shape[0]), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
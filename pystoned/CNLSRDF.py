@@ -2,7 +2,6 @@
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
 import numpy as np
-import pandas as pd
 
 from . import CNLS
 from .constant import CET_MULT, RDF_DI, RDF_DO, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_LOCAL
@@ -29,14 +28,10 @@ class CNLSRDF(CNLS.CNLS):
 
         # rescale the input/output variables
         if self.rdf == RDF_DI:
-            self.X = np.array(self.x)
-            self.X = np.cumprod(self.X**(1/self.X.shape[1]), axis=1)[:, -1]
-            self.X = tools.to_1d_list(tools.trans_list(self.X))
+            self.X = np.cumprod(self.x**(1/self.x.shape[1]), axis=1)[:, -1]
 
         elif self.rdf == RDF_DO:
-            self.Y = np.array(self.y)
-            self.Y = np.cumprod(self.Y**(1/self.Y.shape[1]), axis=1)[:, -1]
-            self.Y = tools.to_1d_list(tools.trans_list(self.Y))
+            self.Y = np.cumprod(self.y**(1/self.y.shape[1]), axis=1)[:, -1]
 
         # Initialize the CNLS model
         self.__model__ = ConcreteModel()
@@ -111,18 +106,18 @@ class CNLSRDF(CNLS.CNLS):
 
             if type(self.z) != type(None):
                 def regression_rule(model, i):
-                    return log(self.x[i][0]) == -log(model.chi[i] + 1) + sum(model.kappa[j] *
+                    return log(self.x[i, 0]) == -log(model.chi[i] + 1) + sum(model.kappa[j] *
                                                                              (log(
-                                                                                 self.x[i][0]) - log(self.x[i][j]))
-                                                                             for j in model.JJ) + sum(model.lamda[k] * self.z[i][k]
+                                                                                 self.x[i, 0]) - log(self.x[i, j]))
+                                                                             for j in model.JJ) + sum(model.lamda[k] * self.z[i, k]
                                                                                                       for k in model.K) + model.epsilon[i]
 
                 return regression_rule
 
             def regression_rule(model, i):
-                return log(self.x[i][0]) == -log(model.chi[i] + 1) + sum(model.kappa[j] *
+                return log(self.x[i, 0]) == -log(model.chi[i] + 1) + sum(model.kappa[j] *
                                                                          (log(
-                                                                             self.x[i][0]) - log(self.x[i][j]))
+                                                                             self.x[i, 0]) - log(self.x[i, j]))
                                                                          for j in model.JJ) + model.epsilon[i]
 
             return regression_rule
@@ -130,18 +125,18 @@ class CNLSRDF(CNLS.CNLS):
 
             if type(self.z) != type(None):
                 def regression_rule(model, i):
-                    return log(self.y[i][0]) == -log(model.chi[i] + 1) + sum(model.kappa[q] *
+                    return log(self.y[i, 0]) == -log(model.chi[i] + 1) + sum(model.kappa[q] *
                                                                              (log(
-                                                                                 self.y[i][0]) - log(self.y[i][q]))
-                                                                             for q in model.QQ) + sum(model.lamda[k] * self.z[i][k]
+                                                                                 self.y[i, 0]) - log(self.y[i, q]))
+                                                                             for q in model.QQ) + sum(model.lamda[k] * self.z[i, k]
                                                                                                       for k in model.K) + model.epsilon[i]
 
                 return regression_rule
 
             def regression_rule(model, i):
-                return log(self.y[i][0]) == -log(model.chi[i] + 1) + sum(model.kappa[q] *
+                return log(self.y[i, 0]) == -log(model.chi[i] + 1) + sum(model.kappa[q] *
                                                                          (log(
-                                                                             self.y[i][0]) - log(self.y[i][q]))
+                                                                             self.y[i, 0]) - log(self.y[i, q]))
                                                                          for q in model.QQ) + model.epsilon[i]
 
             return regression_rule
@@ -155,8 +150,8 @@ class CNLSRDF(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.chi[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * (self.x[i][j]/self.X[i]) for j in model.J) \
-                        - sum(model.gamma[i, q] * self.y[i][q]
+                        model.beta[i, j] * (self.x[i, j]/self.X[i]) for j in model.J) \
+                        - sum(model.gamma[i, q] * self.y[i, q]
                               for q in model.Q) - 1
 
                 return log_rule
@@ -164,8 +159,8 @@ class CNLSRDF(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.chi[i] == sum(
-                        model.beta[i, j] * (self.x[i][j]/self.X[i]) for j in model.J) \
-                        - sum(model.gamma[i, q] * self.y[i][q]
+                        model.beta[i, j] * (self.x[i, j]/self.X[i]) for j in model.J) \
+                        - sum(model.gamma[i, q] * self.y[i, q]
                               for q in model.Q) - 1
 
                 return log_rule
@@ -175,8 +170,8 @@ class CNLSRDF(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.chi[i] == model.alpha[i] + sum(
-                        model.gamma[i, q] * (self.y[i][q]/self.Y[i]) for q in model.Q) \
-                        - sum(model.beta[i, j] * self.x[i][j]
+                        model.gamma[i, q] * (self.y[i, q]/self.Y[i]) for q in model.Q) \
+                        - sum(model.beta[i, j] * self.x[i, j]
                               for j in model.J) - 1
 
                 return log_rule
@@ -184,8 +179,8 @@ class CNLSRDF(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.chi[i] == sum(
-                        model.gamma[i, q] * (self.y[i][q]/self.Y[i]) for q in model.Q) \
-                        - sum(model.beta[i, j] * self.x[i][j]
+                        model.gamma[i, q] * (self.y[i, q]/self.Y[i]) for q in model.Q) \
+                        - sum(model.beta[i, j] * self.x[i, j]
                               for j in model.J) - 1
 
                 return log_rule
@@ -206,11 +201,11 @@ class CNLSRDF(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * (self.x[i][j]/self.X[i])
-                                             for j in model.J) - sum(model.gamma[i, q] * self.y[i][q]
+                        model.alpha[i] + sum(model.beta[i, j] * (self.x[i, j]/self.X[i])
+                                             for j in model.J) - sum(model.gamma[i, q] * self.y[i, q]
                                                                      for q in model.Q),
-                        model.alpha[h] + sum(model.beta[h, j] * (self.x[i][j]/self.X[i])
-                                             for j in model.J) - sum(model.gamma[h, q] * self.y[i][q]
+                        model.alpha[h] + sum(model.beta[h, j] * (self.x[i, j]/self.X[i])
+                                             for j in model.J) - sum(model.gamma[h, q] * self.y[i, q]
                                                                      for q in model.Q))
 
                 return afriat_rule
@@ -220,11 +215,11 @@ class CNLSRDF(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * (self.x[i][j]/self.X[i])
-                            for j in model.J) - sum(model.gamma[i, q] * self.y[i][q]
+                        sum(model.beta[i, j] * (self.x[i, j]/self.X[i])
+                            for j in model.J) - sum(model.gamma[i, q] * self.y[i, q]
                                                     for q in model.Q),
-                        sum(model.beta[h, j] * (self.x[i][j]/self.X[i])
-                            for j in model.J) - sum(model.gamma[h, q] * self.y[i][q]
+                        sum(model.beta[h, j] * (self.x[i, j]/self.X[i])
+                            for j in model.J) - sum(model.gamma[h, q] * self.y[i, q]
                                                     for q in model.Q))
 
                 return afriat_rule
@@ -236,11 +231,11 @@ class CNLSRDF(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.gamma[i, q] * (self.y[i][q]/self.Y[i])
-                                             for q in model.Q) - sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.gamma[i, q] * (self.y[i, q]/self.Y[i])
+                                             for q in model.Q) - sum(model.beta[i, j] * self.x[i, j]
                                                                      for j in model.J),
-                        model.alpha[h] + sum(model.gamma[h, q] * (self.y[i][q]/self.Y[i])
-                                             for q in model.Q) - sum(model.beta[h, j] * self.x[i][j]
+                        model.alpha[h] + sum(model.gamma[h, q] * (self.y[i, q]/self.Y[i])
+                                             for q in model.Q) - sum(model.beta[h, j] * self.x[i, j]
                                                                      for j in model.J))
 
                 return afriat_rule
@@ -250,11 +245,11 @@ class CNLSRDF(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.gamma[i, q] * (self.y[i][q]/self.Y[i])
-                            for q in model.Q) - sum(model.beta[i, j] * self.x[i][j]
+                        sum(model.gamma[i, q] * (self.y[i, q]/self.Y[i])
+                            for q in model.Q) - sum(model.beta[i, j] * self.x[i, j]
                                                     for j in model.J),
-                        sum(model.gamma[h, q] * (self.y[i][q]/self.Y[i])
-                            for q in model.Q) - sum(model.beta[h, j] * self.x[i][j]
+                        sum(model.gamma[h, q] * (self.y[i, q]/self.Y[i])
+                            for q in model.Q) - sum(model.beta[h, j] * self.x[i, j]
                                                     for j in model.J))
 
                 return afriat_rule
@@ -269,11 +264,7 @@ class CNLSRDF(CNLS.CNLS):
     def get_gamma(self):
         """Return gamma value by array"""
         tools.assert_optimized(self.optimization_status)
-        gamma = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.gamma),
-                                                           list(self.__model__.gamma[:, :].value))])
-        gamma = pd.DataFrame(gamma, columns=['Name', 'Key', 'Value'])
-        gamma = gamma.pivot(index='Name', columns='Key', values='Value')
-        return gamma.to_numpy()
+        return tools.get_values(self.__model__.gamma)
 
     def display_kappa(self):
         """Display kappa value"""
@@ -283,11 +274,10 @@ class CNLSRDF(CNLS.CNLS):
     def get_kappa(self):
         """Return kappa value by array"""
         tools.assert_optimized(self.optimization_status)
-        kappa = list(self.__model__.kappa[:].value)
-        return np.asarray(kappa)
+        return tools.get_values(self.__model__.kappa)
 
     def get_chi(self):
         """Return estimated radial distance function by array"""
         tools.assert_optimized(self.optimization_status)
-        chi = np.asarray(list(self.__model__.chi[:].value)) + 1
+        chi = tools.get_values(self.__model__.chi) + 1
         return np.asarray(chi)
@@ -1,18 +1,17 @@
 # import dependencies
-from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
+from pyomo.environ import ConcreteModel, Set, Var, Param, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
 import numpy as np
-import pandas as pd
 
-from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_LOCAL, OPT_DEFAULT
-from .utils import tools, interpolation
+from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_LOCAL, OPT_DEFAULT, BLD_RULE, BLD_UNIVARIATE, BLD_AUTO
+from .utils import tools, interpolation, matrix, univariate, quantiles
 
 
 class CQR:
     """Convex quantile regression (CQR)
     """
 
-    def __init__(self, y, x, tau, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS):
+    def __init__(self, y, x, tau, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS, builder=BLD_AUTO):
         """CQR model
 
         Args:
@@ -23,10 +22,14 @@ class CQR:
             cet (String, optional): CET_ADDI (additive composite error term) or CET_MULT (multiplicative composite error term). Defaults to CET_ADDI.
             fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+            builder (String, optional): BLD_AUTO (BLD_UNIVARIATE for the additive model with a single input and no contextual variable, BLD_RULE otherwise), BLD_RULE (rule-based Pyomo constraints) or BLD_UNIVARIATE (exact univariate engine without a QP solver). Defaults to BLD_AUTO.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
         self.y, self.x, self.z = tools.assert_valid_basic_data(y, x, z)
-        self.tau, self.cet, self.fun, self.rts = tau, cet, fun, rts
+        self.tau, self.cet, self.fun, self.rts, self.builder = tau, cet, fun, rts, builder
+        if self.builder == BLD_AUTO:
+            self.builder = BLD_UNIVARIATE if self.cet == CET_ADDI and univariate.is_univariate(
+                self.x, self.z, self.rts) else BLD_RULE
 
         # Initialize the CQR model
         self.__model__ = ConcreteModel()
@@ -57,27 +60,35 @@ class CQR:
                                       bounds=(0.0, None),
                                       doc='estimated frontier')
 
-        # Setup the objective function and constraints
-        self.__model__.objective = Objective(rule=self.__objective_rule(),
-                                             sense=minimize,
-                                             doc='objective function')
-
-        self.__model__.error_decomposition = Constraint(self.__model__.I,
-                                                        rule=self.__error_decomposition(),
-                                                        doc='decompose error term')
-
-        self.__model__.regression_rule = Constraint(self.__model__.I,
-                                                    rule=self.__regression_rule(),
-                                                    doc='regression equation')
-        if self.cet == CET_MULT:
-            self.__model__.log_rule = Constraint(self.__model__.I,
-                                                 rule=self.__log_rule(),
-                                                 doc='log-transformed regression equation')
-
-        self.__model__.afriat_rule = Constraint(self.__model__.I,
-                                                self.__model__.I,
-                                                rule=self.__afriat_rule(),
-                                                doc='afriat inequality')
+        if self.builder == BLD_UNIVARIATE:
+            if self.cet != CET_ADDI or not univariate.is_univariate(self.x, self.z, self.rts):
+                raise ValueError(
+                    "The univariate engine only supports the additive model with a single input.")
+            self.__estimator = univariate.cqr
+        elif self.builder == BLD_RULE:
+            # the quantile only enters the objective, and stays mutable for fit_quantiles
+            self.__model__.tau = Param(initialize=tau, mutable=True, doc='quantile')
+
+            # Setup the objective function and constraints
+            self.__model__.objective = Objective(rule=self.__objective_rule(),
+                                                 sense=minimize,
+                                                 doc='objective function')
+
+            self.__model__.error_decomposition = Constraint(self.__model__.I,
+                                                            rule=self.__error_decomposition(),
+                                                            doc='decompose error term')
+
+            self.__model__.regression_rule = Constraint(self.__model__.I,
+                                                        rule=self.__regression_rule(),
+                                                        doc='regression equation')
+            if self.cet == CET_MULT:
+                self.__model__.log_rule = Constraint(self.__model__.I,
+                                                     rule=self.__log_rule(),
+                                                     doc='log-transformed regression equation')
+
+            self._shape_constraints()
+        else:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -90,15 +101,68 @@ class CQR:
             solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
         """
         # TODO(error/warning handling): Check problem status after optimization
+        if self.builder == BLD_UNIVARIATE:
+            univariate.announce(email, solver)
+            alpha, beta, residual = self.__estimator(
+                self.y, self.x, self.tau, self.fun, self.rts)
+            if self.rts == RTS_VRS:
+                matrix.load_values(self.__model__.alpha, alpha)
+            matrix.load_values(self.__model__.beta, beta)
+            matrix.load_values(self.__model__.epsilon, residual)
+            matrix.load_values(self.__model__.epsilon_plus, np.maximum(residual, 0.0))
+            matrix.load_values(self.__model__.epsilon_minus, np.maximum(-residual, 0.0))
+            self.problem_status, self.optimization_status = "optimal", 1
+            return
         self.problem_status, self.optimization_status = tools.optimize_model(
             self.__model__, email, self.cet, solver)
 
+    def fit_quantiles(self, taus, email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1):
+        """Estimate the model at each of the given quantiles
+
+        The constraints do not depend on tau, so that the model is kept and only the
+        objective weights change from one quantile to the next. In a persistent solver, each
+        solve then starts from the solution of the previous quantile. The model is left at the
+        last quantile. With several processes, the quantiles are split into contiguous blocks,
+        each estimated in turn on a copy of the model in a worker process, and the model is
+        left as it was.
+
+        Args:
+            taus (float): quantiles, preferably sorted so that neighboring solutions are alike.
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+            processes (int, optional): number of worker processes sharing the quantiles. Defaults to 1.
+
+        Returns:
+            tuple: alpha (None under RTS_CRS), beta and residual, stacked by tau.
+        """
+        if not hasattr(self, 'builder'):
+            raise ValueError("The model does not support fitting several quantiles.")
+        if processes is not None and processes > 1 and len(taus) > 1:
+            return quantiles.fit(type(self), tools.model_arguments(self), taus, email, solver, processes)
+
+        alpha, beta, residual = [], [], []
+        instance = None
+        for tau in taus:
+            self.tau = tau
+            if self.builder == BLD_RULE:
+                self.__model__.tau.set_value(tau)
+                self.problem_status, self.optimization_status, instance = tools.optimize_model_persistent(
+                    self.__model__, email, self.cet, solver, instance,
+                    objective=next(self.__model__.component_data_objects(Objective, active=True)))
+            else:
+                self.optimize(email, solver)
+            if self.rts == RTS_VRS:
+                alpha.append(self.get_alpha())
+            beta.append(self.get_beta())
+            residual.append(self.get_residual())
+        return np.array(alpha) if self.rts == RTS_VRS else None, np.array(beta), np.array(residual)
+
     def __objective_rule(self):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * sum(model.epsilon_minus[i] for i in model.I)
+            return model.tau * sum(model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * sum(model.epsilon_minus[i] for i in model.I)
 
         return objective_rule
 
@@ -117,29 +181,29 @@ class CQR:
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
                         return self.y[i] == model.alpha[i] \
-                            + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.lamda[k] * self.z[i][k]
+                            + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.lamda[k] * self.z[i, k]
                                   for k in model.K) + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
                     return self.y[i] == model.alpha[i] \
-                        + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                        + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
-                        return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.lamda[k] * self.z[i][k]
+                        return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.lamda[k] * self.z[i, k]
                                   for k in model.K) + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
@@ -148,7 +212,7 @@ class CQR:
             if type(self.z) != type(None):
                 def regression_rule(model, i):
                     return log(self.y[i]) == log(model.frontier[i] + 1) \
-                        + sum(model.lamda[k] * self.z[i][k]
+                        + sum(model.lamda[k] * self.z[i, k]
                               for k in model.K) + model.epsilon[i]
 
                 return regression_rule
@@ -167,19 +231,30 @@ class CQR:
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
             elif self.rts == RTS_CRS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
 
         raise ValueError("Undefined model parameters.")
 
+    def _shape_constraints(self):
+        """Add the afriat inequality on every pair of observations
+
+        Subclasses that impose the shape on fewer pairs override this, so that the dense
+        family is never built.
+        """
+        self.__model__.afriat_rule = Constraint(self.__model__.I,
+                                                self.__model__.I,
+                                                rule=self.__afriat_rule(),
+                                                doc='afriat inequality')
+
     def __afriat_rule(self):
         """Return the proper afriat inequality constraint"""
         if self.fun == FUN_PROD:
@@ -194,9 +269,9 @@ class CQR:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
-                        model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
+                        model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
                                              for j in model.J))
 
                 return afriat_rule
@@ -205,9 +280,9 @@ class CQR:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j]
+                        sum(model.beta[i, j] * self.x[i, j]
                             for j in model.J),
-                        sum(model.beta[h, j] * self.x[i][j]
+                        sum(model.beta[h, j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -218,9 +293,9 @@ class CQR:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
-                        model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
+                        model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
                                              for j in model.J))
 
                 return afriat_rule
@@ -230,8 +305,8 @@ class CQR:
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[h, j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
 
@@ -281,50 +356,41 @@ class CQR:
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale(self.rts)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_lamda(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_contextual_variable(self.z)
-        lamda = list(self.__model__.lamda[:].value)
-        return np.asarray(lamda)
+        return tools.get_values(self.__model__.lamda)
 
     def get_residual(self):
         """Return residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual = list(self.__model__.epsilon[:].value)
-        return np.asarray(residual)
+        return tools.get_values(self.__model__.epsilon)
 
     def get_positive_residual(self):
         """Return positive residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_plus = list(self.__model__.epsilon_plus[:].value)
-        return np.asarray(residual_plus)
+        return tools.get_values(self.__model__.epsilon_plus)
 
     def get_negative_residual(self):
         """Return negative residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_minus = list(self.__model__.epsilon_minus[:].value)
-        return np.asarray(residual_minus)
+        return tools.get_values(self.__model__.epsilon_minus)
 
     def get_frontier(self):
         """Return estimated frontier value by array"""
         tools.assert_optimized(self.optimization_status)
         if self.cet == CET_MULT and type(self.z) == type(None):
-            frontier = np.asarray(list(self.__model__.frontier[:].value))+1
+            frontier = tools.get_values(self.__model__.frontier)+1
         elif self.cet == CET_MULT and type(self.z) != type(None):
-            frontier = np.multiply( (np.asarray(list(self.__model__.frontier[:].value))+1), 
+            frontier = np.multiply( (tools.get_values(self.__model__.frontier)+1), 
                                    np.exp(np.dot(np.asarray(self.z), self.get_lamda())) )
         elif self.cet == CET_ADDI:
             frontier = np.asarray(self.y) - self.get_residual()
@@ -337,6 +403,9 @@ class CQR:
             alpha,  beta = self.get_alpha(), self.get_beta()
         elif self.rts == RTS_CRS:
             alpha, beta = np.zeros((self.get_beta()).shape[0]), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
 
 
@@ -344,7 +413,7 @@ class CER(CQR):
     """Convex expectile regression (CER)
     """
 
-    def __init__(self, y, x, tau, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS):
+    def __init__(self, y, x, tau, z=None, cet=CET_ADDI, fun=FUN_PROD, rts=RTS_VRS, builder=BLD_AUTO):
         """CER model
 
         Args:
@@ -355,16 +424,20 @@ class CER(CQR):
             cet (String, optional): CET_ADDI (additive composite error term) or CET_MULT (multiplicative composite error term). Defaults to CET_ADDI.
             fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+            builder (String, optional): BLD_AUTO (BLD_UNIVARIATE for the additive model with a single input and no contextual variable, BLD_RULE otherwise), BLD_RULE (rule-based Pyomo constraints) or BLD_UNIVARIATE (exact univariate engine without a QP solver). Defaults to BLD_AUTO.
         """
-        super().__init__(y, x, tau, z, cet, fun, rts)
-        self.__model__.objective.deactivate()
-        self.__model__.squared_objective = Objective(
-            rule=self.__squared_objective_rule(), sense=minimize, doc='squared objective rule')
+        super().__init__(y, x, tau, z, cet, fun, rts, builder)
+        if self.builder == BLD_UNIVARIATE:
+            self._CQR__estimator = univariate.cer
+        else:
+            self.__model__.objective.deactivate()
+            self.__model__.squared_objective = Objective(
+                rule=self.__squared_objective_rule(), sense=minimize, doc='squared objective rule')
 
     def __squared_objective_rule(self):
         def squared_objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * \
+            return model.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * \
                 sum(model.epsilon_minus[i] ** 2 for i in model.I)
 
         return squared_objective_rule
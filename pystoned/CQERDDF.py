@@ -1,5 +1,5 @@
 # import dependencies
-from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint
+from pyomo.environ import ConcreteModel, Set, Var, Param, Objective, minimize, Constraint
 from pyomo.core.expr.numvalue import NumericValue
 from .constant import FUN_PROD, FUN_COST, RTS_VRS
 from . import CNLSDDF, CQER
@@ -54,6 +54,7 @@ class CQRDDF(CNLSDDF.CNLSDDF, CQER.CQR):
             self.__model__.delta = Var(
                 self.__model__.I, self.__model__.L, bounds=(0.0, None), doc='delta')
 
+        self.__model__.tau = Param(initialize=tau, mutable=True, doc='quantile')
         self.__model__.objective = Objective(rule=self._CQR__objective_rule(),
                                              sense=minimize,
                                              doc='objective function')
@@ -82,18 +83,18 @@ class CQRDDF(CNLSDDF.CNLSDDF, CQER.CQR):
         """Return the proper regression constraint"""
         if type(self.b) == type(None):
             def regression_rule(model, i):
-                return sum(model.gamma[i, q] * self.y[i][q] for q in model.Q) \
+                return sum(model.gamma[i, q] * self.y[i, q] for q in model.Q) \
                     == model.alpha[i] \
-                    + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                     + model.epsilon[i]
 
             return regression_rule
 
         def regression_rule(model, i):
-            return sum(model.gamma[i, q] * self.y[i][q] for q in model.Q) \
+            return sum(model.gamma[i, q] * self.y[i, q] for q in model.Q) \
                 == model.alpha[i] \
-                + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
+                + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
                 + model.epsilon[i]
 
         return regression_rule
@@ -110,14 +111,14 @@ class CQRDDF(CNLSDDF.CNLSDDF, CQER.CQR):
                 if i == h:
                     return Constraint.Skip
                 return __operator(model.alpha[i]
-                                  + sum(model.beta[i, j] * self.x[i][j]
+                                  + sum(model.beta[i, j] * self.x[i, j]
                                         for j in model.J)
-                                  - sum(model.gamma[i, q] * self.y[i][q]
+                                  - sum(model.gamma[i, q] * self.y[i, q]
                                         for q in model.Q),
                                   model.alpha[h]
-                                  + sum(model.beta[h, j] * self.x[i][j]
+                                  + sum(model.beta[h, j] * self.x[i, j]
                                         for j in model.J)
-                                  - sum(model.gamma[h, q] * self.y[i][q] for q in model.Q))
+                                  - sum(model.gamma[h, q] * self.y[i, q] for q in model.Q))
 
             return afriat_rule
 
@@ -125,18 +126,18 @@ class CQRDDF(CNLSDDF.CNLSDDF, CQER.CQR):
             if i == h:
                 return Constraint.Skip
             return __operator(model.alpha[i]
-                              + sum(model.beta[i, j] * self.x[i][j]
+                              + sum(model.beta[i, j] * self.x[i, j]
                                     for j in model.J)
-                              + sum(model.delta[i, l] * self.b[i][l]
+                              + sum(model.delta[i, l] * self.b[i, l]
                                     for l in model.L)
-                              - sum(model.gamma[i, q] * self.y[i][q]
+                              - sum(model.gamma[i, q] * self.y[i, q]
                                     for q in model.Q),
                               model.alpha[h]
-                              + sum(model.beta[h, j] * self.x[i][j]
+                              + sum(model.beta[h, j] * self.x[i, j]
                                     for j in model.J)
-                              + sum(model.delta[h, l] * self.b[i][l]
+                              + sum(model.delta[h, l] * self.b[i, l]
                                     for l in model.L)
-                              - sum(model.gamma[h, q] * self.y[i][q] for q in model.Q))
+                              - sum(model.gamma[h, q] * self.y[i, q] for q in model.Q))
 
         return afriat_rule
 
@@ -165,8 +166,8 @@ class CERDDF(CQRDDF):
 
     def __squared_objective_rule(self):
         def squared_objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * \
+            return model.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * \
                 sum(model.epsilon_minus[i] ** 2 for i in model.I)
 
         return squared_objective_rule
@@ -1,8 +1,8 @@
 # import dependencies
 import numpy as np
-import pandas as pd
-from .utils import CQERG1, CQERG2, CQERZG1, CQERZG2, sweet, tools, interpolation
-from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_LOCAL, OPT_DEFAULT
+from scipy import sparse
+from .utils import CQERG1, CQERG2, CQERZG1, CQERZG2, sweet, tools, interpolation, violation
+from .constant import CET_ADDI, CET_MULT, FUN_PROD, RTS_CRS, RTS_VRS, OPT_LOCAL, OPT_DEFAULT
 import time
 
 
@@ -28,9 +28,7 @@ class CQRG:
         self.tau, self.cet, self.fun, self.rts = tau, cet, fun, rts
 
         # active (added) violated concavity constraint by iterative procedure
-        self.active = np.zeros((len(x), len(x)))
-        # violated concavity constraint
-        self.active2 = np.zeros((len(x), len(x)))
+        self.active = sparse.csr_matrix((len(self.y), len(self.y)))
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -70,53 +68,12 @@ class CQRG:
         self.tt = time.time() - self.t0
 
     def __convergence_test(self, alpha, beta):
-        x = np.asarray(self.x)
-        activetmp1 = 0.0
-
-        # go into the loop
-        for i in range(len(x)):
-            activetmp = 0.0
-            # go into the sub-loop and find the violated concavity constraints
-            for j in range(len(x)):
-                if self.cet == CET_ADDI:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) \
-                                - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) \
-                                + np.sum(beta[j, :] * x[i, :])
-                if self.cet == CET_MULT:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) - \
-                                np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) + \
-                                np.sum(beta[j, :] * x[i, :])
-                if self.active2[i, j] > activetmp:
-                    activetmp = self.active2[i, j]
-            # find the maximal violated constraint in sub-loop and added into the active matrix
-            for j in range(len(x)):
-                if self.active2[i, j] >= activetmp and activetmp > 0:
-                    self.active[i, j] = 1
-            if activetmp > activetmp1:
-                activetmp1 = activetmp
-        return activetmp
+        maximum, i, h = violation.violated_constraints(
+            alpha, beta, self.x, self.fun, self.rts)
+        # add the maximal violated constraints into the active matrix
+        self.active = self.active.maximum(sparse.csr_matrix(
+            (np.ones(len(i)), (i, h)), shape=self.active.shape))
+        return maximum
 
     def display_status(self):
         """Display the status of problem"""
@@ -162,50 +119,41 @@ class CQRG:
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale(self.rts)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_residual(self):
         """Return residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual = list(self.__model__.epsilon[:].value)
-        return np.asarray(residual)
+        return tools.get_values(self.__model__.epsilon)
 
     def get_positive_residual(self):
         """Return positive residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_plus = list(self.__model__.epsilon_plus[:].value)
-        return np.asarray(residual_plus)
+        return tools.get_values(self.__model__.epsilon_plus)
 
     def get_negative_residual(self):
         """Return negative residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_minus = list(self.__model__.epsilon_minus[:].value)
-        return np.asarray(residual_minus)
+        return tools.get_values(self.__model__.epsilon_minus)
 
     def get_lamda(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_contextual_variable(self.z)
-        lamda = list(self.__model__.lamda[:].value)
-        return np.asarray(lamda)
+        return tools.get_values(self.__model__.lamda)
 
     def get_frontier(self):
         """Return estimated frontier value by array"""
         tools.assert_optimized(self.optimization_status)
         if self.cet == CET_MULT and type(self.z) == type(None):
-            frontier = np.asarray(list(self.__model__.frontier[:].value))+1
+            frontier = tools.get_values(self.__model__.frontier)+1
         elif self.cet == CET_MULT and type(self.z) != type(None):
-            frontier = np.multiply( (np.asarray(list(self.__model__.frontier[:].value))+1), 
+            frontier = np.multiply( (tools.get_values(self.__model__.frontier)+1), 
                                    np.exp(np.dot(np.asarray(self.z), self.get_lamda())) )
         elif self.cet == CET_ADDI:
             frontier = np.asarray(self.y) - self.get_residual()
@@ -214,9 +162,9 @@ class CQRG:
     def get_totalconstr(self):
         """Return the number of total constraints"""
         tools.assert_optimized(self.optimization_status)
-        activeconstr = np.sum(self.active) - np.trace(self.active)
-        cutactiveconstr = np.sum(self.cutactive) - np.trace(self.cutactive)
-        totalconstr = activeconstr + cutactiveconstr + 2 * len(self.active) + 1
+        activeconstr = self.active.sum() - self.active.diagonal().sum()
+        cutactiveconstr = self.cutactive.sum() - self.cutactive.diagonal().sum()
+        totalconstr = activeconstr + cutactiveconstr + 2 * self.active.shape[0] + 1
         return totalconstr
 
     def get_runningtime(self):
@@ -236,6 +184,9 @@ class CQRG:
             alpha,  beta = self.get_alpha(), self.get_beta()
         elif self.rts == RTS_CRS:
             alpha, beta = np.zeros((self.get_beta()).shape[0]), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
 
 
@@ -261,9 +212,7 @@ class CERG:
         self.tau, self.cet, self.fun, self.rts = tau, cet, fun, rts
 
         # active (added) violated concavity constraint by iterative procedure
-        self.active = np.zeros((len(x), len(x)))
-        # violated concavity constraint
-        self.active2 = np.zeros((len(x), len(x)))
+        self.active = sparse.csr_matrix((len(self.y), len(self.y)))
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -303,53 +252,12 @@ class CERG:
         self.tt = time.time() - self.t0
 
     def __convergence_test(self, alpha, beta):
-        x = np.asarray(self.x)
-        activetmp1 = 0.0
-
-        # go into the loop
-        for i in range(len(x)):
-            activetmp = 0.0
-            # go into the sub-loop and find the violated concavity constraints
-            for j in range(len(x)):
-                if self.cet == CET_ADDI:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) \
-                                - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) \
-                                + np.sum(beta[j, :] * x[i, :])
-                if self.cet == CET_MULT:
-                    if self.rts == RTS_VRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = alpha[i] + np.sum(beta[i, :] * x[i, :]) - \
-                                alpha[j] - np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - alpha[i] - np.sum(beta[i, :] * x[i, :]) + \
-                                alpha[j] + np.sum(beta[j, :] * x[i, :])
-                    if self.rts == RTS_CRS:
-                        if self.fun == FUN_PROD:
-                            self.active2[i, j] = np.sum(beta[i, :] * x[i, :]) - \
-                                np.sum(beta[j, :] * x[i, :])
-                        elif self.fun == FUN_COST:
-                            self.active2[i, j] = - np.sum(beta[i, :] * x[i, :]) + \
-                                np.sum(beta[j, :] * x[i, :])
-                if self.active2[i, j] > activetmp:
-                    activetmp = self.active2[i, j]
-            # find the maximal violated constraint in sub-loop and added into the active matrix
-            for j in range(len(x)):
-                if self.active2[i, j] >= activetmp and activetmp > 0:
-                    self.active[i, j] = 1
-            if activetmp > activetmp1:
-                activetmp1 = activetmp
-        return activetmp
+        maximum, i, h = violation.violated_constraints(
+            alpha, beta, self.x, self.fun, self.rts)
+        # add the maximal violated constraints into the active matrix
+        self.active = self.active.maximum(sparse.csr_matrix(
+            (np.ones(len(i)), (i, h)), shape=self.active.shape))
+        return maximum
 
     def display_status(self):
         """Display the status of problem"""
@@ -395,48 +303,39 @@ class CERG:
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale(self.rts)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_residual(self):
         """Return residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual = list(self.__model__.epsilon[:].value)
-        return np.asarray(residual)
+        return tools.get_values(self.__model__.epsilon)
 
     def get_positive_residual(self):
         """Return positive residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_plus = list(self.__model__.epsilon_plus[:].value)
-        return np.asarray(residual_plus)
+        return tools.get_values(self.__model__.epsilon_plus)
 
     def get_negative_residual(self):
         """Return negative residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_minus = list(self.__model__.epsilon_minus[:].value)
-        return np.asarray(residual_minus)
+        return tools.get_values(self.__model__.epsilon_minus)
 
     def get_lamda(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_contextual_variable(self.z)
-        lamda = list(self.__model__.lamda[:].value)
-        return np.asarray(lamda)
+        return tools.get_values(self.__model__.lamda)
 
     def get_frontier(self):
         """Return estimated frontier value by array"""
         tools.assert_optimized(self.optimization_status)
         if self.cet == CET_MULT and type(self.z) == type(None):
-            frontier = np.asarray(list(self.__model__.frontier[:].value))+1
+            frontier = tools.get_values(self.__model__.frontier)+1
         elif self.cet == CET_MULT and type(self.z) != type(None):
             frontier = list(np.divide(self.y, np.exp(
                 self.get_residual()+self.get_lamda()*np.asarray(self.z)[:, 0])) - 1)
@@ -447,9 +346,9 @@ class CERG:
     def get_totalconstr(self):
         """Return the number of total constraints"""
         tools.assert_optimized(self.optimization_status)
-        activeconstr = np.sum(self.active) - np.trace(self.active)
-        cutactiveconstr = np.sum(self.cutactive) - np.trace(self.cutactive)
-        totalconstr = activeconstr + cutactiveconstr + 2 * len(self.active) + 1
+        activeconstr = self.active.sum() - self.active.diagonal().sum()
+        cutactiveconstr = self.cutactive.sum() - self.cutactive.diagonal().sum()
+        totalconstr = activeconstr + cutactiveconstr + 2 * self.active.shape[0] + 1
         return totalconstr
 
     def get_runningtime(self):
@@ -469,4 +368,7 @@ class CERG:
             alpha,  beta = self.get_alpha(), self.get_beta()
         elif self.rts == RTS_CRS:
             alpha, beta = np.zeros((self.get_beta()).shape[0]), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
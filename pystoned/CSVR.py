@@ -1,8 +1,6 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint
 from pyomo.core.expr.numvalue import NumericValue
-import numpy as np
-import pandas as pd
 
 from .constant import CET_ADDI, FUN_PROD, FUN_COST, OPT_DEFAULT, OPT_LOCAL
 from .utils import tools, interpolation
@@ -90,7 +88,7 @@ class CSVR:
         """Return the proper regression constraint"""
 
         def regression_rule1(model, i):
-            return self.y[i] - sum(model.beta[i, j] * self.x[i][j] for j in model.J) - model.alpha[i]\
+            return self.y[i] - sum(model.beta[i, j] * self.x[i, j] for j in model.J) - model.alpha[i]\
                 <= self.epsilon + model.ksia[i]
 
         return regression_rule1
@@ -99,7 +97,7 @@ class CSVR:
         """Return the proper regression constraint"""
 
         def regression_rule2(model, i):
-            return sum(model.beta[i, j] * self.x[i][j] for j in model.J) + model.alpha[i] - self.y[i]\
+            return sum(model.beta[i, j] * self.x[i, j] for j in model.J) + model.alpha[i] - self.y[i]\
                 <= self.epsilon + model.ksib[i]
 
         return regression_rule2
@@ -115,9 +113,9 @@ class CSVR:
             if i == h:
                 return Constraint.Skip
             return __operator(
-                model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                      for j in model.J),
-                model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
+                model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
                                      for j in model.J))
 
         return afriat_rule
@@ -144,20 +142,18 @@ class CSVR:
     def get_alpha(self):
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return tools.get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return tools.get_values(self.__model__.beta)
 
     def get_predict(self, x_test):
         """Return the estimated function in testing sample"""
         tools.assert_optimized(self.optimization_status)
         alpha, beta = self.get_alpha(), self.get_beta()
+        # the pruned hyperplanes are kept until the model is optimized again
+        alpha, beta = tools.get_cached(self.__model__, ('prune',),
+                                       lambda: interpolation.prune(alpha, beta, self.x, fun=self.fun))
         return interpolation.interpolation(alpha, beta, x_test, fun=self.fun)
@@ -1,16 +1,16 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, maximize, Constraint
 import numpy as np
-import pandas as pd
-from .constant import CET_ADDI, ORIENT_IO, ORIENT_OO, RTS_VRS, RTS_CRS, OPT_DEFAULT, OPT_LOCAL
-from .utils import tools
+from scipy import sparse
+from .constant import CET_ADDI, ORIENT_IO, ORIENT_OO, RTS_VRS, RTS_CRS, OPT_DEFAULT, OPT_LOCAL, BLD_RULE, BLD_MATRIX, BLD_DECOMPOSED
+from .utils import tools, matrix, decomposition, screening
 
 
 class DEA:
     """Data Envelopment Analysis (DEA)
     """
 
-    def __init__(self, y, x, orient, rts, yref=None, xref=None):
+    def __init__(self, y, x, orient, rts, yref=None, xref=None, builder=BLD_RULE, screen=False):
         """DEA: Envelopment problem 
 
         Args:
@@ -20,10 +20,12 @@ class DEA:
             rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale)
             yref (String, optional): reference output. Defaults to None.
             xref (String, optional): reference inputs. Defaults to None.
+            builder (String, optional): BLD_RULE (rule-based Pyomo constraints), BLD_MATRIX (sparse coefficient matrices solved by HiGHS in-process by default) or BLD_DECOMPOSED (one program per DMU, solved separately). Defaults to BLD_RULE.
+            screen (bool, optional): whether to keep only the extreme-efficient reference DMUs, which span the same technology, before building the model. Defaults to False.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
         self.y, self.x = tools.assert_valid_mupltiple_y_data(y, x)
-        self.orient, self.rts = orient, rts
+        self.orient, self.rts, self.builder = orient, rts, builder
 
         if type(yref) != type(None):
             self.yref, self.xref = tools.assert_valid_reference_data(
@@ -31,6 +33,11 @@ class DEA:
         else:
             self.yref, self.xref = self.y, self.x
 
+        self.reference = None
+        if screen:
+            self.reference = screening.extreme(self.yref, self.xref, rts=self.rts)
+            self.yref, self.xref = self.yref[self.reference], self.xref[self.reference]
+
         # Initialize DEA model
         self.__model__ = ConcreteModel()
         self.__model__.R = Set(initialize=range(len(self.yref)))
@@ -40,25 +47,39 @@ class DEA:
         self.__model__.J = Set(initialize=range(len(self.x[0])))
         self.__model__.K = Set(initialize=range(len(self.y[0])))
 
-        # Initialize variable
-        self.__model__.theta = Var(self.__model__.I, doc='efficiency')
-        self.__model__.lamda = Var(self.__model__.I, self.__model__.R, bounds=(
-            0.0, None), doc='intensity variables')
-
-        # Setup the objective function and constraints
-        if self.orient == ORIENT_IO:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=minimize, doc='objective function')
+        if self.builder == BLD_DECOMPOSED:
+            # Assemble the program of each DMU when optimizing, without the variables of all DMUs
+            self.__decomposition = (matrix.dea_program, [self.y, self.x],
+                                    [self.orient, self.rts, self.yref, self.xref],
+                                    [('theta', None), ('lamda', len(self.yref))])
         else:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=maximize, doc='objective function')
-        self.__model__.input = Constraint(
-            self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
-        self.__model__.output = Constraint(
-            self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
-        if self.rts == RTS_VRS:
-            self.__model__.vrs = Constraint(
-                self.__model__.I, rule=self.__vrs_rule(), doc='variable return to scale rule')
+            # Initialize variable
+            self.__model__.theta = Var(self.__model__.I, doc='efficiency')
+            self.__model__.lamda = Var(self.__model__.I, self.__model__.R, bounds=(
+                0.0, None), doc='intensity variables')
+            self.__variables = [self.__model__.theta, self.__model__.lamda]
+
+        if self.builder == BLD_MATRIX:
+            # Setup the objective function and constraints as sparse matrices
+            self.__program = matrix.dea_program(
+                self.y, self.x, self.orient, self.rts, self.yref, self.xref)
+        elif self.builder == BLD_RULE:
+            # Setup the objective function and constraints
+            if self.orient == ORIENT_IO:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=minimize, doc='objective function')
+            else:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=maximize, doc='objective function')
+            self.__model__.input = Constraint(
+                self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
+            self.__model__.output = Constraint(
+                self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
+            if self.rts == RTS_VRS:
+                self.__model__.vrs = Constraint(
+                    self.__model__.I, rule=self.__vrs_rule(), doc='variable return to scale rule')
+        elif self.builder != BLD_DECOMPOSED:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -73,22 +94,22 @@ class DEA:
         """Return the proper input constraint"""
         if self.orient == ORIENT_IO:
             def input_rule(model, o, j):
-                return model.theta[o]*self.x[o][j] >= sum(model.lamda[o, r]*self.xref[r][j] for r in model.R)
+                return model.theta[o]*self.x[o, j] >= sum(model.lamda[o, r]*self.xref[r, j] for r in model.R)
             return input_rule
         elif self.orient == ORIENT_OO:
             def input_rule(model, o, j):
-                return sum(model.lamda[o, r] * self.xref[r][j] for r in model.R) <= self.x[o][j]
+                return sum(model.lamda[o, r] * self.xref[r, j] for r in model.R) <= self.x[o, j]
             return input_rule
 
     def __output_rule(self):
         """Return the proper output constraint"""
         if self.orient == ORIENT_IO:
             def output_rule(model, o, k):
-                return sum(model.lamda[o, r] * self.yref[r][k] for r in model.R) >= self.y[o][k]
+                return sum(model.lamda[o, r] * self.yref[r, k] for r in model.R) >= self.y[o, k]
             return output_rule
         elif self.orient == ORIENT_OO:
             def output_rule(model, o, k):
-                return model.theta[o]*self.y[o][k] <= sum(model.lamda[o, r]*self.yref[r][k] for r in model.R)
+                return model.theta[o]*self.y[o, k] <= sum(model.lamda[o, r]*self.yref[r, k] for r in model.R)
             return output_rule
 
     def __vrs_rule(self):
@@ -96,14 +117,26 @@ class DEA:
             return sum(model.lamda[o, r] for r in model.R) == 1
         return vrs_rule
 
-    def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT):
+    def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1):
         """Optimize the function by requested method
 
         Args:
             email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
             solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+            processes (int, optional): number of worker processes sharing the DMUs under BLD_DECOMPOSED. Defaults to 1.
         """
         # TODO(error/warning handling): Check problem status after optimization
+        if self.builder == BLD_DECOMPOSED:
+            program, data, arguments, blocks = self.__decomposition
+            self.__values, self.problem_status = decomposition.solve(
+                program, data, arguments, blocks, email, solver, processes)
+            self.optimization_status = 1 if self.problem_status == "optimal" else 0
+            return
+        if self.builder == BLD_MATRIX:
+            solution, self.problem_status = self.__program.solve(email, solver)
+            matrix.load_solution(self.__variables, solution)
+            self.optimization_status = 1 if self.problem_status == "optimal" else 0
+            return
         self.problem_status, self.optimization_status = tools.optimize_model(
             self.__model__, email, CET_ADDI, solver)
 
@@ -114,12 +147,16 @@ class DEA:
     def display_theta(self):
         """Display theta value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.theta.display()
+        self.__display('theta', self.get_theta)
 
     def display_lamda(self):
         """Display lamda value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.lamda.display()
+        if self.reference is not None:
+            # the variable only covers the screened reference DMUs
+            tools.display_values('lamda', self.get_lamda())
+            return
+        self.__display('lamda', self.get_lamda)
 
     def get_status(self):
         """Return status"""
@@ -128,21 +165,36 @@ class DEA:
     def get_theta(self):
         """Return theta value by array"""
         tools.assert_optimized(self.optimization_status)
-        theta = list(self.__model__.theta[:].value)
-        return np.asarray(theta)
+        return self.__get_values('theta')
 
     def get_lamda(self):
         """Return lamda value by array"""
         tools.assert_optimized(self.optimization_status)
-        lamda = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.lamda),
-                                                           list(self.__model__.lamda[:, :].value))])
-        lamda = pd.DataFrame(lamda, columns=['Name', 'Key', 'Value'])
-        lamda = lamda.pivot(index='Name', columns='Key', values='Value')
-        return lamda.to_numpy()
+        lamda = self.__get_values('lamda')
+        if self.reference is not None:
+            # the screened out reference DMUs have no intensity
+            screened = np.zeros((len(lamda), len(self.reference)))
+            screened[:, self.reference] = lamda
+            return screened
+        return lamda
+
+    def __display(self, name, get_values):
+        """Display the named variable, or its values if the model does not keep it"""
+        if self.builder == BLD_DECOMPOSED:
+            tools.display_values(name, get_values())
+            return
+        getattr(self.__model__, name).display()
+
+    def __get_values(self, name):
+        """Return the values of the named variable by array"""
+        if self.builder == BLD_DECOMPOSED:
+            values = self.__values[name]
+            return values.toarray() if sparse.issparse(values) else values.copy()
+        return tools.get_values(getattr(self.__model__, name))
 
 
 class DDF(DEA):
-    def __init__(self,  y, x, b=None, gy=[1], gx=[1], gb=None, rts=RTS_VRS, yref=None, xref=None, bref=None):
+    def __init__(self,  y, x, b=None, gy=[1], gx=[1], gb=None, rts=RTS_VRS, yref=None, xref=None, bref=None, builder=BLD_RULE, screen=False):
         """DEA: Directional distance function
 
         Args:
@@ -156,19 +208,28 @@ class DDF(DEA):
             yref (String, optional): reference output. Defaults to None.
             xref (String, optional): reference inputs. Defaults to None.
             bref (String, optional): reference undesirable output. Defaults to None.
+            builder (String, optional): BLD_RULE (rule-based Pyomo constraints), BLD_MATRIX (sparse coefficient matrices solved by HiGHS in-process by default) or BLD_DECOMPOSED (one program per DMU, solved separately). Defaults to BLD_RULE.
+            screen (bool, optional): whether to keep only the extreme-efficient reference DMUs, which span the same technology, before building the model. Defaults to False.
         """
         # Initialize DEA model
         self.__model__ = ConcreteModel()
 
         self.y, self.x, self.b, self.gy, self.gx, self.gb = tools.assert_valid_direciontal_data(
             y, x, b, gy, gx, gb)
-        self.rts = rts
+        self.rts, self.builder = rts, builder
 
         if type(yref) != type(None):
             self.yref, self.xref, self.bref = tools.assert_valid_reference_data_with_bad_outputs(
                 self.y, self.x, self.b, yref, xref, bref)
         else:
             self.yref, self.xref, self.bref = self.y, self.x, self.b
+
+        self.reference = None
+        if screen:
+            self.reference = screening.extreme(self.yref, self.xref, self.bref, self.rts)
+            self.yref, self.xref = self.yref[self.reference], self.xref[self.reference]
+            if type(self.bref) != type(None):
+                self.bref = self.bref[self.reference]
         self.__model__.R = Set(initialize=range(len(self.yref)))
 
         # Initialize sets
@@ -178,28 +239,43 @@ class DDF(DEA):
         if type(b) != type(None):
             self.__model__.L = Set(initialize=range(len(self.b[0])))
 
-        # Initialize variable
-        self.__model__.theta = Var(
-            self.__model__.I, doc='directional distance')
+        if self.builder == BLD_DECOMPOSED:
+            # Assemble the program of each DMU when optimizing, without the variables of all DMUs
+            self._DEA__decomposition = (matrix.ddf_program, [self.y, self.x, self.b],
+                                        [self.gy, self.gx, self.gb, self.rts, self.yref, self.xref, self.bref],
+                                        [('theta', None), ('lamda', len(self.yref))])
+        else:
+            # Initialize variable
+            self.__model__.theta = Var(
+                self.__model__.I, doc='directional distance')
 
-        self.__model__.lamda = Var(self.__model__.I, self.__model__.R, bounds=(
-            0.0, None), doc='intensity variables')
+            self.__model__.lamda = Var(self.__model__.I, self.__model__.R, bounds=(
+                0.0, None), doc='intensity variables')
 
-        # Setup the objective function and constraints
-        self.__model__.objective = Objective(
-            rule=self._DEA__objective_rule(), sense=maximize, doc='objective function')
-        self.__model__.input = Constraint(
-            self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
-        self.__model__.output = Constraint(
-            self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
+            self._DEA__variables = [self.__model__.theta, self.__model__.lamda]
 
-        if type(b) != type(None):
-            self.__model__.undesirable_output = Constraint(
-                self.__model__.I, self.__model__.L, rule=self.__undesirable_output_rule(), doc='undesirable output constraint')
+        if self.builder == BLD_MATRIX:
+            # Setup the objective function and constraints as sparse matrices
+            self._DEA__program = matrix.ddf_program(
+                self.y, self.x, self.b, self.gy, self.gx, self.gb, self.rts, self.yref, self.xref, self.bref)
+        elif self.builder == BLD_RULE:
+            # Setup the objective function and constraints
+            self.__model__.objective = Objective(
+                rule=self._DEA__objective_rule(), sense=maximize, doc='objective function')
+            self.__model__.input = Constraint(
+                self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
+            self.__model__.output = Constraint(
+                self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
 
-        if self.rts == RTS_VRS:
-            self.__model__.vrs = Constraint(
-                self.__model__.I, rule=self.__vrs_rule(), doc='various return to scale rule')
+            if type(b) != type(None):
+                self.__model__.undesirable_output = Constraint(
+                    self.__model__.I, self.__model__.L, rule=self.__undesirable_output_rule(), doc='undesirable output constraint')
+
+            if self.rts == RTS_VRS:
+                self.__model__.vrs = Constraint(
+                    self.__model__.I, rule=self.__vrs_rule(), doc='various return to scale rule')
+        elif self.builder != BLD_DECOMPOSED:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -207,19 +283,19 @@ class DDF(DEA):
     def __input_rule(self):
         """Return the proper input constraint"""
         def input_rule(model, o, j):
-            return self.x[o][j] - model.theta[o]*self.gx[j] >= sum(model.lamda[o, r] * self.xref[r][j] for r in model.R)
+            return self.x[o, j] - model.theta[o]*self.gx[j] >= sum(model.lamda[o, r] * self.xref[r, j] for r in model.R)
         return input_rule
 
     def __output_rule(self):
         """Return the proper output constraint"""
         def output_rule(model, o, k):
-            return self.y[o][k] + model.theta[o]*self.gy[k] <= sum(model.lamda[o, r] * self.yref[r][k] for r in model.R)
+            return self.y[o, k] + model.theta[o]*self.gy[k] <= sum(model.lamda[o, r] * self.yref[r, k] for r in model.R)
         return output_rule
 
     def __undesirable_output_rule(self):
         """Return the proper undesirable output constraint"""
         def undesirable_output_rule(model, o, l):
-            return self.b[o][l] - model.theta[o]*self.gb[l] == sum(model.lamda[o, r] * self.bref[r][l] for r in model.R)
+            return self.b[o, l] - model.theta[o]*self.gb[l] == sum(model.lamda[o, r] * self.bref[r, l] for r in model.R)
         return undesirable_output_rule
 
     def __vrs_rule(self):
@@ -230,7 +306,7 @@ class DDF(DEA):
 
 
 class DUAL(DEA):
-    def __init__(self, y, x, orient, rts, yref=None, xref=None):
+    def __init__(self, y, x, orient, rts, yref=None, xref=None, builder=BLD_RULE):
         """DEA: Multiplier problem
 
         Args:
@@ -240,12 +316,13 @@ class DUAL(DEA):
             rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale)
             yref (String, optional): reference output. Defaults to None.
             xref (String, optional): reference inputs. Defaults to None.
+            builder (String, optional): BLD_RULE (rule-based Pyomo constraints), BLD_MATRIX (sparse coefficient matrices solved by HiGHS in-process by default) or BLD_DECOMPOSED (one program per DMU, solved separately). Defaults to BLD_RULE.
         """
         # Initialize DEA model
         self.__model__ = ConcreteModel()
 
         self.y, self.x = tools.assert_valid_mupltiple_y_data(y, x)
-        self.orient, self.rts = orient, rts
+        self.orient, self.rts, self.builder = orient, rts, builder
 
         if type(yref) != type(None):
             self.yref, self.xref = tools.assert_valid_reference_data(
@@ -259,26 +336,45 @@ class DUAL(DEA):
         self.__model__.J = Set(initialize=range(len(self.x[0])))
         self.__model__.K = Set(initialize=range(len(self.y[0])))
 
-        # Initialize variable
-        self.__model__.nu = Var(self.__model__.I, self.__model__.J, bounds=(
-            0.0, None), doc='multiplier x')
-        self.__model__.mu = Var(self.__model__.I, self.__model__.K, bounds=(
-            0.0, None), doc='multiplier y')
-        if self.rts == RTS_VRS:
-            self.__model__.omega = Var(
-                self.__model__.I, doc='variable return to scale')
-
-        # Setup the objective function and constraints
-        if self.orient == ORIENT_IO:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=maximize, doc='objective function')
+        if self.builder == BLD_DECOMPOSED:
+            # Assemble the program of each DMU when optimizing, without the variables of all DMUs
+            blocks = [('nu', len(self.x[0])), ('mu', len(self.y[0]))]
+            if self.rts == RTS_VRS:
+                blocks.append(('omega', None))
+            self._DEA__decomposition = (matrix.dual_program, [self.y, self.x],
+                                        [self.orient, self.rts, self.yref, self.xref], blocks)
         else:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=minimize, doc='objective function')
-        self.__model__.first = Constraint(
-            self.__model__.I, self.__model__.R, rule=self.__first_rule(), doc='technology constraint')
-        self.__model__.second = Constraint(
-            self.__model__.I, rule=self.__second_rule(), doc='normalization constraint')
+            # Initialize variable
+            self.__model__.nu = Var(self.__model__.I, self.__model__.J, bounds=(
+                0.0, None), doc='multiplier x')
+            self.__model__.mu = Var(self.__model__.I, self.__model__.K, bounds=(
+                0.0, None), doc='multiplier y')
+            if self.rts == RTS_VRS:
+                self.__model__.omega = Var(
+                    self.__model__.I, doc='variable return to scale')
+
+            self._DEA__variables = [self.__model__.nu, self.__model__.mu]
+            if self.rts == RTS_VRS:
+                self._DEA__variables.append(self.__model__.omega)
+
+        if self.builder == BLD_MATRIX:
+            # Setup the objective function and constraints as sparse matrices
+            self._DEA__program = matrix.dual_program(
+                self.y, self.x, self.orient, self.rts, self.yref, self.xref)
+        elif self.builder == BLD_RULE:
+            # Setup the objective function and constraints
+            if self.orient == ORIENT_IO:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=maximize, doc='objective function')
+            else:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=minimize, doc='objective function')
+            self.__model__.first = Constraint(
+                self.__model__.I, self.__model__.R, rule=self.__first_rule(), doc='technology constraint')
+            self.__model__.second = Constraint(
+                self.__model__.I, rule=self.__second_rule(), doc='normalization constraint')
+        elif self.builder != BLD_DECOMPOSED:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -288,16 +384,16 @@ class DUAL(DEA):
         if self.orient == ORIENT_IO:
             def objective_rule(model):
                 if self.rts == RTS_VRS:
-                    return sum(sum(model.mu[o, k] * self.y[o][k] for o in model.I) for k in model.K) + sum(model.omega[o] for o in model.I)
+                    return sum(sum(model.mu[o, k] * self.y[o, k] for o in model.I) for k in model.K) + sum(model.omega[o] for o in model.I)
                 elif self.rts == RTS_CRS:
-                    return sum(sum(model.mu[o, k] * self.y[o][k] for o in model.I) for k in model.K)
+                    return sum(sum(model.mu[o, k] * self.y[o, k] for o in model.I) for k in model.K)
             return objective_rule
         elif self.orient == ORIENT_OO:
             def objective_rule(model):
                 if self.rts == RTS_VRS:
-                    return sum(sum(model.nu[o, j] * self.x[o][j] for o in model.I) for j in model.J) + sum(model.omega[o] for o in model.I)
+                    return sum(sum(model.nu[o, j] * self.x[o, j] for o in model.I) for j in model.J) + sum(model.omega[o] for o in model.I)
                 elif self.rts == RTS_CRS:
-                    return sum(sum(model.nu[o, j] * self.x[o][j] for o in model.I) for j in model.J)
+                    return sum(sum(model.nu[o, j] * self.x[o, j] for o in model.I) for j in model.J)
             return objective_rule
 
     def __first_rule(self):
@@ -305,73 +401,64 @@ class DUAL(DEA):
         if self.orient == ORIENT_IO:
             if self.rts == RTS_VRS:
                 def first_rule(model, o, r):
-                    return sum(model.mu[o, k] * self.yref[r][k] for k in model.K) - sum(model.nu[o, j] * self.xref[r][j] for j in model.J) + model.omega[o] <= 0
+                    return sum(model.mu[o, k] * self.yref[r, k] for k in model.K) - sum(model.nu[o, j] * self.xref[r, j] for j in model.J) + model.omega[o] <= 0
                 return first_rule
             elif self.rts == RTS_CRS:
                 def first_rule(model, o, r):
-                    return sum(model.mu[o, k] * self.yref[r][k] for k in model.K) - sum(model.nu[o, j] * self.xref[r][j] for j in model.J) <= 0
+                    return sum(model.mu[o, k] * self.yref[r, k] for k in model.K) - sum(model.nu[o, j] * self.xref[r, j] for j in model.J) <= 0
                 return first_rule
         elif self.orient == ORIENT_OO:
             if self.rts == RTS_VRS:
                 def first_rule(model, o, r):
-                    return sum(model.nu[o, j] * self.xref[r][j] for j in model.J) - sum(model.mu[o, k] * self.yref[r][k] for k in model.K) + model.omega[o] >= 0
+                    return sum(model.nu[o, j] * self.xref[r, j] for j in model.J) - sum(model.mu[o, k] * self.yref[r, k] for k in model.K) + model.omega[o] >= 0
                 return first_rule
             elif self.rts == RTS_CRS:
                 def first_rule(model, o, r):
-                    return sum(model.nu[o, j] * self.xref[r][j] for j in model.J) - sum(model.mu[o, k] * self.yref[r][k] for k in model.K) >= 0
+                    return sum(model.nu[o, j] * self.xref[r, j] for j in model.J) - sum(model.mu[o, k] * self.yref[r, k] for k in model.K) >= 0
                 return first_rule
 
     def __second_rule(self):
         """Return the proper normalization constraint"""
         if self.orient == ORIENT_IO:
             def second_rule(model, o):
-                return sum(model.nu[o, j] * self.x[o][j] for j in model.J) == 1
+                return sum(model.nu[o, j] * self.x[o, j] for j in model.J) == 1
             return second_rule
         elif self.orient == ORIENT_OO:
             def second_rule(model, o):
-                return sum(model.mu[o, k] * self.y[o][k] for k in model.K) == 1
+                return sum(model.mu[o, k] * self.y[o, k] for k in model.K) == 1
             return second_rule
 
     def display_mu(self):
         """Display mu value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.mu.display()
+        self._DEA__display('mu', self.get_mu)
 
     def display_nu(self):
         """Display nu value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.nu.display()
+        self._DEA__display('nu', self.get_nu)
 
     def display_omega(self):
         """Display omega value"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale_omega(self.rts)
-        self.__model__.omega.display()
+        self._DEA__display('omega', self.get_omega)
 
     def get_mu(self):
         """Return mu value by array"""
         tools.assert_optimized(self.optimization_status)
-        mu = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.mu),
-                                                        list(self.__model__.mu[:, :].value))])
-        mu = pd.DataFrame(mu, columns=['Name', 'Key', 'Value'])
-        mu = mu.pivot(index='Name', columns='Key', values='Value')
-        return mu.to_numpy()
+        return self._DEA__get_values('mu')
 
     def get_nu(self):
         """Return nu value by array"""
         tools.assert_optimized(self.optimization_status)
-        nu = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.nu),
-                                                        list(self.__model__.nu[:, :].value))])
-        nu = pd.DataFrame(nu, columns=['Name', 'Key', 'Value'])
-        nu = nu.pivot(index='Name', columns='Key', values='Value')
-        return nu.to_numpy()
+        return self._DEA__get_values('nu')
 
     def get_omega(self):
         """Return omega value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_various_return_to_scale_omega(self.rts)
-        omega = list(self.__model__.omega[:].value)
-        return np.asarray(omega)
+        return self._DEA__get_values('omega')
 
     def get_efficiency(self):
         """Return efficiency value by array"""
@@ -1,16 +1,16 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, maximize, Constraint, Binary
 import numpy as np
-import pandas as pd
-from .constant import CET_ADDI, ORIENT_IO, ORIENT_OO, OPT_DEFAULT, OPT_LOCAL
-from .utils import tools
+from scipy import sparse
+from .constant import CET_ADDI, ORIENT_IO, ORIENT_OO, RTS_VRS, OPT_DEFAULT, OPT_LOCAL, BLD_RULE, BLD_MATRIX, BLD_ENUMERATED
+from .utils import tools, matrix, enumeration
 
 
 class FDH:
     """Free Disposal Hull (FDH)
     """
 
-    def __init__(self, y, x, orient, yref=None, xref=None):
+    def __init__(self, y, x, orient, yref=None, xref=None, builder=BLD_ENUMERATED):
         """FDH model
 
         Args:
@@ -19,10 +19,11 @@ class FDH:
             orient (String): ORIENT_IO (input orientation) or ORIENT_OO (output orientation)
             yref (String, optional): reference output. Defaults to None.
             xref (String, optional): reference inputs. Defaults to None.
+            builder (String, optional): BLD_ENUMERATED (exact enumeration of the reference DMUs without a solver), BLD_RULE (rule-based Pyomo constraints) or BLD_MATRIX (sparse coefficient matrices solved by HiGHS in-process by default). Defaults to BLD_ENUMERATED.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
         self.y, self.x = tools.assert_valid_mupltiple_y_data(y, x)
-        self.orient = orient
+        self.orient, self.builder = orient, builder
 
         if type(yref) != type(None):
             self.yref, self.xref = tools.assert_valid_reference_data(
@@ -39,24 +40,37 @@ class FDH:
         self.__model__.J = Set(initialize=range(len(self.x[0])))
         self.__model__.K = Set(initialize=range(len(self.y[0])))
 
-        # Initialize variable
-        self.__model__.theta = Var(self.__model__.I, doc='efficiency')
-        self.__model__.lamda = Var(
-            self.__model__.I, self.__model__.R, within=Binary, doc='intensity variables')
-
-        # Setup the objective function and constraints
-        if self.orient == ORIENT_IO:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=minimize, doc='objective function')
+        if self.builder == BLD_ENUMERATED:
+            if self.orient not in (ORIENT_IO, ORIENT_OO):
+                raise ValueError("Undefined model parameters.")
         else:
-            self.__model__.objective = Objective(
-                rule=self.__objective_rule(), sense=maximize, doc='objective function')
-        self.__model__.input = Constraint(
-            self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
-        self.__model__.output = Constraint(
-            self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
-        self.__model__.vrs = Constraint(
-            self.__model__.I, rule=self.__vrs_rule(), doc='variable return to scale rule')
+            # Initialize variable
+            self.__model__.theta = Var(self.__model__.I, doc='efficiency')
+            self.__model__.lamda = Var(
+                self.__model__.I, self.__model__.R, within=Binary, doc='intensity variables')
+
+            self.__variables = [self.__model__.theta, self.__model__.lamda]
+
+        if self.builder == BLD_MATRIX:
+            # Setup the objective function and constraints as sparse matrices
+            self.__program = matrix.dea_program(
+                self.y, self.x, self.orient, RTS_VRS, self.yref, self.xref, integer=True)
+        elif self.builder == BLD_RULE:
+            # Setup the objective function and constraints
+            if self.orient == ORIENT_IO:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=minimize, doc='objective function')
+            else:
+                self.__model__.objective = Objective(
+                    rule=self.__objective_rule(), sense=maximize, doc='objective function')
+            self.__model__.input = Constraint(
+                self.__model__.I, self.__model__.J, rule=self.__input_rule(), doc='input constraint')
+            self.__model__.output = Constraint(
+                self.__model__.I, self.__model__.K, rule=self.__output_rule(), doc='output constraint')
+            self.__model__.vrs = Constraint(
+                self.__model__.I, rule=self.__vrs_rule(), doc='variable return to scale rule')
+        elif self.builder != BLD_ENUMERATED:
+            raise ValueError("Undefined model builder.")
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
@@ -73,22 +87,22 @@ class FDH:
         """Return the proper input constraint"""
         if self.orient == ORIENT_IO:
             def input_rule(model, o, j):
-                return model.theta[o]*self.x[o][j] >= sum(model.lamda[o, r]*self.xref[r][j] for r in model.R)
+                return model.theta[o]*self.x[o, j] >= sum(model.lamda[o, r]*self.xref[r, j] for r in model.R)
             return input_rule
         elif self.orient == ORIENT_OO:
             def input_rule(model, o, j):
-                return sum(model.lamda[o, r] * self.xref[r][j] for r in model.R) <= self.x[o][j]
+                return sum(model.lamda[o, r] * self.xref[r, j] for r in model.R) <= self.x[o, j]
             return input_rule
 
     def __output_rule(self):
         """Return the proper output constraint"""
         if self.orient == ORIENT_IO:
             def output_rule(model, o, k):
-                return sum(model.lamda[o, r] * self.yref[r][k] for r in model.R) >= self.y[o][k]
+                return sum(model.lamda[o, r] * self.yref[r, k] for r in model.R) >= self.y[o, k]
             return output_rule
         elif self.orient == ORIENT_OO:
             def output_rule(model, o, k):
-                return model.theta[o]*self.y[o][k] <= sum(model.lamda[o, r]*self.yref[r][k] for r in model.R)
+                return model.theta[o]*self.y[o, k] <= sum(model.lamda[o, r]*self.yref[r, k] for r in model.R)
             return output_rule
 
     def __vrs_rule(self):
@@ -104,6 +118,20 @@ class FDH:
             solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
         """
         # TODO(error/warning handling): Check problem status after optimization
+        if self.builder == BLD_ENUMERATED:
+            theta, peer = enumeration.fdh(self.y, self.x, self.orient, self.yref, self.xref)
+            found = np.flatnonzero(peer >= 0)
+            self.__values = {'theta': theta,
+                             'lamda': sparse.csr_matrix((np.ones(len(found)), (found, peer[found])),
+                                                        shape=(len(self.y), len(self.yref)))}
+            self.problem_status = "optimal" if len(found) == len(self.y) else "infeasible"
+            self.optimization_status = 1 if self.problem_status == "optimal" else 0
+            return
+        if self.builder == BLD_MATRIX:
+            solution, self.problem_status = self.__program.solve(email, solver)
+            matrix.load_solution(self.__variables, solution)
+            self.optimization_status = 1 if self.problem_status == "optimal" else 0
+            return
         self.problem_status, self.optimization_status = tools.optimize_model(
             self.__model__, email, CET_ADDI, solver)
 
@@ -114,12 +142,12 @@ class FDH:
     def display_theta(self):
         """Display theta value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.theta.display()
+        self.__display('theta')
 
     def display_lamda(self):
         """Display lamda value"""
         tools.assert_optimized(self.optimization_status)
-        self.__model__.lamda.display()
+        self.__display('lamda')
 
     def get_status(self):
         """Return status"""
@@ -128,14 +156,23 @@ class FDH:
     def get_theta(self):
         """Return theta value by array"""
         tools.assert_optimized(self.optimization_status)
-        theta = list(self.__model__.theta[:].value)
-        return np.asarray(theta)
+        return self.__get_values('theta')
 
     def get_lamda(self):
         """Return lamda value by array"""
         tools.assert_optimized(self.optimization_status)
-        lamda = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.lamda),
-                                                           list(self.__model__.lamda[:, :].value))])
-        lamda = pd.DataFrame(lamda, columns=['Name', 'Key', 'Value'])
-        lamda = lamda.pivot(index='Name', columns='Key', values='Value')
-        return lamda.to_numpy()
+        return self.__get_values('lamda')
+
+    def __display(self, name):
+        """Display the named variable, or its values if the model does not keep it"""
+        if self.builder == BLD_ENUMERATED:
+            tools.display_values(name, self.__get_values(name))
+            return
+        getattr(self.__model__, name).display()
+
+    def __get_values(self, name):
+        """Return the values of the named variable by array"""
+        if self.builder == BLD_ENUMERATED:
+            values = self.__values[name]
+            return values.toarray() if sparse.issparse(values) else values.copy()
+        return tools.get_values(getattr(self.__model__, name))
@@ -1,9 +1,11 @@
 # import dependencies
-from pyomo.environ import Constraint
+from pyomo.environ import Set, Constraint
 from pyomo.core.expr.numvalue import NumericValue
 import numpy as np
+from scipy import sparse
 from . import CNLS
-from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS
+from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, BLD_RULE
+from .utils.sweet import pairs
 
 
 class ICNLS(CNLS.CNLS):
@@ -20,12 +22,13 @@ class ICNLS(CNLS.CNLS):
             fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
-        super().__init__(y, x, z, cet, fun, rts)
+        super().__init__(y, x, z, cet, fun, rts, BLD_RULE)
 
+    def _shape_constraints(self):
+        """Add the isotonic afriat inequality on the dominance pairs only"""
         self.__pmatrix = self.__binaryMatrix()
-        self.__model__.afriat_rule.deactivate()
-        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.I,
-                                                         self.__model__.I,
+        self.__model__.P = Set(initialize=pairs(self.__pmatrix), dimen=2)
+        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.P,
                                                          rule=self.__isotonic_afriat_rule(),
                                                          doc='isotonic afriat inequality')
 
@@ -40,13 +43,11 @@ class ICNLS(CNLS.CNLS):
             if self.rts == RTS_VRS:
 
                 def afriat_rule(model, i, h):
-                    if i == h or self.__pmatrix[i][h] == 0:
-                        return Constraint.Skip
                     return __operator(
-                        self.__pmatrix[i][i] * (model.alpha[i] + sum(
-                            model.beta[i, j] * self.x[i][j] for j in model.J)),
-                        self.__pmatrix[i][h] * (model.alpha[h] + sum(
-                            model.beta[h, j] * self.x[i][j] for j in model.J))
+                        model.alpha[i] + sum(
+                            model.beta[i, j] * self.x[i, j] for j in model.J),
+                        model.alpha[h] + sum(
+                            model.beta[h, j] * self.x[i, j] for j in model.J)
                     )
 
                 return afriat_rule
@@ -54,13 +55,9 @@ class ICNLS(CNLS.CNLS):
             elif self.rts == RTS_CRS:
 
                 def afriat_rule(model, i, h):
-                    if i == h or self.__pmatrix[i][h] == 0:
-                        return Constraint.Skip
                     return __operator(
-                        self.__pmatrix[i][i] * sum(
-                            model.beta[i, j] * self.x[i][j] for j in model.J),
-                        self.__pmatrix[i][h] * sum(
-                            model.beta[h, j] * self.x[i][j] for j in model.J)
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J)
                     )
 
                 return afriat_rule
@@ -68,13 +65,11 @@ class ICNLS(CNLS.CNLS):
             if self.rts == RTS_VRS:
 
                 def afriat_rule(model, i, h):
-                    if (i == h) or (self.__pmatrix[i][h] == 0):
-                        return Constraint.Skip
                     return __operator(
-                        self.__pmatrix[i][i] * (model.alpha[i] + sum(
-                            model.beta[i, j] * self.x[i][j] for j in model.J)),
-                        self.__pmatrix[i][h] * (model.alpha[h] + sum(
-                            model.beta[h, j] * self.x[i][j] for j in model.J))
+                        model.alpha[i] + sum(
+                            model.beta[i, j] * self.x[i, j] for j in model.J),
+                        model.alpha[h] + sum(
+                            model.beta[h, j] * self.x[i, j] for j in model.J)
                     )
 
                 return afriat_rule
@@ -82,13 +77,9 @@ class ICNLS(CNLS.CNLS):
             elif self.rts == RTS_CRS:
 
                 def afriat_rule(model, i, h):
-                    if (i == h) or (self.__pmatrix[i][h] == 0):
-                        return Constraint.Skip
                     return __operator(
-                        self.__pmatrix[i][i] * (sum(model.beta[i, j]
-                                                    * self.x[i][j] for j in model.J)),
-                        self.__pmatrix[i][h] * (sum(model.beta[h, j]
-                                                    * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J)
                     )
 
                 return afriat_rule
@@ -96,19 +87,37 @@ class ICNLS(CNLS.CNLS):
         # TODO(error handling): replace with undefined model attribute
         return False
 
-    def __binaryMatrix(self):
-        """generating binary matrix P"""
+    def __binaryMatrix(self, block_size=None):
+        """generating binary matrix P
+
+        P[i, h] = 1 if x_i <= x_h in every input. The observations are sorted by the first
+        input, so that each block of rows is only compared with the observations from the
+        block on, and the pairs are stored in a sparse matrix.
+
+        Args:
+            block_size (int, optional): number of rows compared at once. Defaults to about 2**22 comparisons per block.
+        """
         # transform data
-        x = np.array(self.x)
+        x = np.asarray(self.x, dtype=float)
 
         # number of DMUs
-        n, m = len(x), len(x[0])
-
-        # binary matrix P
-        p = np.zeros((n, n))
-        for i in range(n):
-            pmap = (x[i, 0] <= x[:, 0])
-            for j in range(1, m):
-                pmap = pmap & (x[i, j] <= x[:, j])
-            p[i, :] = np.where(pmap, 1, 0)
-        return p.tolist()
+        n = len(x)
+        if block_size is None:
+            block_size = max(1, 2 ** 22 // (n * x.shape[1]))
+
+        order = np.argsort(x[:, 0], kind="stable")
+        x = x[order]
+        rows, cols = [], []
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            # only the observations with at least the smallest first input of the block
+            first = np.searchsorted(x[:, 0], x[start, 0], side="left")
+            pmap = np.all(x[start:stop, None, :] <= x[None, first:, :], axis=2)
+            i, h = np.nonzero(pmap)
+            rows.append(order[i + start])
+            cols.append(order[h + first])
+
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        p = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+        p.sort_indices()
+        return p
@@ -1,7 +1,6 @@
 # import dependencies
 from . import CQER, ICNLS
-from pyomo.environ import Constraint
-from .constant import CET_ADDI, FUN_PROD, RTS_VRS
+from .constant import CET_ADDI, FUN_PROD, RTS_VRS, BLD_RULE
 
 
 class ICQR(ICNLS.ICNLS, CQER.CQR):
@@ -20,14 +19,7 @@ class ICQR(ICNLS.ICNLS, CQER.CQR):
              fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
              rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
-        CQER.CQR.__init__(self, y, x, tau, z, cet, fun, rts)
-
-        self._ICNLS__pmatrix = self._ICNLS__binaryMatrix()
-        self.__model__.afriat_rule.deactivate()
-        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.I,
-                                                         self.__model__.I,
-                                                         rule=self._ICNLS__isotonic_afriat_rule(),
-                                                         doc='isotonic afriat inequality')
+        CQER.CQR.__init__(self, y, x, tau, z, cet, fun, rts, BLD_RULE)
 
 
 class ICER(ICNLS.ICNLS, CQER.CER):
@@ -45,11 +37,4 @@ class ICER(ICNLS.ICNLS, CQER.CER):
              fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
              rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
-        CQER.CER.__init__(self, y, x, tau, z, cet, fun, rts)
-
-        self._ICNLS__pmatrix = self._ICNLS__binaryMatrix()
-        self.__model__.afriat_rule.deactivate()
-        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.I,
-                                                         self.__model__.I,
-                                                         rule=self._ICNLS__isotonic_afriat_rule(),
-                                                         doc='isotonic afriat inequality')
+        CQER.CER.__init__(self, y, x, tau, z, cet, fun, rts, BLD_RULE)
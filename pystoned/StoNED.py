@@ -3,6 +3,7 @@ import numpy as np
 from math import sqrt, pi, log
 import scipy.stats as stats
 import scipy.optimize as opt
+import scipy.signal as signal
 from .utils import tools, unihyper
 from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RED_MOM, RED_QLE, RED_KDE
 
@@ -25,10 +26,12 @@ class StoNED:
         else:
             self.y = self.model.y
 
-    def get_unconditional_expected_inefficiency(self, method=RED_MOM):
+    def get_unconditional_expected_inefficiency(self, method=RED_MOM, bandwidth=None, grid_size=4096):
         """
         Args:
             method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation) or RED_KDE (Kernel deconvolution estimation). Defaults to RED_MOM.
+            bandwidth (float, optional): bandwidth of the kernel density with RED_KDE. Defaults to None, the rule-of-thumb bandwidth of Silverman (1986).
+            grid_size (int, optional): number of grid points of the binned kernel density with RED_KDE, or None to evaluate the density at every residual exactly. Defaults to 4096.
         """
         tools.assert_optimized(self.model.optimization_status)
         if method == RED_MOM:
@@ -36,20 +39,23 @@ class StoNED:
         elif method == RED_QLE:
             self.__quassi_likelihood(self.model.get_residual())
         elif method == RED_KDE:
-            self.__gaussian_kernel_estimation(self.model.get_residual())
+            self.__gaussian_kernel_estimation(
+                self.model.get_residual(), bandwidth, grid_size)
         else:
             raise ValueError("Undefined estimation technique.")
         return self.mu
 
-    def get_technical_inefficiency(self, method=RED_MOM):
+    def get_technical_inefficiency(self, method=RED_MOM, bandwidth=None, grid_size=4096):
         """
         Args:
-            method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation). Defaults to RED_MOM.
+            method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation) or RED_KDE (Kernel deconvolution estimation). Defaults to RED_MOM.
+            bandwidth (float, optional): bandwidth of the kernel density with RED_KDE. Defaults to None, the rule-of-thumb bandwidth of Silverman (1986).
+            grid_size (int, optional): number of grid points of the binned kernel density with RED_KDE, or None to evaluate the density at every residual exactly. Defaults to 4096.
 
         calculate sigma_u, sigma_v, mu, and epsilon value
         """
         tools.assert_optimized(self.model.optimization_status)
-        self.get_unconditional_expected_inefficiency(method)
+        self.get_unconditional_expected_inefficiency(method, bandwidth, grid_size)
         sigma = self.sigma_u * self.sigma_v / sqrt(self.sigma_u ** 2 +
                                                    self.sigma_v ** 2)
         mu = self.epsilon * self.sigma_u / (
@@ -160,31 +166,46 @@ class StoNED:
         elif self.model.fun == FUN_COST:
             self.epsilon = residual + self.mu
 
-    def __gaussian_kernel_estimation(self, residual):
+    def __gaussian_kernel_estimation(self, residual, bandwidth=None, grid_size=4096):
         def __gaussian_kernel_estimator(g):
             """Gaussian kernel estimator"""
             return (1 / sqrt(2 * pi)) * np.exp(-0.5 * g ** 2)
 
         x = np.array(residual)
         x = np.sort(x)
+        n = len(self.y)
 
         # choose a bandwidth (rule-of-thumb, Eq. (3.29) in Silverman (1986))
-        if np.std(x, ddof=1) < stats.iqr(x, interpolation='midpoint'):
-            estimated_sigma = np.std(x, ddof=1)
+        if bandwidth is not None:
+            h = bandwidth
         else:
-            estimated_sigma = stats.iqr(x, interpolation='midpoint')
-        h = 1.06 * estimated_sigma * len(self.y) ** (-1 / 5)
-
-        # kernel matrix
-        kernel_matrix = np.zeros((len(self.y), len(self.y)))
-        for i in range(len(self.y)):
-            kernel_matrix[i] = np.array([
-                __gaussian_kernel_estimator(g=((x[i] - x[j]) / h)) /
-                (len(self.y) * h) for j in range(len(self.y))
-            ])
-
-        # kernel density value
-        kernel_density_value = np.sum(kernel_matrix, axis=0)
+            if np.std(x, ddof=1) < stats.iqr(x, interpolation='midpoint'):
+                estimated_sigma = np.std(x, ddof=1)
+            else:
+                estimated_sigma = stats.iqr(x, interpolation='midpoint')
+            h = 1.06 * estimated_sigma * n ** (-1 / 5)
+
+        if grid_size is None or x[-1] == x[0]:
+            # kernel density value, summing the kernel matrix by row blocks
+            kernel_density_value = np.zeros(n)
+            block_size = max(1, 2 ** 22 // n)
+            for start in range(0, n, block_size):
+                kernel_density_value += np.sum(__gaussian_kernel_estimator(
+                    g=(x[start:start + block_size, None] - x[None, :]) / h), axis=0) / (n * h)
+        else:
+            # linear binning of the residuals on an equally spaced grid
+            grid, delta = np.linspace(x[0], x[-1], grid_size, retstep=True)
+            position = np.minimum((x - x[0]) / delta, grid_size - 1)
+            k = np.minimum(np.floor(position).astype(int), grid_size - 2)
+            share = position - k
+            counts = np.bincount(k, weights=1 - share, minlength=grid_size) \
+                + np.bincount(k + 1, weights=share, minlength=grid_size)
+
+            # kernel density value on the grid by FFT convolution, interpolated at the residuals
+            kernel = __gaussian_kernel_estimator(
+                g=np.arange(-(grid_size - 1), grid_size) * delta / h) / (n * h)
+            density = signal.fftconvolve(counts, kernel, mode='valid')
+            kernel_density_value = np.interp(x, grid, density)
 
         # unconditional expected inefficiency mu
         derivative = np.zeros(len(self.y))
@@ -198,17 +219,29 @@ class StoNED:
         if self.model.fun == FUN_COST:
             self.mu *= -1
 
-    def get_stoned(self, method=RED_MOM):
+        # half-normal inefficiency with mean mu, and the rest of the variance is noise
+        self.sigma_u = self.mu / sqrt(2 / pi)
+        self.sigma_v = (np.mean((x - np.mean(x)) ** 2) - ((pi - 2) / pi) *
+                        self.sigma_u ** 2) ** (1 / 2)
+        if self.model.fun == FUN_PROD:
+            self.epsilon = residual - self.mu
+        else:
+            self.epsilon = residual + self.mu
+
+    def get_stoned(self, method=RED_MOM, processes=1, bandwidth=None, grid_size=4096):
         """
         Args:
-            method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation). Defaults to RED_MOM.
+            method (String, optional): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation) or RED_KDE (Kernel deconvolution estimation). Defaults to RED_MOM.
+            processes (int, optional): number of worker processes computing the minimal hyperplanes. Defaults to 1.
+            bandwidth (float, optional): bandwidth of the kernel density with RED_KDE. Defaults to None, the rule-of-thumb bandwidth of Silverman (1986).
+            grid_size (int, optional): number of grid points of the binned kernel density with RED_KDE, or None to evaluate the density at every residual exactly. Defaults to 4096.
 
         Calculate the StoNED frontier
         """
         tools.assert_optimized(self.model.optimization_status)
-        self.get_unconditional_expected_inefficiency(method)
+        self.get_unconditional_expected_inefficiency(method, bandwidth, grid_size)
 
-        gmin = unihyper.gmin(self.x, self.model.get_frontier(), self.model.rts)
+        gmin = unihyper.gmin(self.x, self.model.get_frontier(), self.model.rts, processes)
         if self.model.fun == FUN_PROD:
             if self.model.cet == CET_ADDI:
                 return gmin + self.sigma_u * sqrt(2 / pi)
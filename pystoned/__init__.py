@@ -1,30 +1,7 @@
-from . import CNLS
-from . import CNLSDDF
-from . import CNLSG
-from . import CNLSRDF
-from . import constant
-from . import CQER
-from . import CQERDDF
-from . import CQERG
-from . import CSVR
-from . import dataset
-from . import DEA
-from . import FDH
-from . import pCNLS
-from . import pCQER
-from . import pICQER
-from . import pwCNLS
-from . import pwCQER
-from . import plot
-from . import ICNLS
-from . import ICQER
-from . import sCQER
-from . import StoNED
-from . import wCNLS
-from . import wCQER
-from . import weakCNLS
+from importlib import import_module
 
 __all__ = [
+    'Bootstrap',
     'CNLS',
     'CNLSDDF',
     'CNLSG',
@@ -50,4 +27,12 @@ __all__ = [
     'wCNLS',
     'wCQER',
     'weakCNLS',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # import the modules on first access, so that light modules do not pull in pyomo
+    if name in __all__:
+        return import_module("." + name, __name__)
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
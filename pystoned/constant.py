@@ -89,9 +89,69 @@ RED_Categories = {
     RED_KDE: "Kernel deconvolution estimation"
 }
 
+# Bootstrap resampling
+BTS_RESIDUAL = "residual"
+"""
+BTS_RESIDUAL: Residual bootstrap, resampling the residuals around the fitted frontier.
+"""
+
+BTS_PAIRS = "pairs"
+"""
+BTS_PAIRS: Pairs bootstrap, resampling the DMUs with all their data.
+"""
+
+BTS_Categories = {
+    BTS_RESIDUAL: "Residual bootstrap",
+    BTS_PAIRS: "Pairs bootstrap"
+}
+
 # Optimization
 OPT_LOCAL = "local"
 OPT_DEFAULT = None
+OPT_NATIVE = "native"
+"""
+OPT_NATIVE: Built-in interior point solver for the additive models, without an external solver.
+"""
+
+# Model builder
+BLD_RULE = "rule"
+"""
+BLD_RULE: Rule-based Pyomo constraints.
+"""
+
+BLD_MATRIX = "matrix"
+"""
+BLD_MATRIX: Sparse coefficient matrices handed to the solver in bulk.
+"""
+
+BLD_UNIVARIATE = "univariate"
+"""
+BLD_UNIVARIATE: Exact univariate engine for a single input, without a solver.
+"""
+
+BLD_DECOMPOSED = "decomposed"
+"""
+BLD_DECOMPOSED: One program per DMU, solved separately against the same reference technology.
+"""
+
+BLD_ENUMERATED = "enumerated"
+"""
+BLD_ENUMERATED: Exact enumeration of the reference DMUs for FDH, without a solver.
+"""
+
+BLD_AUTO = "auto"
+"""
+BLD_AUTO: Exact univariate engine if applicable, rule-based Pyomo constraints otherwise.
+"""
+
+BLD_Categories = {
+    BLD_RULE: "Rule-based Pyomo constraints",
+    BLD_MATRIX: "Sparse coefficient matrices",
+    BLD_UNIVARIATE: "Exact univariate engine",
+    BLD_DECOMPOSED: "One program per DMU",
+    BLD_ENUMERATED: "Exact enumeration engine",
+    BLD_AUTO: "Automatic selection of the builder"
+}
 
 # Radial distance function
 RDF_DI = "DI"
@@ -1,7 +1,7 @@
 # import dependencies
-from pyomo.environ import Objective, minimize, Constraint
+from pyomo.environ import Param, Objective, minimize, Constraint
 from . import CNLS
-from .constant import CET_ADDI, FUN_PROD, RTS_VRS
+from .constant import CET_ADDI, FUN_PROD, RTS_VRS, BLD_RULE, OPT_DEFAULT, OPT_LOCAL
 
 
 class pCNLS(CNLS.CNLS):
@@ -21,8 +21,9 @@ class pCNLS(CNLS.CNLS):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
             penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
-        self.eta = eta
-        CNLS.CNLS.__init__(self, y, x, z, cet, fun, rts)
+        self.eta, self.penalty = eta, penalty
+        CNLS.CNLS.__init__(self, y, x, z, cet, fun, rts, BLD_RULE)
+        self.__model__.eta = Param(initialize=eta, mutable=True, doc='penalty weight')
         if penalty == 1 or penalty == 2:
             self.__model__.objective.deactivate()
 
@@ -46,7 +47,7 @@ class pCNLS(CNLS.CNLS):
 
         def objective_rule(model):
             return sum(model.epsilon[i] ** 2 for i in model.I) \
-                + self.eta * sum(model.beta[ij] for ij in model.I * model.J)
+                + model.eta * sum(model.beta[ij] for ij in model.I * model.J)
 
         return objective_rule
 
@@ -55,7 +56,7 @@ class pCNLS(CNLS.CNLS):
 
         def objective_rule(model):
             return sum(model.epsilon[i] ** 2 for i in model.I) \
-                + self.eta * sum(model.beta[ij] **
+                + model.eta * sum(model.beta[ij] **
                                  2 for ij in model.I * model.J)
 
         return objective_rule
@@ -64,6 +65,48 @@ class pCNLS(CNLS.CNLS):
         """Lipschitz norm"""
 
         def lipschitz_rule(model, i):
-            return sum(model.beta[i, j] ** 2 for j in model.J) <= self.eta**2
+            return sum(model.beta[i, j] ** 2 for j in model.J) <= model.eta ** 2
 
-        return lipschitz_rule
\ No newline at end of file
+        return lipschitz_rule
+
+    def refit(self, y=None, eta=None, email=OPT_LOCAL, solver=OPT_DEFAULT):
+        """Optimize the model again for new values of the output variable and of the penalty weight
+
+        Args:
+            y (float, optional): output variable, one value per DMU. Defaults to None, which keeps the outputs.
+            eta (float, optional): penalty weight. Defaults to None, which keeps the penalty weight.
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        """
+        constraints = self._CNLS__update_outputs(y)
+        if eta is not None:
+            self.eta = eta
+            self.__model__.eta.set_value(eta)
+            if self.penalty == 3:
+                constraints += list(self.__model__.lipschitz_norm.values())
+        self._CNLS__resolve(constraints, eta is not None and self.penalty != 3, email, solver)
+
+    def path(self, etas, folds=None, seed=None, email=OPT_LOCAL, solver=OPT_DEFAULT):
+        """Estimate the model along a grid of penalty weights
+
+        The model is kept and refitted for each eta in the given order, so that only the
+        penalty term changes and each solve starts from the state of the previous one. The
+        model is left at the last eta. With folds, the DMUs are split at random into folds,
+        and the cross-validated error of each eta is the mean squared error of the outputs
+        of each fold, predicted by the path estimated on the other folds.
+
+        Args:
+            etas (float): penalty weights, preferably sorted so that neighboring solutions are alike.
+            folds (int, optional): number of cross-validation folds. Defaults to None, without cross validation.
+            seed (int, optional): seed of the random split into folds. Defaults to None.
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+
+        Returns:
+            tuple: alpha (None under RTS_CRS), beta and residual, stacked by eta, and the cross-validated error of each eta (None without folds).
+        """
+        return self._CNLS__path(
+            [{'eta': eta} for eta in etas],
+            lambda train: pCNLS(self.y[train], self.x[train], etas[0], None,
+                                self.cet, self.fun, self.rts, self.penalty),
+            folds, seed, email, solver)
@@ -1,7 +1,7 @@
 # import dependencies
 from pyomo.environ import Objective, minimize, Constraint
 from . import CQER
-from .constant import CET_ADDI, FUN_PROD, RTS_VRS
+from .constant import CET_ADDI, FUN_PROD, RTS_VRS, BLD_RULE
 
 
 class pCQR(CQER.CQR):
@@ -22,8 +22,8 @@ class pCQR(CQER.CQR):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
             penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
-        self.eta = eta
-        CQER.CQR.__init__(self, y, x, tau, z, cet, fun, rts)
+        self.eta, self.penalty = eta, penalty
+        CQER.CQR.__init__(self, y, x, tau, z, cet, fun, rts, BLD_RULE)
         if penalty == 1 or penalty == 2:
             self.__model__.objective.deactivate()
 
@@ -46,8 +46,8 @@ class pCQR(CQER.CQR):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * sum(model.epsilon_minus[i] for i in model.I) \
+            return model.tau * sum(model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * sum(model.epsilon_minus[i] for i in model.I) \
                 + self.eta * sum(model.beta[ij] for ij in model.I * model.J)
 
         return objective_rule
@@ -56,8 +56,8 @@ class pCQR(CQER.CQR):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * sum(model.epsilon_minus[i] for i in model.I) \
+            return model.tau * sum(model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * sum(model.epsilon_minus[i] for i in model.I) \
                 + self.eta * sum(model.beta[ij] **
                                  2 for ij in model.I * model.J)
 
@@ -90,8 +90,8 @@ class pCER(CQER.CER):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
             penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
-        self.eta = eta
-        CQER.CER.__init__(self, y, x, tau, z, cet, fun, rts)
+        self.eta, self.penalty = eta, penalty
+        CQER.CER.__init__(self, y, x, tau, z, cet, fun, rts, BLD_RULE)
         if penalty == 1 or penalty == 2:
             self.__model__.squared_objective.deactivate()
 
@@ -114,8 +114,8 @@ class pCER(CQER.CER):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * sum(model.epsilon_minus[i] ** 2 for i in model.I) \
+            return model.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * sum(model.epsilon_minus[i] ** 2 for i in model.I) \
                 + self.eta * sum(model.beta[ij] for ij in model.I * model.J)
 
         return objective_rule
@@ -124,8 +124,8 @@ class pCER(CQER.CER):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * sum(model.epsilon_minus[i] ** 2 for i in model.I) \
+            return model.tau * sum(model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * sum(model.epsilon_minus[i] ** 2 for i in model.I) \
                 + self.eta * sum(model.beta[ij] **
                                  2 for ij in model.I * model.J)
 
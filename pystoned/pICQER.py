@@ -1,6 +1,5 @@
 # import dependencies
 from . import pCQER, ICNLS
-from pyomo.environ import Constraint
 from .constant import CET_ADDI, FUN_PROD, RTS_VRS
 
 
@@ -24,13 +23,6 @@ class pICQR(ICNLS.ICNLS, pCQER.pCQR):
         """
         pCQER.pCQR.__init__(self, y, x, tau, eta, z, cet, fun, rts, penalty)
 
-        self._ICNLS__pmatrix = self._ICNLS__binaryMatrix()
-        self.__model__.afriat_rule.deactivate()
-        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.I,
-                                                         self.__model__.I,
-                                                         rule=self._ICNLS__isotonic_afriat_rule(),
-                                                         doc='isotonic afriat inequality')
-
 
 class pICER(ICNLS.ICNLS, pCQER.pCER):
     """penalized isotonic convex expectile regression (pICER)
@@ -51,10 +43,3 @@ class pICER(ICNLS.ICNLS, pCQER.pCER):
              penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
         pCQER.pCER.__init__(self, y, x, tau, eta, z, cet, fun, rts, penalty)
-
-        self._ICNLS__pmatrix = self._ICNLS__binaryMatrix()
-        self.__model__.afriat_rule.deactivate()
-        self.__model__.isotonic_afriat_rule = Constraint(self.__model__.I,
-                                                         self.__model__.I,
-                                                         rule=self._ICNLS__isotonic_afriat_rule(),
-                                                         doc='isotonic afriat inequality')
@@ -105,13 +105,10 @@ def plot3d(model, x_select_1=0, x_select_2=1, fig_name=None, line_transparent=Fa
     xlin2 = np.linspace(min(x[x_select_2]), max(x[x_select_2]), 30)
     XX, YY = np.meshgrid(xlin1, xlin2)
 
-    ZZ = np.zeros((len(XX), len(XX)))
-    for i in range(len(XX)):
-        for j in range(len(XX)):
-            ZZ[i, j] = interpolation.interpolation(alpha, beta,
-                                                   x=np.array(
-                                                       [XX[i, j], YY[i, j]], ndmin=2),
-                                                   fun=model.fun)
+    ZZ = interpolation.interpolation(alpha, beta,
+                                     x=np.column_stack(
+                                         [XX.ravel(), YY.ravel()]),
+                                     fun=model.fun).reshape(XX.shape)
 
     ax.plot_surface(XX, YY, ZZ, rstride=1, cstride=1, cmap='viridis',
                     edgecolor='none', alpha=0.5)
@@ -24,7 +24,7 @@ class pwCQR(wCQER.wCQR):
             penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
-        self.eta = eta
+        self.eta, self.penalty = eta, penalty
         wCQER.wCQR.__init__(self, y, x, w, tau, z, cet, fun, rts)
         if penalty == 1 or penalty == 2:
             self.__model__.weighted_objective.deactivate()
@@ -48,8 +48,8 @@ class pwCQR(wCQER.wCQR):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * sum(self.w[i] * model.epsilon_minus[i] for i in model.I) \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * sum(self.w[i] * model.epsilon_minus[i] for i in model.I) \
                 + self.eta * sum(model.beta[ij] for ij in model.I * model.J)
 
         return objective_rule
@@ -58,8 +58,8 @@ class pwCQR(wCQER.wCQR):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * sum(self.w[i] * model.epsilon_minus[i] for i in model.I) \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * sum(self.w[i] * model.epsilon_minus[i] for i in model.I) \
                 + self.eta * sum(model.beta[ij] **
                                  2 for ij in model.I * model.J)
 
@@ -93,7 +93,7 @@ class pwCER(wCQER.wCER):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
             penalty (int, optional): penalty=1 (L1 norm), penalty=2 (L2 norm), and penalty=3 (Lipschitz norm). Defaults to 1.
         """
-        self.eta = eta
+        self.eta, self.penalty = eta, penalty
         wCQER.wCER.__init__(self, y, x, w, tau, z, cet, fun, rts)
         if penalty == 1 or penalty == 2:
             self.__model__.weighted_squared_objective.deactivate()
@@ -117,8 +117,8 @@ class pwCER(wCQER.wCER):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * sum(self.w[i] * model.epsilon_minus[i] ** 2 for i in model.I) \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * sum(self.w[i] * model.epsilon_minus[i] ** 2 for i in model.I) \
                 + self.eta * sum(model.beta[ij] for ij in model.I * model.J)
 
         return objective_rule
@@ -127,8 +127,8 @@ class pwCER(wCQER.wCER):
         """Return the proper objective function"""
 
         def objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * sum(self.w[i] * model.epsilon_minus[i] ** 2 for i in model.I) \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * sum(self.w[i] * model.epsilon_minus[i] ** 2 for i in model.I) \
                 + self.eta * sum(model.beta[ij] **
                                  2 for ij in model.I * model.J)
 
@@ -1,7 +1,6 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint
 import numpy as np
-import pandas as pd
 
 from .constant import CET_ADDI, OPT_LOCAL, OPT_DEFAULT
 from .utils import tools
@@ -21,9 +20,8 @@ class sCQR:
             C: interval (small positive value)
         """
         # TODO(error/warning handling): Check the configuration of the model exist
-        self.y, self.x = tools.to_1d_list(tools.trans_list(
-            y)), tools.to_2d_list(tools.trans_list(x))
-        self.tau = tools.to_1d_list(tools.trans_list(tau))
+        self.y, self.x = tools.to_1d_array(y), tools.to_2d_array(x)
+        self.tau = tools.to_1d_array(tau)
         self.C, self.cet = C, CET_ADDI
 
         # Initialize the CQR model
@@ -85,7 +83,7 @@ class sCQR:
         """Return the proper regression constraint"""
 
         def regression_rule(model, k, i):
-            return self.y[i] == model.alpha[k, i] + sum(model.beta[k, i, j] * self.x[i][j] for j in model.J) + \
+            return self.y[i] == model.alpha[k, i] + sum(model.beta[k, i, j] * self.x[i, j] for j in model.J) + \
                 model.epsilon_plus[k, i] - model.epsilon_minus[k, i]
 
         return regression_rule
@@ -96,8 +94,8 @@ class sCQR:
         def afriat_rule(model, k, i, h):
             if i == h:
                 return Constraint.Skip
-            return model.alpha[k, i] + sum(model.beta[k, i, j] * self.x[i][j] for j in model.J) \
-                <= model.alpha[k, h] + sum(model.beta[k, h, j] * self.x[i][j] for j in model.J)
+            return model.alpha[k, i] + sum(model.beta[k, i, j] * self.x[i, j] for j in model.J) \
+                <= model.alpha[k, h] + sum(model.beta[k, h, j] * self.x[i, j] for j in model.J)
 
         return afriat_rule
 
@@ -105,56 +103,31 @@ class sCQR:
         """Return the proper non-crossing constraint"""
 
         def noncrossing_rule(model, w, i):
-            return model.alpha[w, i] + sum(model.beta[w, i, j] * self.x[i][j] for j in model.J) + self.C <= \
+            return model.alpha[w, i] + sum(model.beta[w, i, j] * self.x[i, j] for j in model.J) + self.C <= \
                 model.alpha[w+1, i] + \
-                sum(model.beta[w+1, i, j] * self.x[i][j] for j in model.J)
+                sum(model.beta[w+1, i, j] * self.x[i, j] for j in model.J)
 
         return noncrossing_rule
 
     def get_alpha(self):
         """Return alpha value by array"""
         tools.assert_optimized(self.optimization_status)
-        alpha = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.alpha),
-                                                           list(self.__model__.alpha[:, :].value))])
-        alpha = pd.DataFrame(alpha, columns=['Name', 'Key', 'Value'])
-        alpha = alpha.pivot(index='Name', columns='Key', values='Value')
-        return alpha.to_numpy().T
+        return tools.get_values(self.__model__.alpha).T
 
     def get_beta(self):
         """Return beta value by array"""
         tools.assert_optimized(self.optimization_status)
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :, :].value))])
-        beta = pd.DataFrame(beta, columns=['tau', 'n', 'd', 'beta'])
-        betanew = []
-        for i in range(len(self.tau)):
-            beta_new = beta.loc[beta['tau'] == i]
-            del beta_new["tau"]
-            betanew.append(beta_new.pivot(
-                index='n', columns='d', values='beta').to_numpy())
-        return np.array(betanew).reshape(len(self.tau)*len(self.y), len(self.x[0]))
+        return tools.get_values(self.__model__.beta).reshape(len(self.tau)*len(self.y), len(self.x[0]))
 
     def get_positive_residual(self):
         """Return positive residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_plus = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.epsilon_plus),
-                                                                   list(self.__model__.epsilon_plus[:, :].value))])
-        residual_plus = pd.DataFrame(residual_plus, columns=[
-                                     'Name', 'Key', 'Value'])
-        residual_plus = residual_plus.pivot(
-            index='Name', columns='Key', values='Value')
-        return residual_plus.to_numpy().T
+        return tools.get_values(self.__model__.epsilon_plus).T
 
     def get_negative_residual(self):
         """Return negative residual value by array"""
         tools.assert_optimized(self.optimization_status)
-        residual_minus = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.epsilon_minus),
-                                                                    list(self.__model__.epsilon_minus[:, :].value))])
-        residual_minus = pd.DataFrame(residual_minus, columns=[
-                                      'Name', 'Key', 'Value'])
-        residual_minus = residual_minus.pivot(
-            index='Name', columns='Key', values='Value')
-        return residual_minus.to_numpy().T
+        return tools.get_values(self.__model__.epsilon_minus).T
 
     def get_frontier(self):
         """Return estimated frontier value by array"""
@@ -1,10 +1,9 @@
 # import dependencies
-from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
+from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, ConstraintList, log
 from pyomo.core.expr.numvalue import NumericValue
-import numpy as np
-import pandas as pd
 from ..constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
-from .tools import optimize_model
+from .tools import optimize_model_persistent, get_values
+from .sweet import pairs
 
 
 class CNLSZG1:
@@ -34,6 +33,7 @@ class CNLSZG1:
         self.__model__.I = Set(initialize=range(len(self.y)))
         self.__model__.J = Set(initialize=range(len(self.x[0])))
         self.__model__.K = Set(initialize=range(len(self.z[0])))
+        self.__model__.S = Set(initialize=pairs(self.cutactive), dimen=2)
 
         # Initialize the variables
         self.__model__.alpha = Var(self.__model__.I, doc='alpha')
@@ -61,13 +61,15 @@ class CNLSZG1:
         self.__model__.afriat_rule = Constraint(self.__model__.I,
                                                 rule=self.__afriat_rule(),
                                                 doc='elementary Afriat approach')
-        self.__model__.sweet_rule = Constraint(self.__model__.I,
-                                               self.__model__.I,
+        self.__model__.sweet_rule = Constraint(self.__model__.S,
                                                rule=self.__sweet_rule(),
                                                doc='sweet spot approach')
+        self.__model__.sweet_rule2 = ConstraintList(doc='sweet spot-2 approach')
+        self.__violated, self.__added = set(), []
 
         # Optimize model
         self.optimization_status, self.problem_status = 0, 0
+        self.__solver = None
 
     def optimize(self, email=OPT_LOCAL, solver=OPT_DEFAULT):
         """Optimize the function by requested method
@@ -77,8 +79,26 @@ class CNLSZG1:
             solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
         """
         # TODO(error/warning handling): Check problem status after optimization
-        self.problem_status, self.optimization_status = optimize_model(
-            self.__model__, email, self.cet, solver)
+        self.problem_status, self.optimization_status, self.__solver = optimize_model_persistent(
+            self.__model__, email, self.cet, solver, self.__solver, self.__added)
+        self.__added = []
+
+    def add_violated(self, active):
+        """Add the violated concavity constraints to the model
+
+        The model stays alive between the iterations, so that only the new constraints are
+        passed to the solver at the next optimization.
+
+        Args:
+            active (float): violated concavity constraint.
+        """
+        sweet_rule2 = self.__sweet_rule2()
+        for i, h in pairs(active):
+            if (i, h) in self.__model__.S or (i, h) in self.__violated:
+                continue
+            self.__violated.add((i, h))
+            self.__added.append(self.__model__.sweet_rule2.add(
+                sweet_rule2(self.__model__, i, h)))
 
     def __objective_rule(self):
         """Return the proper objective function"""
@@ -95,16 +115,16 @@ class CNLSZG1:
 
                 def regression_rule(model, i):
                     return self.y[i] == model.alpha[i] \
-                        + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.lamda[k] * self.z[i][k]
+                        + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.lamda[k] * self.z[i, k]
                               for k in model.K) + model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
 
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.lamda[k] * self.z[i][k]
+                    return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.lamda[k] * self.z[i, k]
                               for k in model.K) + model.epsilon[i]
 
                 return regression_rule
@@ -112,7 +132,7 @@ class CNLSZG1:
         elif self.cet == CET_MULT:
 
             def regression_rule(model, i):
-                return log(self.y[i]) == log(model.frontier[i] + 1) + sum(model.lamda[k] * self.z[i][k] for k in model.K) + model.epsilon[i]
+                return log(self.y[i]) == log(model.frontier[i] + 1) + sum(model.lamda[k] * self.z[i, k] for k in model.K) + model.epsilon[i]
 
             return regression_rule
 
@@ -125,14 +145,14 @@ class CNLSZG1:
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
             elif self.rts == RTS_CRS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
 
@@ -150,19 +170,19 @@ class CNLSZG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
             elif self.rts == RTS_CRS:
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j]
+                        sum(model.beta[i, j] * self.x[i, j]
                             for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -171,10 +191,10 @@ class CNLSZG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -182,8 +202,8 @@ class CNLSZG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
 
@@ -200,70 +220,75 @@ class CNLSZG1:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j]
-                                              for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j]
-                                              for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j]
+                                          for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j]
+                                          for j in model.J))
 
                 return sweet_rule
         elif self.cet == CET_MULT:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j] for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return sweet_rule
 
         raise ValueError("Undefined model parameters.")
 
+    def __sweet_rule2(self):
+        """Return the proper sweet spot (step2) approach constraint"""
+        if self.fun == FUN_PROD:
+            __operator = NumericValue.__le__
+        elif self.fun == FUN_COST:
+            __operator = NumericValue.__ge__
+
+        if self.rts == RTS_VRS:
+
+            def sweet_rule2(model, i, h):
+                return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                       for j in model.J),
+                                  model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                       for j in model.J))
+
+            return sweet_rule2
+        elif self.rts == RTS_CRS:
+
+            def sweet_rule2(model, i, h):
+                return __operator(sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                                  sum(model.beta[h, j] * self.x[i, j] for j in model.J))
+
+            return sweet_rule2
+
+        raise ValueError("Undefined model parameters.")
+
     def get_alpha(self):
         """Return alpha value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return get_values(self.__model__.beta)
@@ -1,10 +1,9 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
-import numpy as np
-import pandas as pd
 from ..constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
-from .tools import optimize_model
+from .tools import optimize_model, get_values
+from .sweet import pairs
 
 
 class CQRG1:
@@ -33,6 +32,7 @@ class CQRG1:
         # Initialize the sets
         self.__model__.I = Set(initialize=range(len(self.y)))
         self.__model__.J = Set(initialize=range(len(self.x[0])))
+        self.__model__.S = Set(initialize=pairs(self.cutactive), dimen=2)
 
         # Initialize the variables
         self.__model__.alpha = Var(self.__model__.I, doc='alpha')
@@ -66,8 +66,7 @@ class CQRG1:
         self.__model__.afriat_rule = Constraint(self.__model__.I,
                                                 rule=self.__afriat_rule(),
                                                 doc='elementary Afriat approach')
-        self.__model__.sweet_rule = Constraint(self.__model__.I,
-                                               self.__model__.I,
+        self.__model__.sweet_rule = Constraint(self.__model__.S,
                                                rule=self.__sweet_rule(),
                                                doc='sweet spot approach')
 
@@ -108,13 +107,13 @@ class CQRG1:
             if self.rts == RTS_VRS:
                 def regression_rule(model, i):
                     return self.y[i] == model.alpha[i] \
-                        + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                        + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
+                    return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
                         + model.epsilon[i]
 
                 return regression_rule
@@ -136,14 +135,14 @@ class CQRG1:
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
             elif self.rts == RTS_CRS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
 
@@ -161,10 +160,10 @@ class CQRG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -172,9 +171,9 @@ class CQRG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j]
+                        sum(model.beta[i, j] * self.x[i, j]
                             for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -183,10 +182,10 @@ class CQRG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -194,8 +193,8 @@ class CQRG1:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
 
@@ -212,51 +211,35 @@ class CQRG1:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j]
-                                              for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j]
-                                              for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j]
+                                          for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j]
+                                          for j in model.J))
 
                 return sweet_rule
         elif self.cet == CET_MULT:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j] for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return sweet_rule
 
@@ -266,18 +249,13 @@ class CQRG1:
         """Return alpha value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return get_values(self.__model__.beta)
 
 
 class CERG1(CQRG1):
@@ -1,10 +1,9 @@
 # Import pyomo module
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
-import numpy as np
-import pandas as pd
 from ..constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, RTS_CRS, RTS_VRS, OPT_DEFAULT, OPT_LOCAL
-from .tools import optimize_model, trans_list, to_2d_list
+from .tools import optimize_model, get_values
+from .sweet import pairs
 
 
 class CQRG2:
@@ -27,7 +26,7 @@ class CQRG2:
         # TODO(error/warning handling): Check the configuration of the model exist
         self.x, self.y, self.tau, self.cet, self.fun, self.rts = x, y, tau, cet, fun, rts
         self.cutactive = cutactive
-        self.active = to_2d_list(trans_list(active))
+        self.active = active
 
         # Initialize the CNLS model
         self.__model__ = ConcreteModel()
@@ -35,6 +34,8 @@ class CQRG2:
         # Initialize the sets
         self.__model__.I = Set(initialize=range(len(self.y)))
         self.__model__.J = Set(initialize=range(len(self.x[0])))
+        self.__model__.S = Set(initialize=pairs(self.cutactive), dimen=2)
+        self.__model__.S2 = Set(initialize=pairs(self.active), dimen=2)
 
         # Initialize the variables
         self.__model__.alpha = Var(self.__model__.I, doc='alpha')
@@ -68,12 +69,10 @@ class CQRG2:
         self.__model__.afriat_rule = Constraint(self.__model__.I,
                                                 rule=self.__afriat_rule(),
                                                 doc='elementary Afriat approach')
-        self.__model__.sweet_rule = Constraint(self.__model__.I,
-                                               self.__model__.I,
+        self.__model__.sweet_rule = Constraint(self.__model__.S,
                                                rule=self.__sweet_rule(),
                                                doc='sweet spot approach')
-        self.__model__.sweet_rule2 = Constraint(self.__model__.I,
-                                                self.__model__.I,
+        self.__model__.sweet_rule2 = Constraint(self.__model__.S2,
                                                 rule=self.__sweet_rule2(),
                                                 doc='sweet spot-2 approach')
 
@@ -115,13 +114,13 @@ class CQRG2:
 
                 def regression_rule(model, i):
                     return self.y[i] == model.alpha[i] + \
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J) + \
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J) + \
                         model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) + \
+                    return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) + \
                         model.epsilon[i]
 
                 return regression_rule
@@ -142,14 +141,14 @@ class CQRG2:
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
             elif self.rts == RTS_CRS:
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) - 1
+                        model.beta[i, j] * self.x[i, j] for j in model.J) - 1
 
                 return log_rule
 
@@ -167,10 +166,10 @@ class CQRG2:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -178,9 +177,9 @@ class CQRG2:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j]
+                        sum(model.beta[i, j] * self.x[i, j]
                             for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -189,10 +188,10 @@ class CQRG2:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
+                        model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
                                              for j in model.J),
                         model.alpha[self.__model__.I.nextw(i)] +
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j]
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j]
                             for j in model.J))
 
                 return afriat_rule
@@ -200,8 +199,8 @@ class CQRG2:
 
                 def afriat_rule(model, i):
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i][j] for j in model.J))
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                        sum(model.beta[self.__model__.I.nextw(i), j] * self.x[i, j] for j in model.J))
 
                 return afriat_rule
 
@@ -218,52 +217,36 @@ class CQRG2:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j]
-                                              for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j]
-                                              for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j]
+                                          for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j]
+                                          for j in model.J))
 
                 return sweet_rule
         elif self.cet == CET_MULT:
             if self.rts == RTS_VRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule
             elif self.rts == RTS_CRS:
 
                 def sweet_rule(model, i, h):
-                    if self.cutactive[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j] for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return sweet_rule
 
@@ -280,52 +263,36 @@ class CQRG2:
             if self.rts == RTS_VRS:
 
                 def sweet_rule2(model, i, h):
-                    if self.active[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule2
             elif self.rts == RTS_CRS:
 
                 def sweet_rule2(model, i, h):
-                    if self.active[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j]
-                                              for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j]
-                                              for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j]
+                                          for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j]
+                                          for j in model.J))
 
                 return sweet_rule2
         elif self.cet == CET_MULT:
             if self.rts == RTS_VRS:
 
                 def sweet_rule2(model, i, h):
-                    if self.active[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i][j]
-                                                               for j in model.J),
-                                          model.alpha[h] + sum(model.beta[h, j] * self.x[i][j]
-                                                               for j in model.J))
-                    return Constraint.Skip
+                    return __operator(model.alpha[i] + sum(model.beta[i, j] * self.x[i, j]
+                                                           for j in model.J),
+                                      model.alpha[h] + sum(model.beta[h, j] * self.x[i, j]
+                                                           for j in model.J))
 
                 return sweet_rule2
             elif self.rts == RTS_CRS:
 
                 def sweet_rule2(model, i, h):
-                    if self.active[i][h]:
-                        if i == h:
-                            return Constraint.Skip
-                        return __operator(sum(model.beta[i, j] * self.x[i][j] for j in model.J),
-                                          sum(model.beta[h, j] * self.x[i][j] for j in model.J))
-                    return Constraint.Skip
+                    return __operator(sum(model.beta[i, j] * self.x[i, j] for j in model.J),
+                                      sum(model.beta[h, j] * self.x[i, j] for j in model.J))
 
                 return sweet_rule2
 
@@ -335,18 +302,13 @@ class CQRG2:
         """Return alpha value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        alpha = list(self.__model__.alpha[:].value)
-        return np.asarray(alpha)
+        return get_values(self.__model__.alpha)
 
     def get_beta(self):
         """Return beta value by array"""
         if self.optimization_status == 0:
             self.optimize()
-        beta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.beta),
-                                                          list(self.__model__.beta[:, :].value))])
-        beta = pd.DataFrame(beta, columns=['Name', 'Key', 'Value'])
-        beta = beta.pivot(index='Name', columns='Key', values='Value')
-        return beta.to_numpy()
+        return get_values(self.__model__.beta)
 
 
 class CERG2(CQRG2):
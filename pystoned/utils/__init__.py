@@ -1,12 +1,32 @@
-from . import CNLSG1
-from . import CNLSG2
-from . import CNLSZG1
-from . import CNLSZG2
-from . import CQERG1
-from . import CQERG2
-from . import CQERZG1
-from . import CQERZG2
-from . import interpolation
-from . import sweet
-from . import tools
-from . import unihyper
+from importlib import import_module
+
+__all__ = [
+    'CNLSG1',
+    'CNLSZG1',
+    'CQERG1',
+    'CQERG2',
+    'CQERZG1',
+    'CQERZG2',
+    'decomposition',
+    'enumeration',
+    'frontier',
+    'interpolation',
+    'matrix',
+    'native',
+    'quantiles',
+    'resampling',
+    'screening',
+    'sweet',
+    'tools',
+    'unihyper',
+    'univariate',
+    'violation',
+]
+
+
+def __getattr__(name):
+    # import the modules on first access, so that light modules do not pull in pyomo
+    if name in __all__:
+        return import_module("." + name, __name__)
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
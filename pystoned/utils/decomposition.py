@@ -0,0 +1,151 @@
+# import dependencies
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+from .matrix import highs_status
+from ..constant import OPT_DEFAULT, OPT_LOCAL
+
+
+def solve(program, data, arguments, blocks, email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1):
+    """Solve the program of each DMU separately against the same reference technology
+
+    The programs of the DMUs are independent, so that the program of a single DMU is
+    assembled and solved at a time, and the DMUs are shared by the worker processes.
+    Only the nonzero values of the solutions are kept. With HiGHS, each worker keeps a
+    single model, changes only the costs, row bounds and coefficients that depend on the
+    data of the DMU, and starts from the previous optimal basis. The DMUs are visited in
+    lexicographic order of their data, so that neighboring programs are alike.
+
+    Args:
+        program (function): assembler of the program of the DMUs given by its leading arguments, affine in their values, such as matrix.dea_program.
+        data (list): leading arguments of program with one row per DMU, or None.
+        arguments (list): remaining arguments of program, shared by all DMUs.
+        blocks (list): name and width of each variable in column order, with width None for a single value per DMU.
+        email (string, optional): The email address for remote optimization. Only OPT_LOCAL is supported.
+        solver (string, optional): The solver chosen for optimization. It will optimize with highs if OPT_DEFAULT is given.
+        processes (int, optional): number of worker processes sharing the DMUs. Defaults to 1.
+
+    Returns:
+        tuple: values of each variable by name, and the status of the programs, "optimal" if they are all solved to optimality.
+    """
+    if email != OPT_LOCAL:
+        raise ValueError(
+            "The decomposed builder only supports local optimization.")
+    n = len(data[0])
+    order = np.lexsort(np.column_stack([value for value in data if value is not None]).T[::-1])
+    if processes is None or processes <= 1:
+        chunks = [order]
+    else:
+        chunks = np.array_split(order, min(processes, n))
+
+    print("Estimating {} programs locally with {} solver.".format(
+        n, "highs" if solver is OPT_DEFAULT else solver), flush=True)
+    if len(chunks) == 1:
+        results = [__solve_programs(program, data, arguments, solver, chunks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = list(pool.map(__solve_programs, [program] * len(chunks), [data] * len(chunks),
+                                    [arguments] * len(chunks), [solver] * len(chunks), chunks))
+    solution = sparse.vstack([result[0] for result in results], format='csr')[np.argsort(order)]
+    status = [message for result in results for message in result[1]]
+
+    values, start = {}, 0
+    for name, width in blocks:
+        if width is None:
+            values[name] = solution[:, start].toarray().ravel()
+            start += 1
+        else:
+            values[name] = solution[:, start:start + width]
+            start += width
+    return values, status[0] if len(set(status)) == 1 else ", ".join(sorted(set(status)))
+
+
+def __solve_programs(program, data, arguments, solver, index):
+    """Solve the programs of the DMUs in index, one at a time"""
+    indptr, indices, values = [0], [], []
+    status = []
+    highs = __highs() if solver in (OPT_DEFAULT, "highs") else None
+    if highs is not None:
+        base, changes = __affine_program(program, data, arguments)
+        highs.passModel(base.highs_lp())
+    for o in index:
+        if highs is None:
+            solution, message = program(*[None if value is None else value[o:o + 1] for value in data],
+                                        *arguments).solve(OPT_LOCAL, solver, output=False)
+        else:
+            solution, message = __solve_warm(highs, *changes(
+                np.concatenate([value[o] for value in data if value is not None])))
+        nonzero = np.flatnonzero(solution)
+        indices.append(nonzero)
+        values.append(solution[nonzero])
+        indptr.append(indptr[-1] + len(nonzero))
+        status.append(message)
+    return sparse.csr_matrix((np.concatenate(values), np.concatenate(indices), indptr),
+                             shape=(len(index), len(solution))), status
+
+
+def __highs():
+    """Return a silent HiGHS instance, or None if highspy is not installed"""
+    try:
+        import highspy
+    except ImportError:
+        return None
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    return h
+
+
+def __affine_program(program, data, arguments):
+    """Return the program at unit data and the changes of its coefficients with the data of a DMU
+
+    The program is affine in the data of the DMU, so that the costs, row bounds and
+    coefficients depending on the data, and their change per unit of each data value, are
+    read off the programs of probe DMUs whose data are one, but for a single value of two.
+    """
+    widths = [None if value is None else value.shape[1] for value in data]
+    size = sum(width for width in widths if width is not None)
+
+    def assemble(d):
+        leading, start = [], 0
+        for width in widths:
+            leading.append(None if width is None else d[start:start + width].reshape(1, width))
+            start += width or 0
+        return program(*leading, *arguments)
+
+    base = assemble(np.ones(size))
+    probes = [assemble(np.ones(size) + np.eye(size)[k]) for k in range(size)]
+
+    def slopes(base_value, probe_values):
+        # infinite bounds do not change, and are not subtracted
+        slope = np.array([np.subtract(value, base_value, out=np.zeros(len(base_value)), where=value != base_value)
+                          for value in probe_values])
+        return slope.reshape(size, len(base_value))
+
+    cost_slope = slopes(base.q, [probe.q for probe in probes])
+    cost = np.flatnonzero(np.any(cost_slope != 0, axis=0))
+    lb_slope = slopes(base.lb, [probe.lb for probe in probes])
+    ub_slope = slopes(base.ub, [probe.ub for probe in probes])
+    row = np.flatnonzero(np.any(lb_slope != 0, axis=0) | np.any(ub_slope != 0, axis=0))
+    # the program of a single DMU has few rows or few columns
+    difference = np.array([(probe.A - base.A).toarray() for probe in probes])
+    i, j = np.nonzero(np.any(difference != 0, axis=0))
+    coefficient = base.A.toarray()[i, j]
+    coefficient_slope = difference[:, i, j]
+
+    def changes(d):
+        step = d - 1
+        return (cost.astype(np.int32), base.q[cost] + step @ cost_slope[:, cost]), \
+            (row.astype(np.int32), base.lb[row] + step @ lb_slope[:, row], base.ub[row] + step @ ub_slope[:, row]), \
+            (i.tolist(), j.tolist(), (coefficient + step @ coefficient_slope).tolist())
+
+    return base, changes
+
+
+def __solve_warm(h, cost, row, coefficient):
+    """Solve the model with the changed costs, row bounds and coefficients from the last basis"""
+    h.changeColsCost(len(cost[0]), *cost)
+    h.changeRowsBounds(len(row[0]), *row)
+    for i, j, value in zip(*coefficient):
+        h.changeCoeff(i, j, value)
+    h.run()
+    return np.asarray(h.getSolution().col_value), highs_status(h)
@@ -0,0 +1,107 @@
+# import dependencies
+import numpy as np
+from .tools import to_2d_array
+from .screening import nondominated
+from ..constant import ORIENT_IO, ORIENT_OO
+
+
+def fdh(y, x, orient, yref=None, xref=None, chunk_size=None):
+    """Exact free disposal hull efficiency by enumeration of the reference DMUs
+
+    The input oriented score of a DMU is the smallest, over the reference DMUs producing
+    no less of every output, of their largest input ratio, and the output oriented score
+    the largest, over the reference DMUs using no more of every input, of their smallest
+    output ratio. With a single input and a single output, the reference DMUs are sorted
+    once and the score is read off a running minimum or maximum. Otherwise only the
+    nondominated reference DMUs, which attain every score, are compared with the DMUs in
+    blocks.
+
+    Args:
+        y (float): output variables.
+        x (float): input variables.
+        orient (String): ORIENT_IO (input orientation) or ORIENT_OO (output orientation).
+        yref (float, optional): reference outputs. Defaults to None.
+        xref (float, optional): reference inputs. Defaults to None.
+        chunk_size (int, optional): number of DMUs compared at once. Defaults to None, which keeps the blocks to a few million ratios.
+
+    Returns:
+        tuple: efficiency of each DMU, and index of the reference DMU attaining it, -1 if there is none.
+    """
+    if orient not in (ORIENT_IO, ORIENT_OO):
+        raise ValueError("Undefined model parameters.")
+    y, x = to_2d_array(y), to_2d_array(x)
+    yref = y if yref is None else to_2d_array(yref)
+    xref = x if xref is None else to_2d_array(xref)
+
+    if x.shape[1] == 1 and y.shape[1] == 1:
+        candidate = np.arange(len(yref))
+        score, peer = __sorted_scores(y[:, 0], x[:, 0], yref[:, 0], xref[:, 0], orient)
+    else:
+        candidate = np.flatnonzero(nondominated(yref, xref))
+        score, peer = __blocked_scores(y, x, yref[candidate], xref[candidate], orient, chunk_size)
+
+    # no reference DMU dominates the DMU in the free disposal sense
+    found = np.isfinite(score) | (score == (-np.inf if orient == ORIENT_IO else np.inf))
+    return np.where(found, score, np.nan), np.where(found, candidate[peer], -1)
+
+
+def __ratio(a, d, orient):
+    """Return the ratios a / d, where a zero d only bounds the efficiency from one side"""
+    if orient == ORIENT_IO:
+        # theta * 0 >= a holds for any theta if a <= 0, and for none otherwise
+        bound = np.where(a > 0, np.inf, -np.inf)
+    else:
+        # theta * 0 <= a holds for any theta if a >= 0, and for none otherwise
+        bound = np.where(a >= 0, np.inf, -np.inf)
+    return np.where(d > 0, a / np.where(d > 0, d, 1.0), bound)
+
+
+def __blocked_scores(y, x, yref, xref, orient, chunk_size):
+    """Return the scores and peers of the DMUs, compared with the reference DMUs in blocks"""
+    if chunk_size is None:
+        chunk_size = max(1, int(4e6 // max(len(yref) * max(x.shape[1], y.shape[1]), 1)))
+
+    score, peer = np.empty(len(y)), np.zeros(len(y), dtype=int)
+    for start in range(0, len(y), chunk_size):
+        o = slice(start, start + chunk_size)
+        if orient == ORIENT_IO:
+            feasible = np.all(yref[None, :, :] >= y[o, None, :], axis=2)
+            value = np.where(feasible, np.max(__ratio(xref[None, :, :], x[o, None, :], orient), axis=2), np.inf)
+            best = np.argmin(value, axis=1)
+        else:
+            feasible = np.all(xref[None, :, :] <= x[o, None, :], axis=2)
+            value = np.where(feasible, np.min(__ratio(yref[None, :, :], y[o, None, :], orient), axis=2), -np.inf)
+            best = np.argmax(value, axis=1)
+        score[o] = value[np.arange(len(value)), best]
+        peer[o] = best
+    return score, peer
+
+
+def __sorted_scores(y, x, yref, xref, orient):
+    """Return the scores and peers of the DMUs with a single input and a single output
+
+    The reference DMUs producing no less output, or using no more input, form a prefix of
+    the reference DMUs sorted by decreasing output, or by increasing input, and the ratio
+    is monotone in the input, or the output, of the reference DMU.
+    """
+    if orient == ORIENT_IO:
+        order = np.argsort(-yref, kind="stable")
+        count = np.searchsorted(-yref[order], -y, side="right")
+        running = __running_best(xref[order], np.minimum)
+    else:
+        order = np.argsort(xref, kind="stable")
+        count = np.searchsorted(xref[order], x, side="right")
+        running = __running_best(yref[order], np.maximum)
+
+    peer = order[running[np.maximum(count - 1, 0)]]
+    if orient == ORIENT_IO:
+        score = np.where(count > 0, __ratio(xref[peer], x, orient), np.inf)
+    else:
+        score = np.where(count > 0, __ratio(yref[peer], y, orient), -np.inf)
+    return score, peer
+
+
+def __running_best(v, ufunc):
+    """Return the index of the running minimum or maximum of v"""
+    best = ufunc.accumulate(v)
+    return np.maximum.accumulate(np.where(v == best, np.arange(len(v)), 0))
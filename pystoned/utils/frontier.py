@@ -0,0 +1,129 @@
+# import dependencies
+import os
+import numpy as np
+from ..constant import CET_ADDI, CET_MULT, FUN_PROD, RTS_VRS, RTS_CRS
+from . import interpolation, tools
+
+
+class FittedFrontier:
+    """Estimated function/frontier held in NumPy arrays
+
+    The frontier is detached from the Pyomo model, so that it can be saved, loaded and
+    used for prediction without importing Pyomo.
+    """
+
+    def __init__(self, alpha, beta, lamda=None, fun=FUN_PROD, rts=RTS_VRS, cet=CET_ADDI, hull=False):
+        """FittedFrontier
+
+        Args:
+            alpha (float): estimated alpha.
+            beta (float): estimated beta.
+            lamda (float, optional): estimated coefficient(s) of the contextual variable(s). Defaults to None.
+            fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+            rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+            cet (String, optional): CET_ADDI (additive composite error term) or CET_MULT (multiplicative composite error term). Defaults to CET_ADDI.
+            hull (bool, optional): whether the hyperplanes were pruned over the convex hull of the estimation inputs only, so that the predictions outside of it differ from those of the model. Defaults to False.
+        """
+        self.beta = np.asarray(beta, dtype=float)
+        if self.beta.ndim == 1:
+            self.beta = self.beta.reshape(-1, 1)
+        self.alpha = np.asarray(alpha, dtype=float).reshape(len(self.beta))
+        self.lamda = None if lamda is None else np.asarray(
+            lamda, dtype=float).reshape(-1)
+        self.fun, self.rts, self.cet, self.hull = fun, rts, cet, hull
+
+    @classmethod
+    def from_model(cls, model, prune=True, hull=False):
+        """Export the estimated frontier of an optimized CNLS-family model
+
+        The pruned frontier predicts as model.get_predict everywhere. With hull, it only
+        predicts as the model over the convex hull of x, which is recorded in the frontier.
+
+        Args:
+            model: optimized model, e.g. CNLS, CNLSG, CQR, CER or CSVR.
+            prune (bool, optional): keep only the hyperplanes attaining the estimated function/frontier. Defaults to True.
+            hull (bool, optional): keep only the hyperplanes needed over the convex hull of x when pruning. Defaults to False.
+
+        Returns:
+            FittedFrontier: the estimated frontier.
+        """
+        rts = getattr(model, 'rts', RTS_VRS)
+        beta = np.asarray(model.get_beta(), dtype=float)
+        if rts == RTS_CRS:
+            alpha = np.zeros(len(beta))
+        else:
+            alpha = np.asarray(model.get_alpha(), dtype=float)
+        lamda = None
+        if getattr(model, 'z', None) is not None:
+            lamda = model.get_lamda()
+        if prune and hull:
+            alpha, beta = interpolation.prune(alpha, beta, model.x, fun=model.fun, hull=True)
+        elif prune:
+            # the same pruned hyperplanes as model.get_predict
+            alpha, beta = tools.get_cached(model.__model__, ('prune',),
+                                           lambda: interpolation.prune(alpha, beta, model.x, fun=model.fun))
+        return cls(alpha, beta, lamda, model.fun, rts, getattr(model, 'cet', CET_ADDI), prune and hull)
+
+    def predict(self, x, z=None, chunk_size=None):
+        """Return the estimated function/frontier at x
+
+        Args:
+            x (float): input variables.
+            z (float, optional): Contextual variable(s), applied if lamda is estimated. Defaults to None.
+            chunk_size (int, optional): number of points evaluated at once. Defaults to None.
+
+        Returns:
+            yhat: predicted frontier
+        """
+        yhat = interpolation.interpolation(
+            self.alpha, self.beta, x, fun=self.fun, chunk_size=chunk_size)
+        if z is not None and self.lamda is not None:
+            zeta = np.asarray(z, dtype=float).reshape(len(yhat), -1) @ self.lamda
+            if self.cet == CET_MULT:
+                yhat = yhat * np.exp(zeta).reshape(-1, 1)
+            else:
+                yhat = yhat + zeta.reshape(-1, 1)
+        return yhat
+
+    def save(self, path):
+        """Save the frontier
+
+        Args:
+            path (String): a file ending with .npz, or a directory of .npy files that can be memory-mapped on load.
+        """
+        arrays = {'alpha': self.alpha, 'beta': self.beta,
+                  'setting': np.array([self.fun, self.rts, self.cet]), 'hull': np.array(self.hull)}
+        if self.lamda is not None:
+            arrays['lamda'] = self.lamda
+        if str(path).endswith('.npz'):
+            np.savez(path, **arrays)
+            return
+        os.makedirs(path, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(path, name + '.npy'), array)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """Load a saved frontier
+
+        Args:
+            path (String): the .npz file or the directory given to save.
+            mmap_mode (String, optional): memory-map the arrays of a directory, e.g. 'r'. Defaults to None.
+
+        Returns:
+            FittedFrontier: the saved frontier.
+        """
+        if os.path.isdir(path):
+            arrays = {name[:-4]: np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+                      for name in os.listdir(path) if name.endswith('.npy')}
+        else:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        fun, rts, cet = (str(setting) for setting in arrays['setting'])
+        frontier = cls.__new__(cls)
+        frontier.alpha, frontier.beta = arrays['alpha'], arrays['beta']
+        frontier.lamda = arrays.get('lamda')
+        frontier.fun, frontier.rts, frontier.cet = fun, rts, cet
+        # frontiers saved without the flag may have been pruned over the convex hull
+        frontier.hull = bool(arrays['hull']) if 'hull' in arrays else True
+        return frontier
@@ -1,10 +1,9 @@
 # import dependencies
 import numpy as np
 from ..constant import FUN_PROD, FUN_COST
-from .tools import trans_list, to_2d_list
 
 
-def interpolation(alpha, beta, x, fun=FUN_PROD):
+def interpolation(alpha, beta, x, fun=FUN_PROD, chunk_size=None):
     """Interpolate estimated function/frontier 
 
     Args:
@@ -12,11 +11,141 @@ def interpolation(alpha, beta, x, fun=FUN_PROD):
         beta (float): estimated beta.
         x (float): input variables.
         fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        chunk_size (int, optional): number of points evaluated at once. Defaults to about 2**22 hyperplane values per chunk.
 
     Returns:
         yat: interpolated frontier
     """
-    x = np.array(to_2d_list(trans_list(x)))
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x.reshape(-1, 1)
+    alpha, beta = np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float)
+    n, d = x.shape
+
+    if beta.shape[1] != d:
+        raise ValueError(
+            "The dimensions of x_test must be equal to those of x.")
+
+    if fun == FUN_PROD:
+        envelope = np.min
+    elif fun == FUN_COST:
+        envelope = np.max
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    if chunk_size is None:
+        chunk_size = max(1, 2 ** 22 // len(beta))
+
+    # evaluate every hyperplane at a chunk of points and take the lower (upper) envelope
+    yhat = np.zeros((n, 1))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        yhat[start:stop, 0] = envelope(alpha + x[start:stop] @ beta.T, axis=1)
+
+    return yhat
+
+
+def prune(alpha, beta, x, fun=FUN_PROD, tol=1e-6, hull=False):
+    """Prune the hyperplanes of an estimated function/frontier for prediction
+
+    Near-identical hyperplanes are merged, and the hyperplanes never attaining the lower
+    (upper) envelope are removed. A hyperplane on the envelope at one of the observations
+    is kept directly; the others are checked by a linear program. The pruned envelope
+    equals the original one everywhere, or only over the convex hull of x with hull, which
+    also removes the hyperplanes attaining the envelope outside of it.
+
+    Args:
+        alpha (float): estimated alpha.
+        beta (float): estimated beta.
+        x (float): input variables of the estimation sample.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        tol (float, optional): tolerance of the hyperplane comparison. Defaults to 1e-6.
+        hull (bool, optional): keep only the hyperplanes needed over the convex hull of x. Defaults to False.
+
+    Returns:
+        tuple: alpha and beta of the pruned hyperplanes.
+    """
+    from scipy.optimize import linprog
+    from scipy.spatial import ConvexHull
+
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x.reshape(-1, 1)
+    beta = np.asarray(beta, dtype=float).reshape(-1, x.shape[1])
+    alpha = np.asarray(alpha, dtype=float).reshape(len(beta))
+
+    if fun == FUN_PROD:
+        sign = 1.0
+    elif fun == FUN_COST:
+        sign = -1.0
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    # merge the near-identical hyperplanes
+    _, index = np.unique(np.round(np.column_stack((alpha, beta)) / tol),
+                         axis=0, return_index=True)
+    alpha, beta = alpha[np.sort(index)], beta[np.sort(index)]
+    if len(alpha) == 1:
+        return alpha, beta
+
+    # keep the hyperplanes attaining the envelope at an observation
+    active = np.zeros(len(alpha), dtype=bool)
+    chunk_size = max(1, 2 ** 22 // len(beta))
+    for start in range(0, len(x), chunk_size):
+        value = sign * (alpha + x[start:start + chunk_size] @ beta.T)
+        active |= np.any(value <= value.min(axis=1, keepdims=True) + tol, axis=0)
+
+    if np.all(active):
+        return alpha, beta
+    if hull:
+        # the convex hull is spanned by its vertices
+        if x.shape[1] == 1:
+            x = np.array([x.min(axis=0), x.max(axis=0)])
+        else:
+            try:
+                x = x[ConvexHull(x).vertices]
+            except Exception:
+                pass
+
+    # maximize the margin t of the hyperplane k below (above) the others, at a point of the
+    # convex hull, as a convex combination of its vertices, or at any point
+    for k in np.flatnonzero(~active):
+        others = np.arange(len(alpha)) != k
+        b_ub = -sign * (alpha[k] - alpha[others])
+        if hull:
+            A_ub = np.column_stack((sign * (beta[k] - beta[others]) @ x.T,
+                                    np.ones(np.sum(others))))
+            A_eq = np.append(np.ones(len(x)), 0.0).reshape(1, -1)
+            c = np.append(np.zeros(len(x)), -1.0)
+            result = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1.0],
+                             bounds=[(0, None)] * len(x) + [(None, 0)], method="highs")
+        else:
+            A_ub = np.column_stack((sign * (beta[k] - beta[others]), np.ones(np.sum(others))))
+            c = np.append(np.zeros(x.shape[1]), -1.0)
+            result = linprog(c, A_ub=A_ub, b_ub=b_ub,
+                             bounds=[(None, None)] * x.shape[1] + [(None, 0)], method="highs")
+        active[k] = result.status == 0 and -result.fun >= -tol
+
+    return alpha[active], beta[active]
+
+
+def interpolation_reference(alpha, beta, x, fun=FUN_PROD):
+    """Interpolate estimated function/frontier point by point
+
+    Reference implementation of interpolation, kept for validation.
+
+    Args:
+        alpha (float): estimated alpha.
+        beta (float): estimated beta.
+        x (float): input variables.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+
+    Returns:
+        yat: interpolated frontier
+    """
+    from .tools import to_2d_array
+
+    x = to_2d_array(x)
     n, d = len(x), len(x[0])
 
     if len(beta[0]) != d:
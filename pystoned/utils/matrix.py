@@ -0,0 +1,563 @@
+# import dependencies
+import sys
+import numpy as np
+from scipy import sparse
+from . import native
+from .tools import clear_values
+from ..constant import FUN_PROD, FUN_COST, RTS_VRS, RTS_CRS, ORIENT_IO, ORIENT_OO, OPT_DEFAULT, OPT_LOCAL, OPT_NATIVE
+
+
+class QuadraticProgram:
+    """Sparse quadratic program: min 1/2 x'Px + q'x s.t. lb <= Ax <= ub, xlb <= x <= xub
+    """
+
+    def __init__(self, P, q, A, lb, ub, xlb, xub, integrality=None):
+        """QuadraticProgram
+
+        Args:
+            P (sparse matrix): symmetric quadratic objective coefficients.
+            q (float): linear objective coefficients.
+            A (sparse matrix): constraint coefficients, stored row-wise.
+            lb (float): constraint lower bounds, -np.inf if unbounded.
+            ub (float): constraint upper bounds, np.inf if unbounded.
+            xlb (float): variable lower bounds, -np.inf if unbounded.
+            xub (float): variable upper bounds, np.inf if unbounded.
+            integrality (int, optional): 1 for the integer variables and 0 for the continuous ones. Defaults to None (all continuous).
+        """
+        self.P, self.A = sparse.csc_matrix(P), sparse.csr_matrix(A)
+        self.q = np.asarray(q, dtype=float)
+        self.lb, self.ub = np.asarray(lb, dtype=float), np.asarray(ub, dtype=float)
+        self.xlb, self.xub = np.asarray(xlb, dtype=float), np.asarray(xub, dtype=float)
+        self.integrality = np.zeros(len(self.q), dtype=np.int32) if integrality is None \
+            else np.asarray(integrality, dtype=np.int32)
+
+    def solve(self, email=OPT_LOCAL, solver=OPT_DEFAULT, output=True):
+        """Solve the program with the requested solver
+
+        Args:
+            email (string): The email address for remote optimization. Only OPT_LOCAL is supported.
+            solver (string): The solver chosen for optimization: mosek, highs or OPT_NATIVE (built-in solver). It will optimize with mosek if OPT_DEFAULT is given, or with highs for a linear program.
+            output (bool, optional): whether to print the progress of the solver. Defaults to True.
+
+        Returns:
+            tuple: solution vector and solver status, "optimal" if the program is solved to optimality.
+        """
+        if email != OPT_LOCAL:
+            raise ValueError(
+                "The matrix builder only supports local optimization.")
+        if solver is OPT_DEFAULT:
+            solver = "mosek" if self.P.nnz > 0 else "highs"
+        if output:
+            print("Estimating the additive model locally with {} solver.".format(
+                solver), flush=True)
+        if solver == "mosek":
+            return self.__solve_mosek(output)
+        elif solver == "highs":
+            return self.__solve_highs(output)
+        elif solver == OPT_NATIVE:
+            if np.any(self.integrality):
+                raise ValueError(
+                    "The built-in solver does not support integer variables.")
+            return native.solve(self)
+        raise ValueError(
+            "Solver {} is not supported by the matrix builder.".format(solver))
+
+    def __solve_mosek(self, output):
+        """Hand the program to the MOSEK optimizer API"""
+        import mosek
+
+        def bound_keys(lower, upper):
+            has_lb, has_ub = np.isfinite(lower), np.isfinite(upper)
+            keys = np.full(len(lower), mosek.boundkey.fr)
+            keys[has_lb & ~has_ub] = mosek.boundkey.lo
+            keys[~has_lb & has_ub] = mosek.boundkey.up
+            keys[has_lb & has_ub] = mosek.boundkey.ra
+            keys[has_lb & has_ub & (lower == upper)] = mosek.boundkey.fx
+            return list(keys), np.where(has_lb, lower, 0.0), np.where(has_ub, upper, 0.0)
+
+        num_var, num_con = self.A.shape[1], self.A.shape[0]
+        with mosek.Env() as env, env.Task() as task:
+            if output:
+                task.set_Stream(mosek.streamtype.log, sys.stdout.write)
+            task.appendvars(num_var)
+            task.appendcons(num_con)
+            task.putcslice(0, num_var, self.q)
+            task.putvarboundslice(0, num_var, *bound_keys(self.xlb, self.xub))
+            task.putconboundslice(0, num_con, *bound_keys(self.lb, self.ub))
+            task.putarowslice(0, num_con, self.A.indptr[:-1], self.A.indptr[1:],
+                              self.A.indices, self.A.data)
+            P = sparse.tril(self.P, format='coo')
+            if P.nnz > 0:
+                task.putqobj(P.row, P.col, P.data)
+            soltype = mosek.soltype.itr
+            if np.any(self.integrality):
+                integer = np.flatnonzero(self.integrality)
+                task.putvartypelist(integer, [mosek.variabletype.type_int] * len(integer))
+                soltype = mosek.soltype.itg
+            task.putobjsense(mosek.objsense.minimize)
+            task.optimize()
+            status = task.getsolsta(soltype)
+            optimal = status in (mosek.solsta.optimal, mosek.solsta.integer_optimal)
+            return np.asarray(task.getxx(soltype)), "optimal" if optimal else str(status)
+
+    def __solve_highs(self, output):
+        """Hand the program to the HiGHS optimizer API"""
+        try:
+            import highspy
+        except ImportError:
+            if self.P.nnz > 0:
+                raise
+            return self.__solve_linprog()
+
+        h = highspy.Highs()
+        h.setOptionValue("output_flag", output)
+        h.passModel(self.highs_lp())
+        P = sparse.tril(self.P, format='csc')
+        if P.nnz > 0:
+            h.passHessian(P.shape[0], P.nnz, highspy.HessianFormat.kTriangular,
+                          P.indptr, P.indices, P.data)
+        h.run()
+        return np.asarray(h.getSolution().col_value), highs_status(h)
+
+    def highs_lp(self):
+        """Return the linear part of the program as a HiGHS model
+
+        Returns:
+            HighsLp: the program without the quadratic objective.
+        """
+        import highspy
+
+        lp = highspy.HighsLp()
+        lp.num_col_, lp.num_row_ = self.A.shape[1], self.A.shape[0]
+        lp.col_cost_ = self.q
+        lp.col_lower_, lp.col_upper_ = self.xlb, self.xub
+        lp.row_lower_, lp.row_upper_ = self.lb, self.ub
+        if np.any(self.integrality):
+            lp.integrality_ = [highspy.HighsVarType.kInteger if integer else highspy.HighsVarType.kContinuous
+                               for integer in self.integrality]
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = self.A.indptr
+        lp.a_matrix_.index_ = self.A.indices
+        lp.a_matrix_.value_ = self.A.data
+        return lp
+
+    def __solve_linprog(self):
+        """Hand the linear program to the HiGHS solver bundled with scipy"""
+        from scipy.optimize import linprog
+
+        equality = self.lb == self.ub
+        upper, lower = ~equality & np.isfinite(self.ub), ~equality & np.isfinite(self.lb)
+        result = linprog(self.q,
+                         A_ub=sparse.vstack([self.A[upper], -self.A[lower]], format='csr'),
+                         b_ub=np.concatenate([self.ub[upper], -self.lb[lower]]),
+                         A_eq=self.A[equality], b_eq=self.lb[equality],
+                         bounds=np.column_stack([self.xlb, self.xub]),
+                         integrality=self.integrality, method='highs')
+        solution = result.x if result.x is not None else np.full(len(self.q), np.nan)
+        return solution, "optimal" if result.status == 0 else result.message
+
+
+def highs_status(h):
+    """Return the status of the last HiGHS run, "optimal" if the model is solved to optimality
+
+    Args:
+        h (Highs): the HiGHS instance.
+
+    Returns:
+        String: solver status.
+    """
+    import highspy
+
+    status = h.getModelStatus()
+    return "optimal" if status == highspy.HighsModelStatus.kOptimal else h.modelStatusToString(status)
+
+
+def afriat_pairs(n):
+    """Return the index pairs (i, h), i != h, of the afriat inequalities
+
+    Args:
+        n (int): number of observations.
+
+    Returns:
+        tuple: row index i and column index h.
+    """
+    i = np.repeat(np.arange(n), n - 1)
+    h = np.tile(np.arange(n - 1), n)
+    h[h >= i] += 1
+    return i, h
+
+
+def afriat_matrix(x, i, h, rts=RTS_VRS):
+    """Return the coefficients of alpha_i + beta_i x_i - alpha_h - beta_h x_i
+
+    Args:
+        x (float): input variables.
+        i (int): index of the evaluated observation of each inequality.
+        h (int): index of the compared hyperplane of each inequality.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        csr_matrix: coefficients on the [alpha, beta] columns.
+    """
+    x = np.asarray(x, dtype=float)
+    i, h = np.asarray(i), np.asarray(h)
+    n, d = x.shape
+    m = len(i)
+
+    # every inequality has the same number of nonzeros, so the rows are filled in place
+    width = 2 * d + 2 if rts == RTS_VRS else 2 * d
+    indices = np.empty((m, width), dtype=np.int64)
+    data = np.empty((m, width))
+    indices[:, :d] = n + i[:, None] * d + np.arange(d)
+    indices[:, d:2 * d] = n + h[:, None] * d + np.arange(d)
+    data[:, :d] = np.take(x, i, axis=0)
+    data[:, d:2 * d] = -data[:, :d]
+    if rts == RTS_VRS:
+        indices[:, 2 * d], indices[:, 2 * d + 1] = i, h
+        data[:, 2 * d], data[:, 2 * d + 1] = 1.0, -1.0
+    A = sparse.csr_matrix((data.ravel(), indices.ravel(), np.arange(0, m * width + 1, width)),
+                          shape=(m, n * (d + 1)))
+    A.eliminate_zeros()
+    return A
+
+
+def regression_matrix(x, rts=RTS_VRS):
+    """Return the coefficients of alpha_i + beta_i x_i
+
+    Args:
+        x (float): input variables.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        csr_matrix: coefficients on the [alpha, beta] columns.
+    """
+    x = np.asarray(x, dtype=float)
+    n, d = x.shape
+    beta = sparse.csr_matrix((x.ravel(), np.arange(n * d), np.arange(0, n * d + 1, d)),
+                             shape=(n, n * d))
+    if rts == RTS_CRS:
+        return sparse.hstack([sparse.csr_matrix((n, n)), beta], format='csr')
+    return sparse.hstack([sparse.identity(n, format='csr'), beta], format='csr')
+
+
+def cnls_program(y, x, z=None, fun=FUN_PROD, rts=RTS_VRS):
+    """Assemble the additive CNLS problem as a sparse quadratic program
+
+    The variables are ordered as [alpha, beta, epsilon, lamda].
+
+    Args:
+        y (float): output variable.
+        x (float): input variables.
+        z (float, optional): Contextual variable(s). Defaults to None.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        QuadraticProgram: the CNLS problem.
+    """
+    x = np.asarray(x, dtype=float)
+    n, d = x.shape
+    k = 0 if z is None else np.asarray(z).shape[1]
+
+    # regression equation: alpha_i + beta_i x_i + lamda z_i + epsilon_i = y_i
+    regression = [regression_matrix(x, rts), sparse.identity(n, format='csr')]
+    if z is not None:
+        regression.append(sparse.csr_matrix(np.asarray(z, dtype=float)))
+    regression = sparse.hstack(regression, format='csr')
+
+    # afriat inequality: alpha_i + beta_i x_i <= (>=) alpha_h + beta_h x_i
+    afriat = afriat_matrix(x, *afriat_pairs(n), rts=rts)
+    afriat.resize((afriat.shape[0], n * (d + 2) + k))
+    if fun == FUN_PROD:
+        afriat_lb, afriat_ub = np.full(afriat.shape[0], -np.inf), np.zeros(afriat.shape[0])
+    elif fun == FUN_COST:
+        afriat_lb, afriat_ub = np.zeros(afriat.shape[0]), np.full(afriat.shape[0], np.inf)
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    num_var = n * (d + 2) + k
+    P = sparse.diags(np.concatenate([np.zeros(n * (d + 1)), 2 * np.ones(n), np.zeros(k)]))
+    xlb = np.full(num_var, -np.inf)
+    xlb[n:n * (d + 1)] = 0.0
+    xub = np.full(num_var, np.inf)
+    if rts == RTS_CRS:
+        xlb[:n], xub[:n] = 0.0, 0.0
+
+    y = np.asarray(y, dtype=float)
+    return QuadraticProgram(P, np.zeros(num_var),
+                            sparse.vstack([regression, afriat], format='csr'),
+                            np.concatenate([y, afriat_lb]),
+                            np.concatenate([y, afriat_ub]),
+                            xlb, xub)
+
+
+def block_columns(v):
+    """Return the block diagonal matrix with the rows of v as its columns
+
+    Args:
+        v (float): values, one row per block.
+
+    Returns:
+        csr_matrix: matrix with v[o, j] at row o * m + j and column o, where m is the number of columns of v.
+    """
+    v = np.asarray(v, dtype=float)
+    n, m = v.shape
+    return sparse.csr_matrix((v.ravel(), np.repeat(np.arange(n), m), np.arange(n * m + 1)),
+                             shape=(n * m, n))
+
+
+def dea_program(y, x, orient, rts, yref, xref, integer=False):
+    """Assemble the envelopment problem of every DMU as one sparse linear program
+
+    The variables are ordered as [theta, lamda].
+
+    Args:
+        y (float): output variable.
+        x (float): input variables.
+        orient (String): ORIENT_IO (input orientation) or ORIENT_OO (output orientation).
+        rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale).
+        yref (float): reference output.
+        xref (float): reference inputs.
+        integer (bool, optional): whether lamda is binary, as in the free disposal hull. Defaults to False.
+
+    Returns:
+        QuadraticProgram: the envelopment problem.
+    """
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    yref, xref = np.asarray(yref, dtype=float), np.asarray(xref, dtype=float)
+    n, r = len(y), len(yref)
+    identity = sparse.identity(n, format='csr')
+
+    # input constraint: theta_o x_o >= lamda_o xref (io), or lamda_o xref <= x_o (oo)
+    # output constraint: lamda_o yref >= y_o (io), or theta_o y_o <= lamda_o yref (oo)
+    if orient == ORIENT_IO:
+        input_rows = sparse.hstack([-block_columns(x), sparse.kron(identity, xref.T)])
+        input_ub = np.zeros(x.size)
+        output_rows = sparse.hstack([sparse.csr_matrix((y.size, n)), -sparse.kron(identity, yref.T)])
+        output_ub = -y.ravel()
+        sign = 1.0
+    elif orient == ORIENT_OO:
+        input_rows = sparse.hstack([sparse.csr_matrix((x.size, n)), sparse.kron(identity, xref.T)])
+        input_ub = x.ravel()
+        output_rows = sparse.hstack([block_columns(y), -sparse.kron(identity, yref.T)])
+        output_ub = np.zeros(y.size)
+        sign = -1.0
+    else:
+        raise ValueError("Undefined model parameters.")
+    rows, lb, ub = [input_rows, output_rows], [np.full(x.size + y.size, -np.inf)], [input_ub, output_ub]
+
+    if rts == RTS_VRS:
+        # the intensity variables of each DMU sum to one
+        rows.append(sparse.hstack([sparse.csr_matrix((n, n)), sparse.kron(identity, np.ones((1, r)))]))
+        lb.append(np.ones(n))
+        ub.append(np.ones(n))
+    elif rts != RTS_CRS:
+        raise ValueError("Undefined model parameters.")
+
+    num_var = n * (r + 1)
+    xlb = np.concatenate([np.full(n, -np.inf), np.zeros(n * r)])
+    xub = np.concatenate([np.full(n, np.inf), np.full(n * r, 1.0 if integer else np.inf)])
+    integrality = np.concatenate([np.zeros(n), np.full(n * r, int(integer))])
+    return QuadraticProgram(sparse.csc_matrix((num_var, num_var)),
+                            np.concatenate([np.full(n, sign), np.zeros(n * r)]),
+                            sparse.vstack(rows, format='csr'),
+                            np.concatenate(lb), np.concatenate(ub),
+                            xlb, xub, integrality)
+
+
+def ddf_program(y, x, b, gy, gx, gb, rts, yref, xref, bref):
+    """Assemble the directional distance function of every DMU as one sparse linear program
+
+    The variables are ordered as [theta, lamda].
+
+    Args:
+        y (float): output variable.
+        x (float): input variables.
+        b (float): undesirable output variables, or None.
+        gy (float): output directional vector.
+        gx (float): input directional vector.
+        gb (float): undesirable output directional vector, or None.
+        rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale).
+        yref (float): reference output.
+        xref (float): reference inputs.
+        bref (float): reference undesirable output, or None.
+
+    Returns:
+        QuadraticProgram: the directional distance function.
+    """
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    yref, xref = np.asarray(yref, dtype=float), np.asarray(xref, dtype=float)
+    n, r = len(y), len(yref)
+    identity = sparse.identity(n, format='csr')
+
+    # input constraint: theta_o gx + lamda_o xref <= x_o
+    # output constraint: theta_o gy - lamda_o yref <= -y_o
+    rows = [sparse.hstack([block_columns(np.tile(gx, (n, 1))), sparse.kron(identity, xref.T)]),
+            sparse.hstack([block_columns(np.tile(gy, (n, 1))), -sparse.kron(identity, yref.T)])]
+    lb = [np.full(x.size + y.size, -np.inf)]
+    ub = [x.ravel(), -y.ravel()]
+
+    if b is not None:
+        # undesirable output constraint: theta_o gb + lamda_o bref = b_o
+        b, bref = np.asarray(b, dtype=float), np.asarray(bref, dtype=float)
+        rows.append(sparse.hstack([block_columns(np.tile(gb, (n, 1))), sparse.kron(identity, bref.T)]))
+        lb.append(b.ravel())
+        ub.append(b.ravel())
+
+    if rts == RTS_VRS:
+        rows.append(sparse.hstack([sparse.csr_matrix((n, n)), sparse.kron(identity, np.ones((1, r)))]))
+        lb.append(np.ones(n))
+        ub.append(np.ones(n))
+    elif rts != RTS_CRS:
+        raise ValueError("Undefined model parameters.")
+
+    num_var = n * (r + 1)
+    return QuadraticProgram(sparse.csc_matrix((num_var, num_var)),
+                            np.concatenate([-np.ones(n), np.zeros(n * r)]),
+                            sparse.vstack(rows, format='csr'),
+                            np.concatenate(lb), np.concatenate(ub),
+                            np.concatenate([np.full(n, -np.inf), np.zeros(n * r)]),
+                            np.full(num_var, np.inf))
+
+
+def dual_program(y, x, orient, rts, yref, xref):
+    """Assemble the multiplier problem of every DMU as one sparse linear program
+
+    The variables are ordered as [nu, mu, omega], where omega is only present under RTS_VRS.
+
+    Args:
+        y (float): output variable.
+        x (float): input variables.
+        orient (String): ORIENT_IO (input orientation) or ORIENT_OO (output orientation).
+        rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale).
+        yref (float): reference output.
+        xref (float): reference inputs.
+
+    Returns:
+        QuadraticProgram: the multiplier problem.
+    """
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    yref, xref = np.asarray(yref, dtype=float), np.asarray(xref, dtype=float)
+    n, r = len(y), len(yref)
+    identity = sparse.identity(n, format='csr')
+    if rts not in (RTS_VRS, RTS_CRS):
+        raise ValueError("Undefined model parameters.")
+    omega = rts == RTS_VRS
+
+    if orient == ORIENT_IO:
+        # maximize mu_o y_o + omega_o s.t. nu_o x_o = 1
+        sign = 1.0
+        normalization = [block_columns(x).T, sparse.csr_matrix((n, y.size))]
+        q = [np.zeros(x.size), -y.ravel()]
+    elif orient == ORIENT_OO:
+        # minimize nu_o x_o + omega_o s.t. mu_o y_o = 1
+        sign = -1.0
+        normalization = [sparse.csr_matrix((n, x.size)), block_columns(y).T]
+        q = [x.ravel(), np.zeros(y.size)]
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    # technology constraint: mu_o yref_r - nu_o xref_r + omega_o <= 0 (io), or
+    # nu_o xref_r - mu_o yref_r + omega_o >= 0 (oo)
+    technology = [-sparse.kron(identity, xref), sparse.kron(identity, yref)]
+    if omega:
+        technology.append(sign * sparse.kron(identity, np.ones((r, 1))))
+        normalization.append(sparse.csr_matrix((n, n)))
+        q.append(np.full(n, -sign))
+
+    num_var = x.size + y.size + (n if omega else 0)
+    xlb = np.concatenate([np.zeros(x.size + y.size), np.full(num_var - x.size - y.size, -np.inf)])
+    return QuadraticProgram(sparse.csc_matrix((num_var, num_var)), np.concatenate(q),
+                            sparse.vstack([sparse.hstack(technology), sparse.hstack(normalization)],
+                                          format='csr'),
+                            np.concatenate([np.full(n * r, -np.inf), np.ones(n)]),
+                            np.concatenate([np.zeros(n * r), np.ones(n)]),
+                            xlb, np.full(num_var, np.inf))
+
+
+def model_program(model):
+    """Assemble a Pyomo model as a sparse quadratic program
+
+    The model must have linear constraints and a single linear or quadratic objective.
+    Only the variables appearing in the active constraints or in the objective are kept.
+
+    Args:
+        model (ConcreteModel): the model.
+
+    Returns:
+        tuple: the QuadraticProgram and its variables in column order.
+    """
+    from pyomo.environ import Constraint, Objective, maximize
+    from pyomo.repn import generate_standard_repn
+
+    columns, variables = {}, []
+
+    def column(var):
+        if id(var) not in columns:
+            columns[id(var)] = len(variables)
+            variables.append(var)
+        return columns[id(var)]
+
+    row, col, data, lb, ub = [], [], [], [], []
+    for constraint in model.component_data_objects(Constraint, active=True, descend_into=True):
+        repn = generate_standard_repn(constraint.body, compute_values=True, quadratic=False)
+        if not repn.is_linear():
+            raise ValueError(
+                "Constraint {} is not linear.".format(constraint.name))
+        k = len(lb)
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            row.append(k)
+            col.append(column(var))
+            data.append(coef)
+        lb.append(-np.inf if constraint.lb is None else constraint.lb - repn.constant)
+        ub.append(np.inf if constraint.ub is None else constraint.ub - repn.constant)
+
+    objectives = list(model.component_data_objects(Objective, active=True, descend_into=True))
+    if len(objectives) != 1:
+        raise ValueError("The model must have a single active objective.")
+    repn = generate_standard_repn(objectives[0].expr, compute_values=True, quadratic=True)
+    if repn.nonlinear_expr is not None:
+        raise ValueError("The objective is neither linear nor quadratic.")
+    sign = -1.0 if objectives[0].sense == maximize else 1.0
+    q_index = [column(var) for var in repn.linear_vars]
+    P_row, P_col, P_data = [], [], []
+    for (var1, var2), coef in zip(repn.quadratic_vars, repn.quadratic_coefs):
+        i, j = column(var1), column(var2)
+        # 1/2 x'Px with P symmetric
+        P_row.extend([i, j])
+        P_col.extend([j, i])
+        P_data.extend([sign * coef, sign * coef])
+
+    num_var = len(variables)
+    q = np.zeros(num_var)
+    np.add.at(q, q_index, sign * np.asarray(repn.linear_coefs, dtype=float))
+    P = sparse.csc_matrix((P_data, (P_row, P_col)), shape=(num_var, num_var))
+    A = sparse.csr_matrix((data, (row, col)), shape=(len(lb), num_var))
+    xlb = np.array([-np.inf if var.lb is None else var.lb for var in variables], dtype=float)
+    xub = np.array([np.inf if var.ub is None else var.ub for var in variables], dtype=float)
+    return QuadraticProgram(P, q, A, lb, ub, xlb, xub), variables
+
+
+def load_values(var, values):
+    """Load the values into an indexed Pyomo variable in index order
+
+    Args:
+        var (Var): indexed Pyomo variable.
+        values (float): values ordered as the index set of the variable.
+    """
+    clear_values(var.model())
+    for data, value in zip(var.values(), np.ravel(values)):
+        data.set_value(float(value), skip_validation=True)
+
+
+def load_solution(variables, solution):
+    """Load the consecutive blocks of the solution vector into the indexed Pyomo variables
+
+    Args:
+        variables (list): indexed Pyomo variables in column order.
+        solution (float): solution vector of the program.
+    """
+    start = 0
+    for var in variables:
+        load_values(var, solution[start:start + len(var)])
+        start += len(var)
@@ -0,0 +1,164 @@
+# import dependencies
+import numpy as np
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+
+def solve(program, tol=1e-8, max_iter=100):
+    """Solve a sparse quadratic program with the built-in interior point solver
+
+    The program min 1/2 x'Px + q'x s.t. lb <= Ax <= ub, xlb <= x <= xub is equilibrated and
+    solved by Mehrotra's predictor-corrector method. The equality rows are kept as
+    equalities and every finite bound of the other rows and of the variables becomes an
+    inequality with a slack. Each iteration factorizes one regularized KKT system, densely
+    if the afriat inequalities couple all the hyperplanes as in CNLS, and sparsely otherwise.
+
+    Args:
+        program (QuadraticProgram): the program to solve.
+        tol (float, optional): relative tolerance of the residuals and of the duality gap. Defaults to 1e-8.
+        max_iter (int, optional): maximal number of iterations. Defaults to 100.
+
+    Returns:
+        tuple: best solution vector found and solver status. The solution only solves the program if the status is "optimal".
+    """
+    n = program.P.shape[0]
+    A = sparse.vstack([sparse.csr_matrix(program.A), sparse.identity(n, format='csr')], format='csr')
+    lower = np.concatenate([program.lb, program.xlb])
+    upper = np.concatenate([program.ub, program.xub])
+
+    # equilibrate the rows and the columns
+    D, E = __ruiz_scaling(A)
+    A = sparse.diags(E) @ A @ sparse.diags(D)
+    P = sparse.csr_matrix(sparse.diags(D) @ program.P @ sparse.diags(D))
+    q = D * program.q
+    lower, upper = E * lower, E * upper
+    cost = max(np.max(np.abs(P.data), initial=0.0), np.max(np.abs(q), initial=0.0), 1.0)
+    P, q = P / cost, q / cost
+
+    # split into equalities A_eq x = b and inequalities G x <= h
+    equality = lower == upper
+    A_eq, b = A[np.flatnonzero(equality)], lower[equality]
+    has_lower = np.flatnonzero(~equality & np.isfinite(lower))
+    has_upper = np.flatnonzero(~equality & np.isfinite(upper))
+    G = sparse.vstack([A[has_upper], -A[has_lower]], format='csr')
+    h = np.concatenate([upper[has_upper], -lower[has_lower]])
+    GT, A_eqT = G.T.tocsr(), A_eq.T.tocsr()
+    m = len(h)
+
+    x, y = np.zeros(n), np.zeros(len(b))
+    s, z = np.maximum(h, 1.0), np.ones(m)
+    best, best_x, stalled = np.inf, x, 0
+    status = "maximum iterations reached"
+    for _ in range(max_iter):
+        Px, A_eqTy, GTz = P @ x, A_eqT @ y, GT @ z
+        r_dual = Px + q + A_eqTy + GTz
+        r_eq = A_eq @ x - b
+        r_ineq = G @ x + s - h
+        gap = s @ z
+        mu = gap / max(m, 1)
+        # residuals relative to the terms they are made of
+        error = max(__norm(r_dual) / (1 + max(__norm(Px), __norm(q), __norm(A_eqTy), __norm(GTz))),
+                    __norm(r_eq) / (1 + __norm(b)),
+                    __norm(r_ineq) / (1 + __norm(h)),
+                    gap / (1 + abs(0.5 * x @ Px + q @ x)))
+        if error < best:
+            best, best_x, stalled = error, x, 0
+        else:
+            stalled += 1
+        if best <= tol:
+            status = "optimal"
+            break
+        # the system gets ill-conditioned near the solution, and the iterates may stop
+        # improving or the factorization fail before the tolerance is reached
+        solve_newton = __newton_system(P, A_eq, G, z / s) if stalled < 5 else None
+        if solve_newton is None:
+            status = "optimal" if best <= 100 * tol else "numerical error"
+            break
+
+        def direction(r_cent):
+            # eliminate the slacks and the inequality multipliers
+            rhs = -r_dual - GT @ (z / s * r_ineq - r_cent / s)
+            dx, dy = solve_newton(rhs, -r_eq)
+            dz = z / s * (G @ dx + r_ineq) - r_cent / s
+            ds = -r_ineq - G @ dx
+            return dx, dy, dz, ds
+
+        # predictor
+        dx, dy, dz, ds = direction(s * z)
+        step = min(__step_length(s, ds), __step_length(z, dz))
+        mu_affine = (s + step * ds) @ (z + step * dz) / max(m, 1)
+        sigma = (mu_affine / mu) ** 3 if mu > 0 else 0.0
+
+        # corrector
+        dx, dy, dz, ds = direction(s * z + ds * dz - sigma * mu)
+        step = min(1.0, 0.99 * min(__step_length(s, ds), __step_length(z, dz)))
+        x, y, z, s = x + step * dx, y + step * dy, z + step * dz, s + step * ds
+
+    return D * best_x, status
+
+
+def __ruiz_scaling(A, iterations=10):
+    """Return the column and row scaling D and E equilibrating A in the infinity norm"""
+    D, E = np.ones(A.shape[1]), np.ones(A.shape[0])
+    scaled = sparse.csr_matrix(A)
+    for _ in range(iterations):
+        row = __row_norm(scaled)
+        column = __row_norm(scaled.T.tocsr())
+        row_scale = 1 / np.sqrt(np.where(row > 0, row, 1.0))
+        column_scale = 1 / np.sqrt(np.where(column > 0, column, 1.0))
+        scaled = sparse.csr_matrix(sparse.diags(row_scale) @ scaled @ sparse.diags(column_scale))
+        D, E = D * column_scale, E * row_scale
+    return D, E
+
+
+def __norm(v):
+    """Return the infinity norm of a vector"""
+    return np.max(np.abs(v), initial=0.0)
+
+
+def __row_norm(M):
+    """Return the infinity norm of each row of a csr matrix"""
+    norm = np.zeros(M.shape[0])
+    nonempty = np.diff(M.indptr) > 0
+    norm[nonempty] = np.maximum.reduceat(np.abs(M.data), M.indptr[:-1][nonempty])
+    return norm
+
+
+def __newton_system(P, A_eq, G, w, delta=1e-10, refinements=3):
+    """Factorize the reduced KKT system [[P + G'WG, A_eq'], [A_eq, 0]]
+
+    Returns:
+        function: solution dx, dy of the system for the right hand sides, or None if it is singular.
+    """
+    n, k = P.shape[0], A_eq.shape[0]
+    H = P + G.T @ sparse.diags(w) @ G
+    K = sparse.bmat([[H, A_eq.T], [A_eq, None]], format='csc')
+    regularization = sparse.diags(np.concatenate([np.full(n, delta), np.full(k, -delta)]))
+    # the afriat inequalities couple all the hyperplanes, which makes the system dense for CNLS
+    try:
+        if K.shape[0] <= 8000 and K.nnz > 0.05 * K.shape[0] ** 2:
+            factor = lu_factor((K + regularization).toarray(), check_finite=False)
+            solve_system = lambda rhs: lu_solve(factor, rhs, check_finite=False)
+        else:
+            solve_system = splu((K + regularization).tocsc()).solve
+    except (RuntimeError, ValueError):
+        return None
+
+    def solve_newton(rhs_x, rhs_y):
+        rhs = np.concatenate([rhs_x, rhs_y])
+        solution = solve_system(rhs)
+        # iterative refinement against the unregularized system
+        for _ in range(refinements):
+            solution = solution + solve_system(rhs - K @ solution)
+        return solution[:n], solution[n:]
+
+    return solve_newton
+
+
+def __step_length(v, dv):
+    """Return the largest step in [0, 1] keeping v + step * dv nonnegative"""
+    negative = dv < 0
+    if not np.any(negative):
+        return 1.0
+    return min(1.0, np.min(-v[negative] / dv[negative]))
@@ -0,0 +1,37 @@
+# import dependencies
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from ..constant import OPT_DEFAULT, OPT_LOCAL
+
+
+def fit(model_class, arguments, taus, email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1):
+    """Estimate the model at each of the given quantiles in worker processes
+
+    The quantiles are split into contiguous blocks, and each worker process builds a single
+    model at the first quantile of its block, which it estimates at the following ones by
+    changing only the objective weights.
+
+    Args:
+        model_class (class): the CQR-family model class.
+        arguments (dict): arguments of model_class.
+        taus (float): quantiles.
+        email (string, optional): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+        solver (string, optional): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        processes (int, optional): number of worker processes sharing the quantiles. Defaults to 1.
+
+    Returns:
+        tuple: alpha (None under RTS_CRS), beta and residual, stacked by tau.
+    """
+    chunks = [chunk for chunk in np.array_split(np.asarray(taus, dtype=float), max(processes or 1, 1))
+              if len(chunk) > 0]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = list(pool.map(__fit_quantiles, [model_class] * len(chunks), [arguments] * len(chunks),
+                                chunks, [email] * len(chunks), [solver] * len(chunks)))
+    return tuple(None if results[0][k] is None else np.vstack([result[k] for result in results])
+                 for k in range(3))
+
+
+def __fit_quantiles(model_class, arguments, taus, email, solver):
+    """Estimate a model built at the first quantile at each of the given quantiles, in order"""
+    model = model_class(**dict(arguments, tau=taus[0]))
+    return model.fit_quantiles(taus, email, solver)
@@ -0,0 +1,101 @@
+# import dependencies
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from ..constant import CET_ADDI, CET_MULT, BTS_RESIDUAL, OPT_DEFAULT, OPT_LOCAL
+
+
+def estimate(model_class, arguments, resampling, method, y, residual, draws,
+             email=OPT_LOCAL, solver=OPT_DEFAULT, processes=1, warm_start=False, bandwidth=None, grid_size=4096):
+    """Estimate the model and its StoNED decomposition on bootstrap replicates
+
+    Under the residual bootstrap, the outputs of replicate k are the fitted frontier with
+    the residuals of the DMUs in draws[k]. With warm_start, each worker process builds a
+    single model that it refits on the outputs of its following replicates, if the model
+    supports it, so that each solve starts from the previous replicate of the worker.
+    Under the pairs bootstrap, the model is rebuilt on the DMUs in draws[k], and the
+    estimates of a DMU drawn several times are averaged, while those of a DMU not drawn
+    are nan.
+
+    Args:
+        model_class (class): the CNLS-family model class.
+        arguments (dict): arguments of model_class, with the original data.
+        resampling (String): BTS_RESIDUAL (residual bootstrap) or BTS_PAIRS (pairs bootstrap).
+        method (String): RED_MOM (Method of moments) or RED_QLE (Quassi-likelihood estimation) or RED_KDE (Kernel deconvolution estimation).
+        y (float): output variable, or None under the pairs bootstrap.
+        residual (float): residuals of the fitted model, or None under the pairs bootstrap.
+        draws (int): DMUs drawn in each replicate, one row per replicate.
+        email (string, optional): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+        solver (string, optional): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        processes (int, optional): number of worker processes sharing the replicates. Defaults to 1.
+        warm_start (bool, optional): whether to refit a single model per worker process under the residual bootstrap. The estimates then depend on processes up to the solver tolerance. Defaults to False, which estimates each replicate from scratch.
+        bandwidth (float, optional): bandwidth of the kernel density with RED_KDE. Defaults to None, the rule-of-thumb bandwidth of Silverman (1986).
+        grid_size (int, optional): number of grid points of the binned kernel density with RED_KDE, or None to evaluate the density at every residual exactly. Defaults to 4096.
+
+    Returns:
+        tuple: estimated frontier, technical efficiency and StoNED frontier of each DMU, one row per replicate.
+    """
+    if processes is None or processes <= 1:
+        chunks = [np.arange(len(draws))]
+    else:
+        chunks = np.array_split(np.arange(len(draws)), min(processes, len(draws)))
+
+    if len(chunks) == 1:
+        results = [__estimate_replicates(model_class, arguments, resampling, method, y, residual,
+                                         draws, email, solver, warm_start, bandwidth, grid_size)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = list(pool.map(__estimate_replicates, [model_class] * len(chunks), [arguments] * len(chunks),
+                                    [resampling] * len(chunks), [method] * len(chunks), [y] * len(chunks),
+                                    [residual] * len(chunks), [draws[chunk] for chunk in chunks],
+                                    [email] * len(chunks), [solver] * len(chunks), [warm_start] * len(chunks),
+                                    [bandwidth] * len(chunks), [grid_size] * len(chunks)))
+    return tuple(np.vstack([result[k] for result in results]) for k in range(3))
+
+
+def __estimate_replicates(model_class, arguments, resampling, method, y, residual, draws, email, solver, warm_start,
+                          bandwidth, grid_size):
+    """Estimate the model on the given replicates, in the given order"""
+    from ..StoNED import StoNED
+
+    n = draws.shape[1]
+    estimates = np.full((3, len(draws), n), np.nan)
+    template = None
+    for k, draw in enumerate(draws):
+        if resampling == BTS_RESIDUAL:
+            # y = fitted frontier + residual, or fitted frontier * exp(residual)
+            if arguments.get('cet', CET_ADDI) == CET_MULT:
+                replicate = y * np.exp(residual[draw] - residual)
+            else:
+                replicate = y - residual + residual[draw]
+            model = __refit(template, replicate, email, solver) if warm_start else None
+            if model is None:
+                model = model_class(**dict(arguments, y=replicate))
+                model.optimize(email, solver)
+            template = model
+        else:
+            # the data of each DMU are resampled together
+            model = model_class(**{name: value[draw] if name in ('y', 'x', 'z', 'w', 'b') and value is not None
+                                   else value for name, value in arguments.items()})
+            model.optimize(email, solver)
+
+        decomposition = StoNED(model)
+        values = (model.get_frontier(), decomposition.get_technical_inefficiency(method, bandwidth, grid_size),
+                  decomposition.get_stoned(method, bandwidth=bandwidth, grid_size=grid_size))
+        for estimate, value in zip(estimates, values):
+            if resampling == BTS_RESIDUAL:
+                estimate[k] = value
+            else:
+                with np.errstate(invalid='ignore'):
+                    estimate[k] = np.bincount(draw, weights=value, minlength=n) / np.bincount(draw, minlength=n)
+    return estimates
+
+
+def __refit(template, y, email, solver):
+    """Return the template refitted on the outputs y, or None if it cannot be refitted"""
+    if template is None or not hasattr(template, 'refit'):
+        return None
+    try:
+        template.refit(y=y, email=email, solver=solver)
+    except ValueError:
+        return None
+    return template
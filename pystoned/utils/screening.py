@@ -0,0 +1,173 @@
+# import dependencies
+import numpy as np
+from .tools import to_2d_array
+from ..constant import RTS_VRS, RTS_CRS
+
+
+def nondominated(y, x, chunk_size=1000):
+    """Return whether each DMU is dominated by no other DMU
+
+    A DMU is dominated if another DMU uses no more of every input and produces no less
+    of every output. Of identical DMUs only the first is kept. The DMUs are visited in
+    decreasing order of their normalized outputs less inputs, so that a DMU can only be
+    dominated by a nondominated DMU visited before.
+
+    Args:
+        y (float): output variables.
+        x (float): input variables.
+        chunk_size (int, optional): number of DMUs compared at once. Defaults to 1000.
+
+    Returns:
+        numpy.ndarray: True for the nondominated DMUs.
+    """
+    y, x = to_2d_array(y), to_2d_array(x)
+    # outputs enter with a negative sign, so that smaller is better in every column
+    v = np.column_stack([x, -y])
+    scale = np.mean(np.abs(v), axis=0)
+    order = np.argsort(np.sum(v / np.where(scale > 0, scale, 1.0), axis=1), kind="stable")
+
+    kept = np.zeros(len(v), dtype=bool)
+    frontier = np.empty((0, v.shape[1]))
+    for start in range(0, len(order), chunk_size):
+        index = order[start:start + chunk_size]
+        chunk = v[index]
+        # dominated by a nondominated DMU of the previous chunks
+        dominated = np.zeros(len(index), dtype=bool)
+        for begin in range(0, len(frontier), chunk_size):
+            dominated |= np.any(np.all(frontier[begin:begin + chunk_size, None, :] <= chunk[None, :, :],
+                                       axis=2), axis=0)
+        # dominated by a DMU visited before within the chunk
+        weakly = np.all(chunk[:, None, :] <= chunk[None, :, :], axis=2)
+        dominated |= np.any(np.triu(weakly, 1), axis=0)
+        kept[index[~dominated]] = True
+        frontier = np.vstack([frontier, chunk[~dominated]])
+    return kept
+
+
+def extreme(y, x, b=None, rts=RTS_VRS, tol=1e-9):
+    """Return whether each DMU is needed to span the technology of all DMUs
+
+    The DMUs that are in the technology spanned by the others can be dropped from the
+    reference set without changing any efficiency score. After the dominance filter, the
+    remaining DMUs are visited in the same order and each is kept only if it is outside
+    the technology of the DMUs kept so far, which takes a small linear program. A second
+    pass drops the kept DMUs that turned out to be in the technology of the others.
+
+    Args:
+        y (float): output variables.
+        x (float): input variables.
+        b (float, optional): undesirable output variables, held with equality. Defaults to None.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+        tol (float, optional): tolerance of the radial input contraction. Defaults to 1e-9.
+
+    Returns:
+        numpy.ndarray: True for the extreme-efficient DMUs.
+    """
+    if rts not in (RTS_VRS, RTS_CRS):
+        raise ValueError("Undefined model parameters.")
+    y, x = to_2d_array(y), to_2d_array(x)
+    b = np.empty((len(y), 0)) if b is None else to_2d_array(b)
+
+    # the dominance filter does not hold the undesirable outputs with equality
+    candidate = nondominated(y, x) if b.shape[1] == 0 else np.ones(len(y), dtype=bool)
+    v = np.column_stack([x, -y])
+    scale = np.mean(np.abs(v), axis=0)
+    order = np.argsort(np.sum(v / np.where(scale > 0, scale, 1.0), axis=1), kind="stable")
+    order = order[candidate[order]]
+
+    technology = __Technology(y, x, b, rts, tol)
+    for r in order:
+        if not technology.contains(r):
+            technology.add(r)
+    for r in list(technology.members):
+        technology.remove(r)
+        if not technology.contains(r):
+            technology.add(r)
+
+    kept = np.zeros(len(y), dtype=bool)
+    kept[technology.members] = True
+    return kept
+
+
+class __Technology:
+    """Technology spanned by a growing set of DMUs"""
+
+    def __init__(self, y, x, b, rts, tol):
+        self.y, self.x, self.b, self.rts, self.tol = y, x, b, rts, tol
+        self.members = []
+        try:
+            import highspy
+        except ImportError:
+            self.h = None
+            return
+
+        # variables [theta, lamda], with -theta x_r + X lamda <= 0, Y lamda >= y_r, B lamda = b_r
+        m, s, l = x.shape[1], y.shape[1], b.shape[1]
+        self.h = highspy.Highs()
+        self.h.setOptionValue("output_flag", False)
+        self.h.addVar(-np.inf, np.inf)
+        self.h.changeColCost(0, 1.0)
+        lower = np.concatenate([np.full(m, -np.inf), np.zeros(s + l), np.ones(int(rts == RTS_VRS))])
+        upper = np.concatenate([np.zeros(m), np.full(s, np.inf), np.zeros(l), np.ones(int(rts == RTS_VRS))])
+        self.h.addRows(len(lower), lower, upper, 0, np.zeros(0, dtype=np.int32),
+                       np.zeros(0, dtype=np.int32), np.zeros(0))
+        self.columns = {}
+
+    def contains(self, r):
+        """Return whether DMU r is in the technology spanned by the members"""
+        if len(self.members) == 0:
+            return False
+        if self.h is None:
+            return self.__contains_linprog(r)
+        import highspy
+
+        m, s, l = self.x.shape[1], self.y.shape[1], self.b.shape[1]
+        for j in range(m):
+            self.h.changeCoeff(j, 0, -self.x[r, j])
+        rows = np.arange(m, m + s + l, dtype=np.int32)
+        self.h.changeRowsBounds(len(rows), rows, np.concatenate([self.y[r], self.b[r]]),
+                                np.concatenate([np.full(s, np.inf), self.b[r]]))
+        self.h.run()
+        status = self.h.getModelStatus()
+        if status == highspy.HighsModelStatus.kOptimal:
+            return self.h.getSolution().col_value[0] <= 1 + self.tol
+        return status == highspy.HighsModelStatus.kUnbounded
+
+    def add(self, r):
+        """Add DMU r to the members"""
+        self.members.append(r)
+        if self.h is None:
+            return
+        if r in self.columns:
+            self.h.changeColBounds(self.columns[r], 0, np.inf)
+            return
+        values = np.concatenate([self.x[r], self.y[r], self.b[r], np.ones(int(self.rts == RTS_VRS))])
+        self.h.addCol(0.0, 0.0, np.inf, len(values), np.arange(len(values), dtype=np.int32), values)
+        self.columns[r] = self.h.getNumCol() - 1
+
+    def remove(self, r):
+        """Remove DMU r from the members"""
+        self.members.remove(r)
+        if self.h is not None:
+            self.h.changeColBounds(self.columns[r], 0, 0)
+
+    def __contains_linprog(self, r):
+        """Return whether DMU r is in the technology, with the HiGHS solver bundled with scipy"""
+        from scipy.optimize import linprog
+
+        F = self.members
+        m = self.x.shape[1]
+        A_ub = np.vstack([np.column_stack([-self.x[r], self.x[F].T]),
+                          np.column_stack([np.zeros(self.y.shape[1]), -self.y[F].T])])
+        b_ub = np.concatenate([np.zeros(m), -self.y[r]])
+        A_eq = np.column_stack([np.zeros(self.b.shape[1]), self.b[F].T])
+        b_eq = self.b[r]
+        if self.rts == RTS_VRS:
+            A_eq = np.vstack([A_eq, np.append(0.0, np.ones(len(F)))])
+            b_eq = np.append(b_eq, 1.0)
+        result = linprog(np.append(1.0, np.zeros(len(F))), A_ub=A_ub, b_ub=b_ub,
+                         A_eq=A_eq if len(b_eq) else None, b_eq=b_eq if len(b_eq) else None,
+                         bounds=[(None, None)] + [(0, None)] * len(F), method='highs')
+        if result.status == 0:
+            return result.x[0] <= 1 + self.tol
+        return result.status == 3
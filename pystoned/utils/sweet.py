@@ -1,35 +1,91 @@
 # import dependencies
 import numpy as np
+from scipy import sparse
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
-from .tools import trans_list, to_2d_list
+from .tools import to_2d_array
 
 
-def sweet(x):
+def sweet(x, block_size=None, kdtree=False):
     """Sweet spot approach
 
+    The observation h is in the sweet spot of the observation i if their distance is within
+    the 3rd percentile of the distances from i to the other observations. The distances are
+    evaluated in row blocks, or by a KD-tree for low-dimensional x.
+
     Args:
         x (float): input variables.
+        block_size (int, optional): number of rows of the distance matrix evaluated at once. Defaults to about 2**22 distances per block.
+        kdtree (bool, optional): find the sweet spot by a KD-tree instead of the distance matrix, which may differ only in the exact ties at the cut. Defaults to False.
 
     Returns:
-        list: active concavity constraint.
+        csr_matrix: active concavity constraint.
     """
 
     # transform data
-    df = np.asmatrix(to_2d_list(trans_list(x)))
+    x = to_2d_array(x)
+    n = len(x)
+
+    # position of the 3rd percentile among the n-1 distances to the other observations
+    index = 0.03 * (n - 2)
+    lower = int(np.floor(index))
+    upper = min(lower + 1, n - 2)
+    weight = index - lower
+
+    if kdtree:
+        # the nearest neighbor of each observation is itself at distance 0
+        tree = cKDTree(x)
+        distance, _ = tree.query(x, k=upper + 2)
+        distcut = __lerp(distance[:, lower + 1], distance[:, upper + 1], weight)
+        # widen the cut by the rounding error, so that the ties at the cut are kept
+        neighbors = tree.query_ball_point(x, distcut * (1 + 1e-9))
+        indptr = np.concatenate(([0], np.cumsum([len(h) for h in neighbors])))
+        indices = np.concatenate([np.asarray(h, dtype=np.int64) for h in neighbors])
+        cutactive = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+        cutactive.sort_indices()
+        return cutactive
+
+    if block_size is None:
+        block_size = max(1, 2 ** 22 // max(n, 1))
+
+    rows, cols = [], []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        distance = cdist(x[start:stop], x)
+        diagonal = (np.arange(stop - start), np.arange(start, stop))
+
+        # calculate distance cut, leaving out the distance of each observation to itself
+        distance[diagonal] = np.inf
+        ordered = np.partition(distance, [lower, upper], axis=1)
+        distcut = __lerp(ordered[:, lower], ordered[:, upper], weight)
+
+        # find concavity constraint in sweet spot
+        distance[diagonal] = 0
+        i, h = np.nonzero(distance <= distcut[:, None])
+        rows.append(i + start)
+        cols.append(h)
 
-    # calculate distance matrix
-    distance = cdist(df, df)
-    distance[np.diag_indices_from(distance)] = np.nan
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
 
-    # calculate distance cut
-    distcut = np.asmatrix(np.nanpercentile(distance, 3, axis=0))
 
-    # find concavity constraint in sweet spot
-    distance = np.where(np.isnan(distance), 0, distance)
-    cutactive = np.zeros((len(distance), len(distance)))
-    for i in range(len(distance)):
-        for j in range(len(distance)):
-            if distance[i, j] <= distcut[:, i]:
-                cutactive[i, j] = 1
+def __lerp(a, b, t):
+    """Linear interpolation between a and b, computed as numpy.percentile does"""
+    if t >= 0.5:
+        return b - (b - a) * (1 - t)
+    return a + (b - a) * t
 
-    return to_2d_list(trans_list(cutactive))
+
+def pairs(active):
+    """Return the index pairs (i, h), i != h, of the active constraints
+
+    Args:
+        active (float): active constraint, as a (sparse) matrix or nested lists.
+
+    Returns:
+        list: index pairs of the active constraints.
+    """
+    active = sparse.coo_matrix(active)
+    active.sum_duplicates()
+    mask = (active.row != active.col) & (active.data != 0)
+    return list(zip(active.row[mask].tolist(), active.col[mask].tolist()))
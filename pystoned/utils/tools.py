@@ -1,10 +1,12 @@
 # import dependencies
+import inspect
 from re import compile
 from os import environ
+from weakref import WeakKeyDictionary
 import numpy as np
 from pyomo.opt import SolverFactory, SolverManagerFactory, check_available_solvers
 
-from ..constant import CET_ADDI, CET_MULT, CET_Model_Categories, OPT_LOCAL, OPT_DEFAULT, RTS_CRS
+from ..constant import CET_ADDI, CET_MULT, CET_Model_Categories, OPT_LOCAL, OPT_DEFAULT, OPT_NATIVE, RTS_CRS
 __email_re = compile(r'([^@]+@[^@]+\.[a-zA-Z0-9]+)$')
 
 def get_remote_solvers():
@@ -43,6 +45,9 @@ def set_neos_email(address):
 
 def optimize_model(model, email, cet, solver=OPT_DEFAULT):
     optimization_status = 0
+    clear_values(model)
+    if solver == OPT_NATIVE:
+        return __optimize_natively(model, email, cet)
     if not set_neos_email(email):
         if solver is not OPT_DEFAULT:
             assert_solver_available_locally(solver)
@@ -70,6 +75,154 @@ def optimize_model(model, email, cet, solver=OPT_DEFAULT):
         raise Exception("Remote solvers are temporarily not available.")
 
 
+__persistent_solvers = {"mosek": "mosek_persistent", "gurobi": "gurobi_persistent",
+                        "cplex": "cplex_persistent", "xpress": "xpress_persistent"}
+
+
+def optimize_model_persistent(model, email, cet, solver=OPT_DEFAULT, instance=None, constraints=(), changed=(),
+                              objective=None):
+    """Optimize the model and keep it alive in a persistent solver interface
+
+    Pass the returned instance back on the next call, together with the constraints added
+    to the model in between and those whose mutable parameters changed, to re-solve without
+    handing the whole model over again.
+    Remote optimization, multiplicative models and solvers without a persistent interface
+    fall back to optimize_model.
+
+    Args:
+        model (ConcreteModel): the model to optimize.
+        email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+        cet (String): CET_ADDI (additive composite error term) or CET_MULT (multiplicative composite error term).
+        solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        instance (optional): the persistent solver returned by the previous call. Defaults to None.
+        constraints (list, optional): constraints added to the model since the previous call. Defaults to ().
+        changed (list, optional): constraints whose mutable parameters changed since the previous call. Defaults to ().
+        objective (Objective, optional): the active objective, if its mutable parameters changed since the previous call. Defaults to None.
+
+    Returns:
+        tuple: solver results, optimization status and the persistent solver (None if not used).
+    """
+    clear_values(model)
+    if instance is None:
+        persistent = __persistent_solvers.get(
+            "mosek" if solver is OPT_DEFAULT else solver)
+        if email != OPT_LOCAL or cet != CET_ADDI or persistent is None \
+                or not SolverFactory(persistent).available(exception_flag=False):
+            return optimize_model(model, email, cet, solver) + (None,)
+        instance = SolverFactory(persistent)
+        instance.set_instance(model)
+        print("Estimating the {} locally with {} persistent solver.".format(
+            CET_Model_Categories[cet], persistent), flush=True)
+    else:
+        for constraint in constraints:
+            instance.add_constraint(constraint)
+        # the persistent interface reads the parameter values when a component is added
+        for constraint in changed:
+            instance.remove_constraint(constraint)
+            instance.add_constraint(constraint)
+        if objective is not None:
+            instance.set_objective(objective)
+    return instance.solve(model, tee=True), 1, instance
+
+
+def model_arguments(model):
+    """Return the arguments rebuilding the model, read off its attributes"""
+    arguments = {}
+    parameters = list(inspect.signature(type(model).__init__).parameters.values())[1:]
+    for parameter in parameters:
+        if hasattr(model, parameter.name):
+            arguments[parameter.name] = getattr(model, parameter.name)
+        elif parameter.default is inspect.Parameter.empty:
+            raise ValueError(
+                "The model does not keep its argument {}.".format(parameter.name))
+    return arguments
+
+
+def display_values(name, values):
+    """Display values kept by array in place of an indexed variable
+
+    Args:
+        name (String): name of the variable.
+        values (float): values of the variable, indexed by position.
+    """
+    values = np.asarray(values)
+    print("{} : Size={}".format(name, values.size))
+    print("    Key : Value")
+    for key, value in np.ndenumerate(values):
+        print("    {} : {}".format(key[0] if len(key) == 1 else key, value))
+
+
+__values = WeakKeyDictionary()
+
+
+def get_values(var):
+    """Return the values of an indexed variable by array
+
+    The values are read by index position into an array shaped by the index sets of the
+    variable, and kept until the model is optimized again.
+
+    Args:
+        var (Var): indexed Pyomo variable over ordered sets.
+
+    Returns:
+        numpy.ndarray: values of the variable, nan if a value is missing.
+    """
+    values = __values.setdefault(var.model(), {})
+    if var.name not in values:
+        shape = tuple(len(index) for index in var.index_set().subsets())
+        values[var.name] = np.fromiter((data.value if data.value is not None else np.nan
+                                        for data in var.values()),
+                                       dtype=float, count=len(var)).reshape(shape)
+    return values[var.name].copy()
+
+
+def get_cached(model, key, compute):
+    """Return a result derived from the values of the model, kept until it is optimized again
+
+    Args:
+        model (ConcreteModel): the model whose values the result is derived from.
+        key (tuple): name of the result, distinct from the variable names.
+        compute (function): computes the result from the current values.
+
+    Returns:
+        the result of compute.
+    """
+    values = __values.setdefault(model, {})
+    if key not in values:
+        values[key] = compute()
+    return values[key]
+
+
+def clear_values(model):
+    """Drop the values of the model kept by get_values
+
+    Args:
+        model (ConcreteModel): the model whose variables have new values.
+    """
+    __values.pop(model, None)
+
+
+def __optimize_natively(model, email, cet):
+    from .matrix import model_program
+    from .native import solve
+
+    if email != OPT_LOCAL:
+        raise ValueError("The native solver only supports local optimization.")
+    if cet != CET_ADDI:
+        raise ValueError("The native solver only supports the additive model.")
+    print("Estimating the {} locally with native solver.".format(
+        CET_Model_Categories[cet]), flush=True)
+    program, variables = model_program(model)
+    solution, status = solve(program)
+    if status != "optimal":
+        # an unconverged iterate is not an estimate of the model
+        print("The native solver stopped with {}.".format(status), flush=True)
+        return status, 0
+    for var, value in zip(variables, solution):
+        var.set_value(float(value), skip_validation=True)
+    return status, 1
+
+
 def __try_remote_solver(model, cet, solver):
     solver_instance = SolverManagerFactory('neos')
     try:
@@ -107,29 +260,63 @@ def to_2d_list(li):
     return li
 
 
-def assert_valid_basic_data(y, x, z=None):
-    y = trans_list(y)
-    x = trans_list(x)
+def to_1d_array(li):
+    """Return the data as a contiguous float64 vector
 
-    y = to_1d_list(y)
-    x = to_2d_list(x)
+    Arrays, data frames, series and buffers are not copied when they already hold
+    contiguous float64 values. A column vector is flattened and a scalar is wrapped.
 
-    y_shape = np.asarray(y).shape
-    x_shape = np.asarray(x).shape
+    Args:
+        li (float): the data.
 
-    if len(y_shape) == 2 and y_shape[1] != 1:
+    Returns:
+        numpy.ndarray: the data by vector (by matrix if it has more than one column).
+    """
+    array = np.asarray(li, dtype=float)
+    if array.ndim == 0:
+        array = array.reshape(1)
+    elif array.ndim == 2 and array.shape[1] == 1:
+        array = array[:, 0]
+    elif array.ndim > 2:
+        raise ValueError("The data must be a vector or a matrix.")
+    return np.ascontiguousarray(array)
+
+
+def to_2d_array(li):
+    """Return the data as a contiguous float64 matrix with one row per DMU
+
+    Arrays, data frames and buffers are not copied when they already hold C-contiguous
+    float64 values. A vector is turned into a single column.
+
+    Args:
+        li (float): the data.
+
+    Returns:
+        numpy.ndarray: the data by matrix.
+    """
+    array = np.asarray(li, dtype=float)
+    if array.ndim < 2:
+        array = array.reshape(-1, 1)
+    elif array.ndim > 2:
+        raise ValueError("The data must be a vector or a matrix.")
+    return np.ascontiguousarray(array)
+
+
+def assert_valid_basic_data(y, x, z=None):
+    y = to_1d_array(y)
+    x = to_2d_array(x)
+
+    if y.ndim == 2:
         raise ValueError(
             "The multidimensional output data is supported by direciontal based models.")
 
-    if y_shape[0] != x_shape[0]:
+    if y.shape[0] != x.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and y.")
 
     if type(z) != type(None):
-        z = trans_list(z)
-        z = to_2d_list(z)
-        z_shape = np.asarray(z).shape
-        if y_shape[0] != z_shape[0]:
+        z = to_2d_array(z)
+        if y.shape[0] != z.shape[0]:
             raise ValueError(
                 "Number of DMUs must be the same in y and z.")
 
@@ -137,38 +324,26 @@ def assert_valid_basic_data(y, x, z=None):
 
 
 def assert_valid_mupltiple_y_data(y, x):
-    y = trans_list(y)
-    x = trans_list(x)
+    y = to_2d_array(y)
+    x = to_2d_array(x)
 
-    y = to_2d_list(y)
-    x = to_2d_list(x)
-
-    y_shape = np.asarray(y).shape
-    x_shape = np.asarray(x).shape
-
-    if y_shape[0] != x_shape[0]:
+    if y.shape[0] != x.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and y.")
     return y, x
 
 
 def assert_valid_reference_data(y, x, yref, xref):
-    yref = trans_list(yref)
-    xref = trans_list(xref)
-
-    yref = to_2d_list(yref)
-    xref = to_2d_list(xref)
+    yref = to_2d_array(yref)
+    xref = to_2d_array(xref)
 
-    yref_shape = np.asarray(yref).shape
-    xref_shape = np.asarray(xref).shape
-
-    if yref_shape[0] != xref_shape[0]:
+    if yref.shape[0] != xref.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in xref and yref.")
-    if yref_shape[1] != np.asarray(y).shape[1]:
+    if yref.shape[1] != y.shape[1]:
         raise ValueError(
             "Number of outputs must be the same in y and yref.")
-    if xref_shape[1] != np.asarray(x).shape[1]:
+    if xref.shape[1] != x.shape[1]:
         raise ValueError(
             "Number of inputs must be the same in x and xref.")
     return yref, xref
@@ -180,13 +355,12 @@ def assert_valid_reference_data_with_bad_outputs(y, x, b, yref, xref, bref):
     if type(b) == type(None):
         return yref, xref, None
 
-    bref = to_2d_list(bref)
-    bref_shape = np.asarray(bref).shape
+    bref = to_2d_array(bref)
 
-    if bref_shape[0] != np.asarray(yref).shape[0]:
+    if bref.shape[0] != yref.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in yref and bref.")
-    if bref_shape[1] != np.asarray(b).shape[1]:
+    if bref.shape[1] != b.shape[1]:
         raise ValueError(
             "Number of undesirable outputs must be the same in b and bref.")
 
@@ -194,37 +368,29 @@ def assert_valid_reference_data_with_bad_outputs(y, x, b, yref, xref, bref):
 
 
 def assert_valid_direciontal_data(y, x, b=None, gy=[1], gx=[1], gb=None):
-    y = trans_list(y)
-    x = trans_list(x)
-
-    y = to_2d_list(y)
-    x = to_2d_list(x)
+    y = to_2d_array(y)
+    x = to_2d_array(x)
 
-    gy = to_1d_list(gy)
-    gx = to_1d_list(gx)
+    gy = to_1d_array(gy)
+    gx = to_1d_array(gx)
 
-    y_shape = np.asarray(y).shape
-    x_shape = np.asarray(x).shape
-
-    if y_shape[0] != x_shape[0]:
+    if y.shape[0] != x.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and y.")
 
-    if y_shape[1] != len(gy):
+    if y.shape[1] != len(gy):
         raise ValueError("Number of outputs must be the same in y and gy.")
 
-    if x_shape[1] != len(gx):
+    if x.shape[1] != len(gx):
         raise ValueError("Number of inputs must be the same in x and gx.")
 
     if type(b) != type(None):
-        b = trans_list(b)
-        b = to_2d_list(b)
-        gb = to_1d_list(gb)
-        b_shape = np.asarray(b).shape
-        if b_shape[0] != b_shape[0]:
+        b = to_2d_array(b)
+        gb = to_1d_array(gb)
+        if b.shape[0] != y.shape[0]:
             raise ValueError(
                 "Number of DMUs must be the same in y and b.")
-        if b_shape[1] != len(gb):
+        if b.shape[1] != len(gb):
             raise ValueError(
                 "Number of undesirable outputs must be the same in b and gb.")
 
@@ -267,35 +433,25 @@ def assert_solver_available_locally(solver):
 
 
 def assert_valid_wp_data(y, x, b, z=None):
-    y = trans_list(y)
-    x = trans_list(x)
-    b = trans_list(b)
-
-    y = to_1d_list(y)
-    x = to_2d_list(x)
-    b = to_2d_list(b)
+    y = to_1d_array(y)
+    x = to_2d_array(x)
+    b = to_2d_array(b)
 
-    y_shape = np.asarray(y).shape
-    x_shape = np.asarray(x).shape
-    b_shape = np.asarray(b).shape
-
-    if len(y_shape) == 2 and y_shape[1] != 1:
+    if y.ndim == 2:
         raise ValueError(
             "The multidimensional output data is supported by direciontal based models.")
 
-    if y_shape[0] != x_shape[0]:
+    if y.shape[0] != x.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and y.")
 
-    if x_shape[0] != b_shape[0]:
+    if x.shape[0] != b.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and b.")
 
     if type(z) != type(None):
-        z = trans_list(z)
-        z = to_2d_list(z)
-        z_shape = np.asarray(z).shape
-        if y_shape[0] != z_shape[0]:
+        z = to_2d_array(z)
+        if y.shape[0] != z.shape[0]:
             raise ValueError(
                 "Number of DMUs must be the same in y and z.")
 
@@ -303,24 +459,16 @@ def assert_valid_wp_data(y, x, b, z=None):
 
 
 def assert_valid_mupltiple_x_y_data(y, x, z=None):
-    y = trans_list(y)
-    x = trans_list(x)
-
-    y = to_2d_list(y)
-    x = to_2d_list(x)
-
-    y_shape = np.asarray(y).shape
-    x_shape = np.asarray(x).shape
+    y = to_2d_array(y)
+    x = to_2d_array(x)
 
-    if y_shape[0] != x_shape[0]:
+    if y.shape[0] != x.shape[0]:
         raise ValueError(
             "Number of DMUs must be the same in x and y.")
 
     if type(z) != type(None):
-        z = trans_list(z)
-        z = to_2d_list(z)
-        z_shape = np.asarray(z).shape
-        if y_shape[0] != z_shape[0]:
+        z = to_2d_array(z)
+        if y.shape[0] != z.shape[0]:
             raise ValueError(
                 "Number of DMUs must be the same in y and z.")
 
@@ -1,36 +1,91 @@
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from scipy.optimize import linprog
-from .tools import trans_list, to_1d_list, to_2d_list
+from .tools import to_1d_array, to_2d_array
 from ..constant import RTS_VRS, RTS_CRS
 
 
-def gmin(x, yhat, rts):
+def gmin(x, yhat, rts, processes=1):
+    """Return the value of the minimal hyperplane over the fitted values at each observation
 
-    if rts == RTS_VRS:
-        
-        x0 = np.ones(len(yhat))
-        x = np.column_stack((x0, x))
-        A = to_2d_list(trans_list(-x))
-        b = to_1d_list(trans_list(-yhat))
-        bounds = [(None, None)] + [(0, None) for _ in range(len(A[0]) - 1)]
-
-        gmin = []
-        for i in range(len(A)):
-            c = x[i, :]
-            res = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method='highs')
-            gmin.append(res.fun)
+    For each observation i, the linear program min alpha + beta x_i s.t. alpha + beta x_h >= yhat_h
+    for all h is solved. Only the cost vector changes between the programs, so the HiGHS model is
+    set up once per process and each solve is warm-started from the basis of the previous one.
+
+    Args:
+        x (float): input variables.
+        yhat (float): fitted values.
+        rts (String): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale).
+        processes (int, optional): number of worker processes sharing the observations. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: value of the minimal hyperplane at each observation.
+    """
+    x = to_2d_array(x)
+    yhat = to_1d_array(yhat)
 
+    if rts == RTS_VRS:
+        A = np.column_stack((np.ones(len(yhat)), x))
+        lower = np.append(-np.inf, np.zeros(x.shape[1]))
     elif rts == RTS_CRS:
+        A = x
+        lower = np.zeros(x.shape[1])
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    # neighboring observations have similar optimal bases
+    order = np.lexsort(x.T[::-1])
+    if processes is None or processes <= 1:
+        chunks = [order]
+    else:
+        chunks = np.array_split(order, processes)
+
+    gmin = np.empty(len(yhat))
+    if len(chunks) == 1:
+        gmin[order] = __minimal_hyperplanes(A, yhat, lower, order)
+        return gmin
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        values = pool.map(__minimal_hyperplanes,
+                          [A] * len(chunks), [yhat] * len(chunks), [lower] * len(chunks), chunks)
+        for index, value in zip(chunks, values):
+            gmin[index] = value
+    return gmin
+
+
+def __minimal_hyperplanes(A, yhat, lower, index):
+    """Solve the programs of the observations in index, in the given order"""
+    try:
+        import highspy
+    except ImportError:
+        bounds = [(value if np.isfinite(value) else None, None) for value in lower]
+        return np.array([__objective(linprog(A[i], A_ub=-A, b_ub=-yhat, bounds=bounds, method='highs'))
+                         for i in index])
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    # the basis stays primal feasible when only the costs change
+    h.setOptionValue("simplex_strategy", 4)
+    lp = highspy.HighsLp()
+    lp.num_col_, lp.num_row_ = A.shape[1], A.shape[0]
+    lp.col_cost_ = A[index[0]] if len(index) > 0 else np.zeros(A.shape[1])
+    lp.col_lower_, lp.col_upper_ = lower, np.full(A.shape[1], np.inf)
+    lp.row_lower_, lp.row_upper_ = yhat, np.full(A.shape[0], np.inf)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.start_ = np.arange(0, A.size + 1, A.shape[1])
+    lp.a_matrix_.index_ = np.tile(np.arange(A.shape[1]), A.shape[0])
+    lp.a_matrix_.value_ = A.ravel()
+    h.passModel(lp)
 
-        x = np.array(x)
-        A = to_2d_list(trans_list(-x))
-        b = to_1d_list(trans_list(-yhat))
-        bounds = [(0, None) for _ in range(len(A[0]))]
+    columns = np.arange(A.shape[1], dtype=np.int32)
+    gmin = np.full(len(index), np.nan)
+    for k, i in enumerate(index):
+        h.changeColsCost(len(columns), columns, A[i])
+        h.run()
+        if h.getModelStatus() == highspy.HighsModelStatus.kOptimal:
+            gmin[k] = h.getInfo().objective_function_value
+    return gmin
 
-        gmin = []
-        for i in range(len(A)):
-            c = x[i, :]
-            res = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method='highs')
-            gmin.append(res.fun)
 
-    return np.array(gmin)
+def __objective(result):
+    """Return the optimal value of a linprog result"""
+    return result.fun if result.status == 0 else np.nan
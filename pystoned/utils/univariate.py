@@ -0,0 +1,280 @@
+# import dependencies
+import numpy as np
+from scipy import sparse
+from scipy.linalg import solveh_banded
+from ..constant import FUN_PROD, FUN_COST, RTS_VRS, RTS_CRS, OPT_DEFAULT, OPT_LOCAL
+
+
+def is_univariate(x, z=None, rts=RTS_VRS):
+    """Check whether the model can be estimated by the univariate engine
+
+    Args:
+        x (float): input variables.
+        z (float, optional): Contextual variable(s). Defaults to None.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        bool: True if x has a single column, there is no contextual variable, and x is positive under RTS_CRS.
+    """
+    x = np.asarray(x, dtype=float)
+    if z is not None or x.ndim != 2 or x.shape[1] != 1:
+        return False
+    return rts == RTS_VRS or (rts == RTS_CRS and bool(np.all(x > 0)))
+
+
+def announce(email=OPT_LOCAL, solver=OPT_DEFAULT):
+    """Report that the univariate engine estimates the model in place of the requested solver
+
+    Args:
+        email (string, optional): The email address for remote optimization, which the engine does not support. Defaults to OPT_LOCAL.
+        solver (string, optional): The solver requested for optimization, which the engine does not use. Defaults to OPT_DEFAULT.
+    """
+    if email != OPT_LOCAL:
+        raise ValueError(
+            "The univariate engine only estimates locally. Use builder=BLD_RULE for remote optimization.")
+    if solver is OPT_DEFAULT:
+        print("Estimating the additive model locally with the exact univariate engine.")
+    else:
+        print("Estimating the additive model locally with the exact univariate engine instead of {} solver. "
+              "Use builder=BLD_RULE to solve with {}.".format(solver, solver))
+
+
+def cnls(y, x, fun=FUN_PROD, rts=RTS_VRS):
+    """Exact univariate convex nonparametric least squares
+
+    Args:
+        y (float): output variable.
+        x (float): input variable, with a single column.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        tuple: alpha, beta and residual of each observation.
+    """
+    y, x = __assert_univariate(y, x, fun, rts)
+    return __hyperplanes(y, x, __least_squares(y, x, np.ones(len(y)), fun, rts), fun)
+
+
+def cer(y, x, tau, fun=FUN_PROD, rts=RTS_VRS, max_iter=100):
+    """Exact univariate convex expectile regression
+
+    The asymmetric least squares problem is solved by reweighted least squares fits until
+    the signs of the residuals, and thus the weights, no longer change.
+
+    Args:
+        y (float): output variable.
+        x (float): input variable, with a single column.
+        tau (float): expectile.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+        max_iter (int, optional): maximal number of reweighting steps. Defaults to 100.
+
+    Returns:
+        tuple: alpha, beta and residual of each observation.
+    """
+    y, x = __assert_univariate(y, x, fun, rts)
+    positive = y > np.average(y)
+    for _ in range(max_iter):
+        fitted = __least_squares(y, x, np.where(positive, tau, 1 - tau), fun, rts)
+        if np.array_equal(y > fitted, positive):
+            return __hyperplanes(y, x, fitted, fun)
+        positive = y > fitted
+    raise Exception("The univariate expectile regression did not converge.")
+
+
+def cqr(y, x, tau, fun=FUN_PROD, rts=RTS_VRS):
+    """Exact univariate convex quantile regression
+
+    Under RTS_VRS the shape restrictions reduce to one constraint per pair of neighboring
+    inputs, and the linear program is solved by the HiGHS solver bundled with scipy.
+
+    Args:
+        y (float): output variable.
+        x (float): input variable, with a single column.
+        tau (float): quantile.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+
+    Returns:
+        tuple: alpha, beta and residual of each observation.
+    """
+    from scipy.optimize import linprog
+
+    y, x = __assert_univariate(y, x, fun, rts)
+    n = len(y)
+    if rts == RTS_CRS:
+        # tau-quantile of y/x weighted by x, as rho(y - b x) = x rho(y/x - b) for x > 0
+        ratio = y / x
+        order = np.argsort(ratio, kind="stable")
+        weight = np.cumsum(x[order])
+        slope = ratio[order][min(np.searchsorted(weight, tau * weight[-1]), n - 1)]
+        return __hyperplanes(y, x, max(slope, 0.0) * x, fun)
+
+    t, group = np.unique(x, return_inverse=True)
+    m = len(t)
+
+    # variables [g, epsilon_plus, epsilon_minus]: g_k + epsilon_plus_i - epsilon_minus_i = y_i
+    identity = sparse.identity(n, format="csr")
+    A_eq = sparse.hstack([sparse.csr_matrix((np.ones(n), (np.arange(n), group)), shape=(n, m)),
+                          identity, -identity], format="csr")
+    A_ub = sparse.hstack([__shape_matrix(t, fun), sparse.csr_matrix((m - 1, 2 * n))], format="csr")
+    c = np.concatenate([np.zeros(m), np.full(n, tau), np.full(n, 1 - tau)])
+    bounds = [(None, None)] * m + [(0, None)] * (2 * n)
+    result = linprog(c, A_ub=A_ub, b_ub=np.zeros(m - 1), A_eq=A_eq, b_eq=y,
+                     bounds=bounds, method="highs")
+    if result.status != 0:
+        raise Exception("The univariate quantile regression failed: {}".format(result.message))
+    return __hyperplanes(y, x, result.x[:m][group], fun)
+
+
+def __assert_univariate(y, x, fun, rts):
+    """Return y and the single input x as float arrays"""
+    if fun not in (FUN_PROD, FUN_COST) or rts not in (RTS_VRS, RTS_CRS):
+        raise ValueError("Undefined model parameters.")
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 2 and x.shape[1] == 1:
+        x = x[:, 0]
+    if x.ndim != 1:
+        raise ValueError("The univariate engine requires a single input.")
+    if rts == RTS_CRS and not np.all(x > 0):
+        raise ValueError("The univariate engine requires a positive input under RTS_CRS.")
+    return np.asarray(y, dtype=float).reshape(len(x)), x
+
+
+def __shape_matrix(t, fun):
+    """Return the rows A of the shape restriction A g <= 0 on the values g at sorted inputs t
+
+    The rows keep the slopes between neighboring inputs monotone, and the last (first)
+    slope nonnegative for the production (cost) function.
+    """
+    m = len(t)
+    # slope of each segment as a combination of g
+    width = 1 / np.diff(t)
+    slope = sparse.diags([-width, width], [0, 1], shape=(m - 1, m), format="csr")
+    if fun == FUN_PROD:
+        return sparse.vstack([slope[1:] - slope[:-1], -slope[-1:]], format="csr")
+    return sparse.vstack([-slope[:1], slope[:-1] - slope[1:]], format="csr")
+
+
+def __least_squares(y, x, w, fun, rts):
+    """Return the fitted values of the weighted least squares problem"""
+    if rts == RTS_CRS:
+        return max(np.sum(w * x * y) / np.sum(w * x * x), 0.0) * x
+
+    # observations with the same input share the fitted value
+    t, group = np.unique(x, return_inverse=True)
+    weight = np.bincount(group, weights=w)
+    target = np.bincount(group, weights=w * y) / weight
+
+    # the convex nondecreasing fit is the mirror image of a concave nondecreasing one
+    if fun == FUN_PROD:
+        return __concave_regression(t, target, weight)[group]
+    return -__concave_regression(-t[::-1], -target[::-1], weight[::-1])[::-1][group]
+
+
+def __concave_regression(t, v, w, max_iter=None):
+    """Weighted least squares projection of v onto concave nondecreasing functions of sorted t
+
+    A concave nondecreasing function is a constant plus a nonnegative combination of the
+    edges min(t - t_k, 0), k = 1, ..., m - 2, and t - t_0. The active edges are found by the
+    Lawson-Hanson active set method, so that each step only fits a piecewise linear function
+    with the knots at the active edges, which is a tridiagonal system.
+    """
+    m = len(t)
+    if m <= 2:
+        g = np.full(m, np.average(v, weights=w))
+        if m == 2 and v[1] > v[0]:
+            g = v.copy()
+        return g
+    if max_iter is None:
+        max_iter = 10 * m
+
+    scale = (t[-1] - t[0]) * np.sum(w * np.abs(v - np.average(v, weights=w)))
+    tol = 1e-10 * max(scale, np.finfo(float).tiny)
+
+    active = np.zeros(m - 1, dtype=bool)
+    g = np.full(m, np.average(v, weights=w))
+    for _ in range(max_iter):
+        # inner product of the weighted residual and each edge
+        r = w * (v - g)
+        below = np.concatenate(([0.0], np.cumsum(r)[:-1]))
+        below_t = np.concatenate(([0.0], np.cumsum(r * t)[:-1]))
+        gradient = np.append((below_t - t * below)[1:-1], np.sum(r * (t - t[0])))
+        gradient[active] = -np.inf
+        edge = np.argmax(gradient)
+        if gradient[edge] <= tol:
+            return g
+        active[edge] = True
+
+        while True:
+            fitted = __fit_knots(t, v, w, active)
+            new, old = __edges(t, fitted)[active], __edges(t, g)[active]
+            negative = new < 0
+            if not np.any(negative):
+                g = fitted
+                break
+            # move toward the new fit until an edge leaves, as in the Lawson-Hanson method
+            ratio = np.full(len(new), np.inf)
+            ratio[negative] = old[negative] / (old[negative] - new[negative])
+            step = np.min(ratio)
+            g = g + step * (fitted - g)
+            active[np.flatnonzero(active)[ratio <= step]] = False
+    raise Exception("The univariate regression did not converge.")
+
+
+def __edges(t, g):
+    """Return the coefficients of the edges of the piecewise linear function g"""
+    slope = np.diff(g) / np.diff(t)
+    return np.append(slope[:-1] - slope[1:], slope[-1])
+
+
+def __fit_knots(t, v, w, active):
+    """Fit a continuous piecewise linear function with the knots at the active edges
+
+    The function is flat after the last knot if the linear edge is not active.
+    """
+    m = len(t)
+    nodes = np.concatenate(([0], np.flatnonzero(active[:-1]) + 1, [m - 1]))
+    p = len(nodes)
+
+    # every input is in a segment between two nodes, and the hat functions of the nodes
+    # give a tridiagonal system
+    segment = np.minimum(np.searchsorted(nodes, np.arange(m), side="right") - 1, p - 2)
+    left, right = t[nodes[segment]], t[nodes[segment + 1]]
+    share = (t - left) / (right - left)
+    diagonal = np.bincount(segment, weights=w * (1 - share) ** 2, minlength=p) \
+        + np.bincount(segment + 1, weights=w * share ** 2, minlength=p)
+    offdiagonal = np.bincount(segment, weights=w * share * (1 - share), minlength=p - 1)
+    rhs = np.bincount(segment, weights=w * v * (1 - share), minlength=p) \
+        + np.bincount(segment + 1, weights=w * v * share, minlength=p)
+
+    if not active[-1]:
+        # merge the last two hat functions
+        diagonal[-2] += 2 * offdiagonal[-1] + diagonal[-1]
+        rhs[-2] += rhs[-1]
+        diagonal, offdiagonal, rhs = diagonal[:-1], offdiagonal[:-1], rhs[:-1]
+
+    if len(diagonal) == 1:
+        value = rhs / diagonal
+    else:
+        value = solveh_banded(np.vstack([np.append(0.0, offdiagonal), diagonal]), rhs)
+    if not active[-1]:
+        value = np.append(value, value[-1])
+    return np.interp(t, t[nodes], value)
+
+
+def __hyperplanes(y, x, fitted, fun):
+    """Return the supporting hyperplanes of the fitted function at each observation"""
+    t, index, group = np.unique(x, return_index=True, return_inverse=True)
+    g = fitted[index]
+    if len(t) == 1:
+        beta = np.zeros(1)
+    else:
+        slope = np.maximum(np.diff(g) / np.diff(t), 0.0)
+        # the right (left) slope is a supergradient (subgradient) of the concave (convex) function
+        if fun == FUN_PROD:
+            beta = np.append(slope, slope[-1])
+        else:
+            beta = np.insert(slope, 0, slope[0])
+    alpha = g - beta * t
+    return alpha[group], beta[group], y - g[group]
@@ -0,0 +1,75 @@
+# import dependencies
+import numpy as np
+from ..constant import FUN_PROD, FUN_COST, RTS_VRS, RTS_CRS
+
+
+def violated_constraints(alpha, beta, x, fun=FUN_PROD, rts=RTS_VRS, cuts=1, budget=None, block_size=None):
+    """Find the violated concavity (convexity) constraints of an estimated function
+
+    The violation of the constraint (i, h) is alpha_i + beta_i x_i - alpha_h - beta_h x_i for
+    the production function (the negative for the cost function). The violation matrix is
+    evaluated in row blocks so that the memory stays bounded for a large sample.
+
+    Args:
+        alpha (float): estimated intercepts, ignored with RTS_CRS.
+        beta (float): estimated slopes.
+        x (float): input variables.
+        fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
+        rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
+        cuts (int, optional): number of the most violated constraints selected for each observation. Defaults to 1.
+        budget (int, optional): maximal number of selected constraints in total, keeping the most violated. Defaults to None.
+        block_size (int, optional): number of rows evaluated at once. Defaults to about 2**22 entries per block.
+
+    Returns:
+        tuple: maximal violation, and the index arrays (i, h) of the selected violated constraints.
+    """
+    if cuts < 1 or (budget is not None and budget < 1):
+        raise ValueError("The cuts and the budget must select at least one constraint.")
+    x = np.asarray(x, dtype=float)
+    beta = np.asarray(beta, dtype=float).reshape(x.shape)
+    n = x.shape[0]
+
+    if fun == FUN_PROD:
+        sign = 1.0
+    elif fun == FUN_COST:
+        sign = -1.0
+    else:
+        raise ValueError("Undefined model parameters.")
+
+    # fitted value of each observation on its own hyperplane
+    own = np.sum(x * beta, axis=1)
+    if rts == RTS_VRS:
+        alpha = np.asarray(alpha, dtype=float).reshape(n)
+        own = own + alpha
+    elif rts != RTS_CRS:
+        raise ValueError("Undefined model parameters.")
+
+    if block_size is None:
+        block_size = max(1, 2 ** 22 // max(n, 1))
+    cuts = min(int(cuts), n)
+
+    maximum, rows, cols, values = 0.0, [], [], []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        violation = own[start:stop, None] - x[start:stop] @ beta.T
+        if rts == RTS_VRS:
+            violation -= alpha[None, :]
+        violation *= sign
+        violation[np.arange(stop - start), np.arange(start, stop)] = 0.0
+
+        # the most violated constraints of each observation, ties included
+        if cuts == 1:
+            threshold = violation.max(axis=1)
+        else:
+            threshold = -np.partition(-violation, cuts - 1, axis=1)[:, cuts - 1]
+        i, h = np.nonzero((violation >= threshold[:, None]) & (violation > 0))
+        rows.append(i + start)
+        cols.append(h)
+        values.append(violation[i, h])
+        maximum = max(maximum, violation.max())
+
+    rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+    if budget is not None and len(values) > budget:
+        keep = np.sort(np.argpartition(-values, budget - 1)[:budget])
+        rows, cols = rows[keep], cols[keep]
+    return maximum, rows, cols
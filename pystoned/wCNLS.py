@@ -1,7 +1,7 @@
 # import dependencies
-from pyomo.environ import Objective, minimize
+from pyomo.environ import Param, Objective, minimize
 from . import CNLS
-from .constant import CET_ADDI, FUN_PROD, RTS_VRS
+from .constant import CET_ADDI, FUN_PROD, RTS_VRS, BLD_RULE, OPT_DEFAULT, OPT_LOCAL
 from .utils import tools
 
 
@@ -22,8 +22,12 @@ class wCNLS(CNLS.CNLS):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
-        super().__init__(y, x, z, cet, fun, rts)
-        self.w = tools.trans_list(tools.to_1d_list(w))
+        super().__init__(y, x, z, cet, fun, rts, BLD_RULE)
+        self.w = tools.to_1d_array(w)
+        self.__model__.w = Param(self.__model__.I,
+                                 initialize=dict(enumerate(self.w.tolist())),
+                                 mutable=True,
+                                 doc='weight variable')
 
         self.__model__.objective.deactivate()
         self.__model__.weighted_objective = Objective(
@@ -31,6 +35,29 @@ class wCNLS(CNLS.CNLS):
 
     def __weighted_objective_rule(self):
         def weighted_objective_rule(model):
-            return sum(self.w[i] * model.epsilon[i] ** 2 for i in model.I)
+            return sum(model.w[i] * model.epsilon[i] ** 2 for i in model.I)
 
         return weighted_objective_rule
+
+    def refit(self, y=None, w=None, email=OPT_LOCAL, solver=OPT_DEFAULT):
+        """Optimize the model again for new values of the output and weight variables
+
+        Args:
+            y (float, optional): output variable, one value per DMU. Defaults to None, which keeps the outputs.
+            w (float, optional): weight variable, one value per DMU. Defaults to None, which keeps the weights.
+            email (string): The email address for remote optimization. It will optimize locally if OPT_LOCAL is given.
+            solver (string): The solver chosen for optimization. It will optimize with default solver if OPT_DEFAULT is given.
+        """
+        constraints = self._CNLS__update_outputs(y)
+        if w is not None:
+            self.__update_weights(w)
+        self._CNLS__resolve(constraints, w is not None, email, solver)
+
+    def __update_weights(self, w):
+        """Set the weight values"""
+        w = tools.to_1d_array(w)
+        if w.shape != self.w.shape:
+            raise ValueError(
+                "Number of DMUs must be the same in w and y.")
+        self.w = w
+        self.__model__.w.store_values(dict(enumerate(w.tolist())))
@@ -1,7 +1,7 @@
 # import dependencies
 from pyomo.environ import Objective, minimize
 from . import CQER
-from .constant import CET_ADDI, FUN_PROD, RTS_VRS
+from .constant import CET_ADDI, FUN_PROD, RTS_VRS, BLD_RULE
 from .utils import tools
 
 
@@ -23,8 +23,8 @@ class wCQR(CQER.CQR):
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
         # TODO(error/warning handling): Check the configuration of the model exist
-        super().__init__(y, x, tau, z, cet, fun, rts)
-        self.w = tools.trans_list(tools.to_1d_list(w))
+        super().__init__(y, x, tau, z, cet, fun, rts, BLD_RULE)
+        self.w = tools.to_1d_array(w)
 
         self.__model__.objective.deactivate()
         self.__model__.weighted_objective = Objective(
@@ -32,8 +32,8 @@ class wCQR(CQER.CQR):
 
     def __weighted_objective_rule(self):
         def weighted_objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
-                + (1 - self.tau) * \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] for i in model.I) \
+                + (1 - model.tau) * \
                 sum(self.w[i] * model.epsilon_minus[i] for i in model.I)
 
         return weighted_objective_rule
@@ -56,8 +56,8 @@ class wCER(CQER.CQR):
             fun (String, optional): FUN_PROD (production frontier) or FUN_COST (cost frontier). Defaults to FUN_PROD.
             rts (String, optional): RTS_VRS (variable returns to scale) or RTS_CRS (constant returns to scale). Defaults to RTS_VRS.
         """
-        super().__init__(y, x, tau, z, cet, fun, rts)
-        self.w = tools.trans_list(tools.to_1d_list(w))
+        super().__init__(y, x, tau, z, cet, fun, rts, BLD_RULE)
+        self.w = tools.to_1d_array(w)
 
         self.__model__.objective.deactivate()
         self.__model__.weighted_squared_objective = Objective(
@@ -65,8 +65,8 @@ class wCER(CQER.CQR):
 
     def __weighted_squared_objective_rule(self):
         def weighted_squared_objective_rule(model):
-            return self.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
-                + (1 - self.tau) * \
+            return model.tau * sum(self.w[i] * model.epsilon_plus[i] ** 2 for i in model.I) \
+                + (1 - model.tau) * \
                 sum(self.w[i] * model.epsilon_minus[i] ** 2 for i in model.I)
 
         return weighted_squared_objective_rule
@@ -1,8 +1,6 @@
 # import dependencies
 from pyomo.environ import ConcreteModel, Set, Var, Objective, minimize, Constraint, log
 from pyomo.core.expr.numvalue import NumericValue
-import numpy as np
-import pandas as pd
 
 from . import CNLS
 from .constant import CET_ADDI, CET_MULT, FUN_PROD, FUN_COST, OPT_DEFAULT, RTS_CRS, RTS_VRS, OPT_LOCAL
@@ -100,33 +98,33 @@ class weakCNLS(CNLS.CNLS):
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
                         return self.y[i] == model.alpha[i] \
-                            + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
-                            + sum(model.lamda[k] * self.z[i][k] for k in model.K) \
+                            + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
+                            + sum(model.lamda[k] * self.z[i, k] for k in model.K) \
                             + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
                     return self.y[i] == model.alpha[i] \
-                        + sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
+                        + sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
                         + model.epsilon[i]
 
                 return regression_rule
             elif self.rts == RTS_CRS:
                 if type(self.z) != type(None):
                     def regression_rule(model, i):
-                        return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                            + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
-                            + sum(model.lamda[k] * self.z[i][k]
+                        return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                            + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
+                            + sum(model.lamda[k] * self.z[i, k]
                                   for k in model.K) + model.epsilon[i]
 
                     return regression_rule
 
                 def regression_rule(model, i):
-                    return self.y[i] == sum(model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.delta[i, l] * self.b[i][l] for l in model.L) \
+                    return self.y[i] == sum(model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.delta[i, l] * self.b[i, l] for l in model.L) \
                         + model.epsilon[i]
 
                 return regression_rule
@@ -135,7 +133,7 @@ class weakCNLS(CNLS.CNLS):
             if type(self.z) != type(None):
                 def regression_rule(model, i):
                     return log(self.y[i]) == log(model.frontier[i] + 1) \
-                        + sum(model.lamda[k] * self.z[i][k]
+                        + sum(model.lamda[k] * self.z[i, k]
                               for k in model.K) + model.epsilon[i]
 
                 return regression_rule
@@ -154,8 +152,8 @@ class weakCNLS(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.frontier[i] == model.alpha[i] + sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.delta[i, l] * self.b[i][l]
+                        model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L) - 1
 
                 return log_rule
@@ -163,8 +161,8 @@ class weakCNLS(CNLS.CNLS):
 
                 def log_rule(model, i):
                     return model.frontier[i] == sum(
-                        model.beta[i, j] * self.x[i][j] for j in model.J) \
-                        + sum(model.delta[i, l] * self.b[i][l]
+                        model.beta[i, j] * self.x[i, j] for j in model.J) \
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L) - 1
 
                 return log_rule
@@ -186,12 +184,12 @@ class weakCNLS(CNLS.CNLS):
                         return Constraint.Skip
                     return __operator(
                         model.alpha[i] + sum(model.beta[i, j]
-                                             * self.x[i][j] for j in model.J)
-                        + sum(model.delta[i, l] * self.b[i][l]
+                                             * self.x[i, j] for j in model.J)
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L),
                         model.alpha[h] + sum(model.beta[h, j]
-                                             * self.x[i][j] for j in model.J)
-                        + sum(model.delta[h, l] * self.b[i][l] for l in model.L))
+                                             * self.x[i, j] for j in model.J)
+                        + sum(model.delta[h, l] * self.b[i, l] for l in model.L))
 
                 return afriat_rule
             elif self.rts == RTS_CRS:
@@ -200,11 +198,11 @@ class weakCNLS(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J)
-                        + sum(model.delta[i, l] * self.b[i][l]
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J)
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L),
-                        sum(model.beta[h, j] * self.x[i][j] for j in model.J)
-                        + sum(model.delta[h, l] * self.b[i][l] for l in model.L))
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J)
+                        + sum(model.delta[h, l] * self.b[i, l] for l in model.L))
 
                 return afriat_rule
         elif self.cet == CET_MULT:
@@ -215,12 +213,12 @@ class weakCNLS(CNLS.CNLS):
                         return Constraint.Skip
                     return __operator(
                         model.alpha[i] + sum(model.beta[i, j]
-                                             * self.x[i][j] for j in model.J)
-                        + sum(model.delta[i, l] * self.b[i][l]
+                                             * self.x[i, j] for j in model.J)
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L),
                         model.alpha[h] + sum(model.beta[h, j]
-                                             * self.x[i][j] for j in model.J)
-                        + sum(model.delta[h, l] * self.b[i][l] for l in model.L))
+                                             * self.x[i, j] for j in model.J)
+                        + sum(model.delta[h, l] * self.b[i, l] for l in model.L))
 
                 return afriat_rule
             elif self.rts == RTS_CRS:
@@ -229,11 +227,11 @@ class weakCNLS(CNLS.CNLS):
                     if i == h:
                         return Constraint.Skip
                     return __operator(
-                        sum(model.beta[i, j] * self.x[i][j] for j in model.J)
-                        + sum(model.delta[i, l] * self.b[i][l]
+                        sum(model.beta[i, j] * self.x[i, j] for j in model.J)
+                        + sum(model.delta[i, l] * self.b[i, l]
                               for l in model.L),
-                        sum(model.beta[h, j] * self.x[i][j] for j in model.J)
-                        + sum(model.delta[h, l] * self.b[i][l] for l in model.L))
+                        sum(model.beta[h, j] * self.x[i, j] for j in model.J)
+                        + sum(model.delta[h, l] * self.b[i, l] for l in model.L))
 
                 return afriat_rule
 
@@ -244,7 +242,7 @@ class weakCNLS(CNLS.CNLS):
         def disposability_rule(model, i, h):
             if i == h:
                 return Constraint.Skip
-            return model.alpha[i] + sum(model.beta[i, j] * self.x[h][j] for j in model.J) >= 0
+            return model.alpha[i] + sum(model.beta[i, j] * self.x[h, j] for j in model.J) >= 0
 
         return disposability_rule
 
@@ -258,8 +256,4 @@ class weakCNLS(CNLS.CNLS):
         """Return delta value by array"""
         tools.assert_optimized(self.optimization_status)
         tools.assert_undesirable_output(self.b)
-        delta = np.asarray([i + tuple([j]) for i, j in zip(list(self.__model__.delta),
-                                                           list(self.__model__.delta[:, :].value))])
-        delta = pd.DataFrame(delta, columns=['Name', 'Key', 'Value'])
-        delta = delta.pivot(index='Name', columns='Key', values='Value')
-        return delta.to_numpy()
+        return tools.get_values(self.__model__.delta)